@@ -0,0 +1,51 @@
+"""
+Microbenchmark comparing the lookup based short/long tag converter against the original segment by segment one.
+
+Functions Demonstrated:
+HedSchema._convert_to_canonical_tag - Converts a tag to long form using the precomputed path lookup.
+convert_to_canonical_tag_reference - The original converter, kept as a reference implementation.
+"""
+
+import functools
+import os
+import timeit
+
+from hed import schema
+from hed.schema.tag_conversion_reference import convert_to_canonical_tag_reference
+
+
+def get_test_tags(hed_schema):
+    test_tags = []
+    for long_tag in hed_schema.get_all_tags():
+        split_tag = long_tag.split("/")
+        test_tags.append(split_tag[-1])
+        test_tags.append(long_tag)
+        test_tags.append(split_tag[-1] + "/Extension value")
+        test_tags.append("Invalid/" + split_tag[-1])
+    return test_tags
+
+
+def run_benchmark(hed_schema, test_tags, number=5):
+    def convert_tags(convert_function):
+        for tag in test_tags:
+            convert_function(tag)
+
+    reference_function = functools.partial(convert_to_canonical_tag_reference, hed_schema)
+    legacy_time = timeit.timeit(lambda: convert_tags(reference_function), number=number)
+    lookup_time = timeit.timeit(lambda: convert_tags(hed_schema._convert_to_canonical_tag), number=number)
+    return legacy_time, lookup_time
+
+
+if __name__ == '__main__':
+    data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../tests/data')
+    schema_files = ['HED8.0.0-alpha.1.mediawiki', 'HED8.0.0-alpha.2.mediawiki']
+
+    for schema_file in schema_files:
+        hed_schema = schema.load_schema(os.path.join(data_dir, schema_file))
+        test_tags = get_test_tags(hed_schema)
+        for tag in test_tags:
+            if hed_schema._convert_to_canonical_tag(tag) != convert_to_canonical_tag_reference(hed_schema, tag):
+                print(f"Converters disagree on '{tag}'")
+        legacy_time, lookup_time = run_benchmark(hed_schema, test_tags)
+        print(f"{schema_file}: {len(test_tags)} tags x 5 - legacy {legacy_time:.3f}s, "
+              f"lookup {lookup_time:.3f}s, speedup {legacy_time / lookup_time:.2f}x")
@@ -4,12 +4,16 @@ unit class attributes in a dictionary.
 
 The dictionary is a dictionary of dictionaries. The dictionary names are the list in HedKey from hed_schema_constants.
 """
+from hashlib import sha1
+
 from hed.schema.hed_schema_constants import HedKey, ATTRIBUTE_PROPERTIES
 from hed.util import file_util, error_reporter
 from hed.util.error_types import SchemaErrors
 from hed.schema.schema2xml import HedSchema2XML
 from hed.schema.schema2wiki import HedSchema2Wiki
 from hed.schema import schema_compliance
+from hed.schema.unit_matcher import UnitMatcher
+from hed.schema.hed_tag_entry import HedTagEntry
 
 
 class HedSchema:
@@ -28,6 +32,14 @@ class HedSchema:
         self.header_attributes = {}
         self._filename = None
         self.dictionaries = self._create_empty_dictionaries()
+        self._tag_path_lookup = {}
+        # HedTagEntry by lower case tag
+        self._tag_entries = {}
+        # Unit matchers by lower case takes value tag, and by the tuple of units they match.
+        self._unit_class_matchers = {}
+        self._unit_matchers = {}
+        # Hash of the schema contents, calculated when first requested.
+        self._fingerprint = None
         self.prologue = ""
         self.epilogue = ""
 
@@ -89,6 +101,19 @@ class HedSchema:
         local_wiki_file = file_util.write_strings_to_file(output_strings, ".mediawiki")
         return local_wiki_file
 
+    def get_fingerprint(self):
+        """
+        Return a hash of the schema contents, so results computed with this schema can be matched to it later.
+
+        Returns
+        -------
+        fingerprint: str
+            The sha1 of the schema as an xml string.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = sha1(self.get_as_xml_string().encode('utf-8')).hexdigest()
+        return self._fingerprint
+
     @property
     def filename(self):
         return self._filename
@@ -316,9 +341,149 @@ class HedSchema:
             return True
         return False
 
+    def get_tag_entry(self, formatted_tag):
+        """Returns the precomputed attributes of a tag.
+
+        Parameters
+        ----------
+        formatted_tag: str
+            The lower case long form of the tag.
+        Returns
+        -------
+        tag_entry: HedTagEntry or None
+            The entry for the tag, or None if the tag isn't in the schema.
+        """
+        return self._tag_entries.get(formatted_tag)
+
+    def get_takes_value_entry(self, formatted_tag):
+        """Returns the entry of the /# tag that would hold the value of formatted_tag, if it's a value.
+
+            eg 'event/duration/3 ms' returns the entry for 'event/duration/#'
+
+        Parameters
+        ----------
+        formatted_tag: str
+            The lower case long form of the tag, with its value.
+        Returns
+        -------
+        tag_entry: HedTagEntry or None
+            The entry of the takes value tag, or None if the parent tag has no /# child.
+        """
+        last_slash_index = formatted_tag.rfind('/')
+        if last_slash_index == -1:
+            return self._tag_entries.get('#')
+        parent_entry = self._tag_entries.get(formatted_tag[:last_slash_index])
+        if parent_entry is None:
+            return None
+        return parent_entry.takes_value_entry
+
+    def get_unit_class_matcher(self, unit_class_tag):
+        """Returns the unit matcher for a takes value tag with unit classes.
+
+        Parameters
+        ----------
+        unit_class_tag: str
+            The lower case takes value tag, ending in /#.
+        Returns
+        -------
+        unit_matcher: UnitMatcher or None
+            The matcher for the units of all the tag's unit classes, or None if the tag has no unit classes.
+        """
+        unit_matcher = self._unit_class_matchers.get(unit_class_tag)
+        if unit_matcher is None:
+            unit_class_string = self.dictionaries.get(HedKey.UnitClass, {}).get(unit_class_tag)
+            if unit_class_string is None:
+                return None
+            unit_classes = unit_class_string.split(',')
+            all_units = self.dictionaries.get(HedKey.Units, {})
+            units = []
+            for unit_class in unit_classes:
+                units += all_units.get(unit_class, [])
+            units_key = tuple(units)
+            unit_matcher = self._unit_matchers.get(units_key)
+            if unit_matcher is None or unit_matcher.unit_classes != unit_classes:
+                unit_matcher = UnitMatcher(self, units, unit_classes)
+                self._unit_matchers.setdefault(units_key, unit_matcher)
+            self._unit_class_matchers[unit_class_tag] = unit_matcher
+        return unit_matcher
+
+    def get_unit_matcher(self, units):
+        """Returns the unit matcher for a list of units, compiling it the first time those units are used.
+
+        Parameters
+        ----------
+        units: [str]
+            The valid units.
+        Returns
+        -------
+        unit_matcher: UnitMatcher
+            The matcher for the units.
+        """
+        units_key = tuple(units)
+        unit_matcher = self._unit_matchers.get(units_key)
+        if unit_matcher is None:
+            unit_matcher = UnitMatcher(self, units)
+            self._unit_matchers[units_key] = unit_matcher
+        return unit_matcher
+
     def finalize_dictionaries(self):
         self._propagate_extension_allowed()
         self._populate_short_tag_dict()
+        self._populate_tag_path_lookup()
+        self._populate_unit_class_matchers()
+        self._populate_tag_entries()
+
+    def get_compiled_dict(self):
+        """Returns the contents of a finalized schema and its precomputed indexes, for saving as JSON.
+
+        Returns
+        -------
+        compiled_dict: {}
+            Contains only dictionaries, lists, strings and bools.  See from_compiled_dict.
+        """
+        return {'header_attributes': self.header_attributes,
+                'prologue': self.prologue,
+                'epilogue': self.epilogue,
+                'no_duplicate_tags': self.no_duplicate_tags,
+                'dictionaries': self.dictionaries,
+                'tag_path_lookup': self._tag_path_lookup}
+
+    @staticmethod
+    def from_compiled_dict(compiled_dict):
+        """Creates a finalized schema from the result of get_compiled_dict.
+
+            The lookups that hold objects, such as the tag entries and unit matchers, are rebuilt.
+
+        Parameters
+        ----------
+        compiled_dict: {}
+            The result of get_compiled_dict, after a round trip through JSON.
+        Returns
+        -------
+        hed_schema: HedSchema
+            The schema.
+        Raises
+        ------
+        KeyError or TypeError
+            If compiled_dict is missing any of the contents, or they have the wrong types.
+        """
+        dictionaries = compiled_dict['dictionaries']
+        tag_path_lookup = compiled_dict['tag_path_lookup']
+        header_attributes = compiled_dict['header_attributes']
+        if not all(isinstance(value, dict) for value in (dictionaries, tag_path_lookup, header_attributes)) \
+                or not all(isinstance(value, dict) for value in dictionaries.values()):
+            raise TypeError("Compiled schema contents must be dictionaries")
+
+        hed_schema = HedSchema()
+        hed_schema.header_attributes = header_attributes
+        hed_schema.prologue = str(compiled_dict['prologue'])
+        hed_schema.epilogue = str(compiled_dict['epilogue'])
+        hed_schema.no_duplicate_tags = bool(compiled_dict['no_duplicate_tags'])
+        hed_schema.dictionaries = dictionaries
+        hed_schema._tag_path_lookup = tag_path_lookup
+        hed_schema._populate_unit_class_matchers()
+        hed_schema._populate_tag_entries()
+        return hed_schema
 
     def dupe_tag_iter(self, return_detailed_info=False):
         """
@@ -459,11 +624,93 @@ class HedSchema:
                 new_short_tag_dict[short_clean_tag].append(new_tag_entry)
         self.dictionaries[HedKey.ShortTags] = new_short_tag_dict
 
+    def _populate_tag_path_lookup(self):
+        """
+        Create a mapping from every partial path of each tag to the long version of the tag.
+
+            eg 'Event/Sensory event' adds 'sensory event' and 'event/sensory event'.
+            Takes value tags are skipped, as the value is always treated as an extension.
+
+        Returns
+        -------
+        """
+        tag_path_lookup = {}
+        for tag, unformatted_tag in self.dictionaries[HedKey.AllTags].items():
+            if tag.endswith("/#"):
+                continue
+            slash_index = len(tag)
+            while slash_index != -1:
+                slash_index = tag.rfind("/", 0, slash_index)
+                tag_path_lookup[tag[slash_index + 1:]] = unformatted_tag
+        self._tag_path_lookup = tag_path_lookup
+
+    def _populate_unit_class_matchers(self):
+        """
+        Compile the unit matcher for every takes value tag with unit classes.
+
+        Returns
+        -------
+        """
+        self._unit_class_matchers = {}
+        self._unit_matchers = {}
+        if self.has_unit_classes and HedKey.UnitClass in self.dictionaries:
+            for unit_class_tag in self.dictionaries[HedKey.UnitClass]:
+                self.get_unit_class_matcher(unit_class_tag)
+
+    def _populate_tag_entries(self):
+        """
+        Create a HedTagEntry for every tag, link each tag to its takes value child, and mark the tags that
+        have an ancestor allowing extension.
+
+        Returns
+        -------
+        """
+        tag_entries = {}
+        all_tags = self.dictionaries[HedKey.AllTags]
+        flag_attributes = {
+            'takes_value': HedKey.TakesValue,
+            'require_child': HedKey.RequireChild,
+            'unique': HedKey.Unique,
+            'required': HedKey.RequiredPrefix,
+            'extension_allowed': HedKey.ExtensionAllowedPropagated,
+            'has_unit_class': HedKey.UnitClass,
+        }
+        attribute_dicts = [self.dictionaries.get(attribute, {}) for attribute in flag_attributes.values()]
+        for tag_dict in [all_tags] + attribute_dicts:
+            for tag in tag_dict:
+                if tag not in tag_entries:
+                    tag_entries[tag] = HedTagEntry(all_tags.get(tag, ""))
+
+        for flag_name, attribute_dict in zip(flag_attributes, attribute_dicts):
+            for tag, value in attribute_dict.items():
+                if value:
+                    setattr(tag_entries[tag], flag_name, True)
+
+        for tag, tag_entry in list(tag_entries.items()):
+            if tag_entry.has_unit_class:
+                tag_entry.unit_matcher = self.get_unit_class_matcher(tag)
+                tag_entry.unit_classes = tag_entry.unit_matcher.unit_classes
+            if tag.endswith("/#"):
+                parent_tag = tag[:-2]
+                if parent_tag not in tag_entries:
+                    tag_entries[parent_tag] = HedTagEntry("")
+                tag_entries[parent_tag].takes_value_entry = tag_entry
+
+        for tag, tag_entry in tag_entries.items():
+            slash_index = len(tag)
+            while slash_index > 0:
+                ancestor_entry = tag_entries.get(tag[:slash_index])
+                if ancestor_entry is not None and ancestor_entry.extension_allowed:
+                    tag_entry.extension_allowed_ancestor = True
+                    break
+                slash_index = tag.rfind("/", 0, slash_index)
+        self._tag_entries = tag_entries
+
     def _convert_to_canonical_tag(self, hed_tag, error_handler=None):
         """
         This takes a hed tag(short or long form) and converts it to the long form
         Works left to right.(mostly relevant for errors)
-        Note: This only does minimal validation
+        Note: This only does minimal validation, and requires a hed3 compatible schema(see short_tag_mapping)
 
         eg 'Event'                    - Returns ('Event', None)
            'Sensory event'            - Returns ('Event/Sensory event', None)
@@ -493,60 +740,64 @@ class HedSchema:
         if error_handler is None:
             error_handler = error_reporter.ErrorHandler()
 
-        clean_tag = hed_tag.lower()
-        split_tags = clean_tag.split("/")
+        short_tag_mapping = self.short_tag_mapping
+        org_tag = str(hed_tag)
+        clean_tag = org_tag.lower()
+        clean_tag_len = len(clean_tag)
+        tag_path_lookup = self._tag_path_lookup
 
-        index_end = 0
-        found_unknown_extension = False
-        found_index_end = 0
+        found_long_org_tag = tag_path_lookup.get(clean_tag)
+        if found_long_org_tag is not None:
+            return found_long_org_tag, clean_tag.rfind("/") + 1 + len(found_long_org_tag) - len(org_tag), []
+
+        # Resolve the known portion of the tag left to right.  Each prefix that is a path in the schema is a single
+        # lookup, only falling back to checking the segment by itself when the prefix isn't a full path.
         found_index_start = 0
-        found_long_org_tag = None
-        # Iterate over tags left to right keeping track of current index
-        for tag in split_tags:
-            tag_len = len(tag)
-            # Skip slashes
-            if index_end != 0:
-                index_end += 1
-            index_start = index_end
-            index_end += tag_len
-
-            # If we already found an unknown tag, it's implicitly an extension.  No known tags can follow it.
-            if not found_unknown_extension:
-                if tag not in self.short_tag_mapping:
-                    found_unknown_extension = True
-                    if not found_long_org_tag:
-                        error = error_handler.format_schema_error(SchemaErrors.NO_VALID_TAG_FOUND, hed_tag,
-                                                                  index_start, index_end)
-                        return str(hed_tag), None, error
-                    continue
-
-                long_org_tag = self.short_tag_mapping[tag]
-                tag_string = long_org_tag.lower()
-                main_hed_portion = clean_tag[:index_end]
-
-                # Verify the tag has the correct path above it.
-                if not tag_string.endswith(main_hed_portion):
+        found_index_end = 0
+        index_start = 0
+        index_end = 0
+        while index_start <= clean_tag_len:
+            index_end = clean_tag.find("/", index_start)
+            if index_end == -1:
+                index_end = clean_tag_len
+            long_org_tag = tag_path_lookup.get(clean_tag[:index_end])
+            if long_org_tag is None:
+                long_org_tag = short_tag_mapping.get(clean_tag[index_start:index_end])
+                if long_org_tag is None:
+                    break
+                if not long_org_tag.lower().endswith(clean_tag[:index_end]):
                     error = error_handler.format_schema_error(SchemaErrors.INVALID_PARENT_NODE, hed_tag,
                                                               index_start, index_end,
                                                               long_org_tag)
-                    return str(hed_tag), None, error
-                found_index_start = index_start
-                found_index_end = index_end
-                found_long_org_tag = long_org_tag
-            else:
-                # These means we found a known tag in the remainder/extension section, which is an error
-                if tag in self.short_tag_mapping:
-                    error = error_handler.format_schema_error(SchemaErrors.INVALID_PARENT_NODE, hed_tag,
-                                                              index_start, index_end,
-                                                              self.short_tag_mapping[tag])
-                    return str(hed_tag), None, error
-
-        remainder = str(hed_tag)[found_index_end:]
-
-        long_tag_string = found_long_org_tag + remainder
+                    return org_tag, None, error
+            found_index_start = index_start
+            found_index_end = index_end
+            found_long_org_tag = long_org_tag
+            index_start = index_end + 1
+
+        if found_long_org_tag is None:
+            error = error_handler.format_schema_error(SchemaErrors.NO_VALID_TAG_FOUND, hed_tag,
+                                                      index_start, index_end)
+            return org_tag, None, error
+
+        # Anything after the first unknown segment is an extension, and cannot contain known tags.
+        index_start = index_end + 1
+        while index_start <= clean_tag_len:
+            index_end = clean_tag.find("/", index_start)
+            if index_end == -1:
+                index_end = clean_tag_len
+            long_org_tag = short_tag_mapping.get(clean_tag[index_start:index_end])
+            if long_org_tag is not None:
+                error = error_handler.format_schema_error(SchemaErrors.INVALID_PARENT_NODE, hed_tag,
+                                                          index_start, index_end,
+                                                          long_org_tag)
+                return org_tag, None, error
+            index_start = index_end + 1
+
+        long_tag_string = found_long_org_tag + org_tag[found_index_end:]
 
         # calculate short_tag index into long tag.
-        found_index_start += (len(long_tag_string) - len(str(hed_tag)))
+        found_index_start += (len(long_tag_string) - len(org_tag))
         return long_tag_string, found_index_start, []
 
     def _get_attributes_for_class(self, key_class):
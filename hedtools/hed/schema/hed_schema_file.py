@@ -2,16 +2,40 @@ from hed.schema.xml2schema import HedSchemaXMLParser
 from hed.schema.wiki2schema import HedSchemaWikiParser
 from hed.util.exceptions import HedFileError, HedExceptions
 from hed.schema import hed_schema_constants
-from hed.util import file_util
+from hed.util import file_util, hed_cache
 
 
-def load_schema(hed_file_path):
+def load_schema(hed_file_path, use_compiled_cache=None):
+    """Loads a schema from an .xml or .mediawiki file.
+
+    Parameters
+    ----------
+    hed_file_path: str
+        The schema file to load.
+    use_compiled_cache: bool or None
+        If True, xml schemas are loaded from a compiled copy in the hed cache directory when one matches the
+        file contents, and the compiled copy is created or rebuilt otherwise.
+        If None, this is only done for xml files located in the hed cache directory.
+    Returns
+    -------
+    hed_schema: HedSchema
+        The loaded schema.
+    """
     if not hed_file_path:
         raise HedFileError(HedExceptions.FILE_NOT_FOUND, "Empty file path passed to HedSchema.load_file",
                            filename=hed_file_path)
 
     if hed_file_path.lower().endswith(".xml"):
+        if use_compiled_cache is None:
+            use_compiled_cache = hed_cache.is_in_cache_directory(hed_file_path)
+        if use_compiled_cache:
+            hed_schema = hed_cache.load_compiled_schema(hed_file_path)
+            if hed_schema is not None:
+                hed_schema._filename = hed_file_path
+                return hed_schema
         hed_schema = HedSchemaXMLParser.load_xml(hed_file_path)
+        if use_compiled_cache and not hed_schema.issues:
+            hed_cache.save_compiled_schema(hed_schema, hed_file_path)
         return hed_schema
     elif hed_file_path.lower().endswith(".mediawiki"):
         hed_schema = HedSchemaWikiParser.load_wiki(hed_file_path)
@@ -0,0 +1,34 @@
+"""
+This module contains the HedTagEntry class, the precomputed attributes of a single tag in a HedSchema.
+"""
+
+
+class HedTagEntry:
+    """The attributes of one schema tag, flattened out of the schema dictionaries so validators need one lookup."""
+    __slots__ = ('long_tag', 'takes_value', 'require_child', 'unique', 'required', 'extension_allowed',
+                 'extension_allowed_ancestor', 'has_unit_class', 'unit_classes', 'unit_matcher', 'takes_value_entry')
+
+    def __init__(self, long_tag):
+        """Constructor for the HedTagEntry class.
+
+        Parameters
+        ----------
+        long_tag: str
+            The long form of the tag, as written in the schema.  Empty if the tag is only in attribute dictionaries.
+        """
+        self.long_tag = long_tag
+        self.takes_value = False
+        self.require_child = False
+        self.unique = False
+        self.required = False
+        # True if this tag or an ancestor has the extensionAllowed attribute.
+        self.extension_allowed = False
+        # True if this tag or any tag above it has extensionAllowedPropagated, so an unknown child is an extension.
+        self.extension_allowed_ancestor = False
+        self.has_unit_class = False
+        # The unit classes from the unitClass attribute, in order.
+        self.unit_classes = []
+        # The UnitMatcher for the units of all the unit classes.
+        self.unit_matcher = None
+        # The entry of this tag's /# child, if it has one.
+        self.takes_value_entry = None
@@ -0,0 +1,89 @@
+"""
+This module contains the original segment by segment short to long tag converter.
+
+HedSchema._convert_to_canonical_tag replaced it with a precomputed path lookup.  It is kept as a reference to test and
+benchmark that version against.
+"""
+from hed.util.error_reporter import ErrorHandler
+from hed.util.error_types import SchemaErrors
+
+
+def convert_to_canonical_tag_reference(hed_schema, hed_tag, error_handler=None):
+    """
+    Converts a hed tag to long form, like HedSchema._convert_to_canonical_tag does.
+
+    Parameters
+    ----------
+    hed_schema: HedSchema
+        A hed3 compatible schema to convert with.
+    hed_tag: str or HedTag
+        A single hed tag(long or short)
+    error_handler: ErrorHandler or None
+        Used to format the conversion errors.
+    Returns
+    -------
+    long_tag: str
+        The converted long tag
+    short_tag_index: int
+        The position the short tag starts at in long_tag
+    errors: list
+        a list of errors while converting
+    """
+    if error_handler is None:
+        error_handler = ErrorHandler()
+
+    clean_tag = hed_tag.lower()
+    split_tags = clean_tag.split("/")
+
+    index_end = 0
+    found_unknown_extension = False
+    found_index_end = 0
+    found_index_start = 0
+    found_long_org_tag = None
+    # Iterate over tags left to right keeping track of current index
+    for tag in split_tags:
+        tag_len = len(tag)
+        # Skip slashes
+        if index_end != 0:
+            index_end += 1
+        index_start = index_end
+        index_end += tag_len
+
+        # If we already found an unknown tag, it's implicitly an extension.  No known tags can follow it.
+        if not found_unknown_extension:
+            if tag not in hed_schema.short_tag_mapping:
+                found_unknown_extension = True
+                if not found_long_org_tag:
+                    error = error_handler.format_schema_error(SchemaErrors.NO_VALID_TAG_FOUND, hed_tag,
+                                                              index_start, index_end)
+                    return str(hed_tag), None, error
+                continue
+
+            long_org_tag = hed_schema.short_tag_mapping[tag]
+            tag_string = long_org_tag.lower()
+            main_hed_portion = clean_tag[:index_end]
+
+            # Verify the tag has the correct path above it.
+            if not tag_string.endswith(main_hed_portion):
+                error = error_handler.format_schema_error(SchemaErrors.INVALID_PARENT_NODE, hed_tag,
+                                                          index_start, index_end,
+                                                          long_org_tag)
+                return str(hed_tag), None, error
+            found_index_start = index_start
+            found_index_end = index_end
+            found_long_org_tag = long_org_tag
+        else:
+            # These means we found a known tag in the remainder/extension section, which is an error
+            if tag in hed_schema.short_tag_mapping:
+                error = error_handler.format_schema_error(SchemaErrors.INVALID_PARENT_NODE, hed_tag,
+                                                          index_start, index_end,
+                                                          hed_schema.short_tag_mapping[tag])
+                return str(hed_tag), None, error
+
+    remainder = str(hed_tag)[found_index_end:]
+
+    long_tag_string = found_long_org_tag + remainder
+
+    # calculate short_tag index into long tag.
+    found_index_start += (len(long_tag_string) - len(str(hed_tag)))
+    return long_tag_string, found_index_start, []
@@ -0,0 +1,109 @@
+"""
+This module compiles the units of one or more unit classes into a matcher that finds and strips the unit from a value.
+"""
+import inflect
+
+from hed.schema.hed_schema_constants import HedKey
+
+pluralize = inflect.engine()
+pluralize.defnoun("hertz", "hertz")
+
+
+class UnitMatcher:
+    """The units of a tag's unit classes, with their plurals and SI modifiers precomputed from the schema."""
+
+    def __init__(self, hed_schema, units, unit_classes=None):
+        """Constructor for the UnitMatcher class.
+
+        Parameters
+        ----------
+        hed_schema: HedSchema
+            The schema the units and SI modifiers come from.
+        units: [str]
+            The valid units, in the order they appear in their unit classes.
+        unit_classes: [str]
+            The unit classes the units came from, if known.
+        """
+        self.units = list(units)
+        self.unit_classes = list(unit_classes) if unit_classes is not None else []
+        self._has_unit_modifiers = hed_schema.has_unit_modifiers
+
+        # Each unit and plural maps to its priority, lowest first.  Longer units are tried first so a unit that
+        # ends with a shorter one(eg a symbol) is matched as a whole.
+        # Unit symbols are case sensitive and matched against the original value, other units against the lower case.
+        self._symbol_units = {}
+        self._word_units = {}
+        unit_symbols = hed_schema.dictionaries[HedKey.UnitSymbol] if self._has_unit_modifiers else {}
+        priority = 0
+        for unit in sorted(self.units, key=len, reverse=True):
+            derivative_units = [unit]
+            if self._has_unit_modifiers and unit_symbols.get(unit) is None:
+                derivative_units.append(pluralize.plural(unit))
+            if self._has_unit_modifiers and unit_symbols.get(unit):
+                unit_dict = self._symbol_units
+            else:
+                unit_dict = self._word_units
+            for derivative_unit in derivative_units:
+                unit_dict.setdefault(derivative_unit, priority)
+                priority += 1
+        self._symbol_unit_lengths = sorted({len(unit) for unit in self._symbol_units})
+        self._word_unit_lengths = sorted({len(unit) for unit in self._word_units})
+
+        self._symbol_modifiers = ()
+        self._word_modifiers = ()
+        if self._has_unit_modifiers:
+            self._symbol_modifiers = tuple(hed_schema.dictionaries.get(HedKey.SIUnitSymbolModifier, ()))
+            self._word_modifiers = tuple(hed_schema.dictionaries.get(HedKey.SIUnitModifier, ()))
+
+    def strip_unit(self, original_value, formatted_value):
+        """Finds the unit at the start or end of a value, and removes it along with any SI unit modifiers.
+
+        Parameters
+        ----------
+        original_value: str
+            The value as it was written.  Unit symbols are matched against this.
+        formatted_value: str
+            The lower case value.  Other units are matched against this.
+        Returns
+        -------
+        stripped_value: str
+            The value with the unit and modifiers removed, or formatted_value if no valid unit was found.
+        """
+        best_priority = None
+        best_unit = None
+        best_value = None
+        best_is_symbol = False
+        for is_symbol, unit_lengths, unit_dict, value in \
+                ((True, self._symbol_unit_lengths, self._symbol_units, original_value),
+                 (False, self._word_unit_lengths, self._word_units, formatted_value)):
+            value_length = len(value)
+            for unit_length in unit_lengths:
+                if unit_length > value_length:
+                    break
+                for possible_unit in (value[:unit_length], value[value_length - unit_length:]):
+                    priority = unit_dict.get(possible_unit)
+                    if priority is not None and (best_priority is None or priority < best_priority):
+                        best_priority = priority
+                        best_unit = possible_unit
+                        best_value = value
+                        best_is_symbol = is_symbol
+
+        if best_unit is None:
+            return formatted_value
+
+        if best_value.startswith(best_unit):
+            stripped_value = best_value[len(best_unit):].strip()
+        else:
+            stripped_value = best_value[:len(best_value) - len(best_unit)].strip()
+
+        if self._has_unit_modifiers:
+            if best_is_symbol:
+                unit_modifiers = self._symbol_modifiers
+            else:
+                unit_modifiers = self._word_modifiers
+            for unit_modifier in unit_modifiers:
+                if stripped_value.startswith(unit_modifier):
+                    stripped_value = stripped_value[len(unit_modifier):].strip()
+                elif stripped_value.endswith(unit_modifier):
+                    stripped_value = stripped_value[0:-len(unit_modifier)].strip()
+        return stripped_value
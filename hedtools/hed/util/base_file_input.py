@@ -4,10 +4,11 @@ import pandas
 import copy
 import io
 
-from hed.util.def_dict import DefDict
+from hed.util.def_dict import DefDict, DefTagNames
+from hed.util.hed_string import HedString
 from hed.util.column_mapper import ColumnMapper
 from hed.util.exceptions import HedFileError, HedExceptions
-from hed.util.error_types import ErrorContext
+from hed.util.error_types import ErrorContext, ValidationErrors
 from hed.util.error_reporter import ErrorHandler
 from hed.util import util_constants
 
@@ -23,7 +24,7 @@ class BaseFileInput:
     COMMA_DELIMITER = ','
 
     def __init__(self, filename=None, worksheet_name=None, has_column_names=True, mapper=None,
-                 csv_string=None):
+                 csv_string=None, stream_chunk_size=None, defer_definitions=False):
         """Constructor for the BaseFileInput class.
 
          Parameters
@@ -40,6 +41,13 @@ class BaseFileInput:
              retrieve all columns as hed tags.
          csv_string: str or None
             The data to treat as this file.  eg web services passing a string.
+         stream_chunk_size: int or None
+            If present, the file is not loaded into memory.  Instead each pass over the rows reads it again
+            this many rows at a time, and all cells are read as text.  Only applies to text files.
+            Files opened this way cannot be modified or saved.
+         defer_definitions: bool
+            If True, the definitions in the file are gathered during the first pass over its rows, rather than by
+            reading the whole file up front.  file_def_dict and file_def_dict_issues are complete after that pass.
          """
         if mapper is None:
             mapper = ColumnMapper()
@@ -47,36 +55,47 @@ class BaseFileInput:
         self._filename = filename
         self._worksheet_name = worksheet_name
         self._has_column_names = has_column_names
-        pandas_header = 0
+        self._pandas_header = 0
         if not self._has_column_names:
-            pandas_header = None
+            self._pandas_header = None
+        self._csv_string = csv_string
+        self._stream_chunk_size = stream_chunk_size
 
         self._dataframe = None
         if not filename and not csv_string:
             raise HedFileError(HedExceptions.FILE_NOT_FOUND, "Filename specified and no string data passed in", filename)
 
         if csv_string or self.is_text_file():
-            csv_filename_or_data = filename
-            if csv_string:
-                csv_filename_or_data = io.StringIO(csv_string)
-            self._dataframe = pandas.read_csv(csv_filename_or_data, '\t', header=pandas_header)
+            if stream_chunk_size:
+                # Only read the column names for now.
+                columns = self._read_csv(nrows=0).columns
+            else:
+                self._dataframe = self._read_csv()
+                columns = self._dataframe.columns
         elif self.is_spreadsheet_file():
+            if stream_chunk_size:
+                raise HedFileError(HedExceptions.BAD_PARAMETERS, "Streaming is only supported for text files",
+                                   filename)
             worksheet_to_load = self._worksheet_name
             if worksheet_to_load is None:
                 worksheet_to_load = 0
-            self._dataframe = pandas.read_excel(filename, sheet_name=worksheet_to_load, header=pandas_header)
+            self._dataframe = pandas.read_excel(filename, sheet_name=worksheet_to_load, header=self._pandas_header)
+            columns = self._dataframe.columns
         else:
             raise HedFileError(HedExceptions.INVALID_EXTENSION, "", filename)
 
         # Finalize mapping information if we have columns
-        if self._dataframe is not None and self._has_column_names:
-            columns = self._dataframe.columns
+        if self._has_column_names:
             self._mapper.set_column_map(columns)
 
-        # Now that the file is fully initialized, gather the definitions from it.
-        self.file_def_dict, self.file_def_dict_issues = self.extract_definitions()
-        # finally add the new file dict to the mapper.
-        mapper.update_definition_mapper_with_file(self.file_def_dict)
+        self.file_def_dict = DefDict()
+        self.file_def_dict_issues = []
+        self._definitions_deferred = defer_definitions
+        if not defer_definitions:
+            # Now that the file is fully initialized, gather the definitions from it.
+            self.file_def_dict, self.file_def_dict_issues = self.extract_definitions()
+            # finally add the new file dict to the mapper.
+            mapper.update_definition_mapper_with_file(self.file_def_dict)
 
     def convert_to_short(self, hed_schema, error_handler=None):
         """
@@ -163,16 +182,46 @@ class BaseFileInput:
             error_handler = ErrorHandler()
         new_def_dict = DefDict()
         validation_issues = []
-        for row_number, column_to_hed_tags in self.iter_raw():
-            error_handler.push_error_context(ErrorContext.ROW, row_number)
-            for column_number, hed_string_obj in column_to_hed_tags.items():
-                error_handler.push_error_context(ErrorContext.COLUMN, column_number)
-                validation_issues += new_def_dict.check_for_definitions(hed_string_obj, error_handler=error_handler)
-                error_handler.pop_error_context()
-            error_handler.pop_error_context()
+        for row_number, text_file_row in self._iter_rows():
+            validation_issues += self._extract_row_definitions(new_def_dict, row_number, text_file_row,
+                                                               error_handler)
 
         return new_def_dict, validation_issues
 
+    def _extract_row_definitions(self, def_dict, row_number, row_values, error_handler):
+        """
+        Gathers the definitions from every column of a single row.
+
+            Only cells containing a definition tag are parsed, as no other cell can add a definition.
+
+        Parameters
+        ----------
+        def_dict : DefDict
+            The definitions found so far, which new ones are added to.
+        row_number : int
+            The zero based row number, as returned from _iter_rows.
+        row_values : [str]
+            The cell values for the row.
+        error_handler : ErrorHandler
+            The error handler to use for context.
+
+        Returns
+        -------
+        validation_issues: [{}]
+            A list of all issues found with the definitions in this row.
+        """
+        validation_issues = []
+        for column_number, cell_text in enumerate(row_values):
+            cell_text = str(cell_text)
+            if DefTagNames.DEF_KEY not in cell_text.lower():
+                continue
+            error_handler.push_error_context(ErrorContext.ROW, row_number + self._get_row_number_offset())
+            error_handler.push_error_context(ErrorContext.COLUMN, column_number + 1)
+            validation_issues += def_dict.check_for_definitions(HedString(cell_text), error_handler=error_handler)
+            error_handler.pop_error_context()
+            error_handler.pop_error_context()
+        return validation_issues
+
     def save(self, filename=None, include_formatting=False, output_processed_file=False,
              add_suffix=None):
         """
@@ -191,6 +240,9 @@ class BaseFileInput:
         -------
 
         """
+        if self._dataframe is None:
+            raise ValueError("No data frame loaded")
+
         if not filename:
             filename = self._filename
         base_filename, extension = os.path.splitext(filename)
@@ -238,6 +290,9 @@ class BaseFileInput:
         Returns
         -------
         """
+        if self._dataframe is None:
+            raise ValueError("No data frame loaded")
+
         # For now just make a copy if we want to save a formatted copy.  Could optimize this further.
         if output_processed_file:
             output_file = self._get_processed_copy()
@@ -271,7 +326,7 @@ class BaseFileInput:
         default_mapper = ColumnMapper()
         return self.iter_dataframe(default_mapper)
 
-    def iter_dataframe(self, mapper=None, return_row_dict=False, do_not_expand_labels=False):
+    def iter_dataframe(self, mapper=None, return_row_dict=False, do_not_expand_labels=False, cache_cells=False):
         """
         Generates a list of parsed rows based on the given column mapper.
 
@@ -284,6 +339,9 @@ class BaseFileInput:
             If False, returns just the HedStrings for each column
         do_not_expand_labels: bool
             If true, this will still remove all definition/ tags, but will not expand label tags.
+        cache_cells: bool
+            If True, each distinct cell value in a column is only expanded once, and every row with that value
+            shares the same HedString.  The yielded HedStrings must not be modified.
 
         Yields
         -------
@@ -295,19 +353,151 @@ class BaseFileInput:
         if mapper is None:
             mapper = self._mapper
 
+        start_at_one = self._get_row_number_offset()
+        cell_cache = {} if cache_cells else None
+        if self._definitions_deferred and mapper is self._mapper:
+            row_iterator = self._iter_rows_gathering_definitions(do_not_expand_labels, cell_cache)
+        else:
+            row_iterator = ((row_number, mapper.expand_row_tags(text_file_row, do_not_expand_labels, cell_cache))
+                            for row_number, text_file_row in self._iter_rows())
+        for row_number, row_dict in row_iterator:
+            if return_row_dict:
+                yield row_number + start_at_one, row_dict
+            else:
+                yield row_number + start_at_one, row_dict[util_constants.COLUMN_TO_HED_TAGS]
+
+    def _iter_rows_gathering_definitions(self, do_not_expand_labels=False, cell_cache=None):
+        """
+        Generates the expanded rows of a file opened with defer_definitions, gathering its definitions as it goes.
+
+            The definitions in each row are added before the row is expanded.  Rows using a definition that hasn't
+            been found yet are held back, and expanded again at the end once all definitions are known, so these
+            rows are generated out of order.
+
+        Parameters
+        ----------
+        do_not_expand_labels: bool
+            If true, this will still remove all definition/ tags, but will not expand label tags.
+        cell_cache: dict or None
+            Passed on to ColumnMapper.expand_row_tags.
+
+        Yields
+        -------
+        row_number: int
+            The zero based row number, not counting the column names.
+        row_dict: dict
+            The expanded row, as returned from ColumnMapper.expand_row_tags.
+        """
+        error_handler = ErrorHandler()
+        rows = self._iter_rows()
+        held_rows = []
+        try:
+            for row_number, text_file_row in rows:
+                def_count = len(self.file_def_dict)
+                self.file_def_dict_issues += self._extract_row_definitions(self.file_def_dict, row_number,
+                                                                           text_file_row, error_handler)
+                if len(self.file_def_dict) != def_count:
+                    self._mapper.update_definition_mapper_with_file(self.file_def_dict)
+                row_dict = self._mapper.expand_row_tags(text_file_row, do_not_expand_labels, cell_cache)
+                if self._has_unmatched_definition(row_dict):
+                    held_rows.append((row_number, text_file_row))
+                    continue
+                yield row_number, row_dict
+        finally:
+            # If the pass is stopped early, still gather the rest of the definitions so they're only gathered once.
+            for row_number, text_file_row in rows:
+                self.file_def_dict_issues += self._extract_row_definitions(self.file_def_dict, row_number,
+                                                                           text_file_row, error_handler)
+            self._mapper.update_definition_mapper_with_file(self.file_def_dict)
+            self._definitions_deferred = False
+
+        # The cached cells may have been expanded before their definitions were found.
+        for row_number, text_file_row in held_rows:
+            yield row_number, self._mapper.expand_row_tags(text_file_row, do_not_expand_labels)
+
+    @staticmethod
+    def _has_unmatched_definition(row_dict):
+        """Returns True if expanding the row found a definition label with no matching definition."""
+        for column_issues in row_dict.get(util_constants.COLUMN_ISSUES, {}).values():
+            for issue in column_issues:
+                if issue.get("error_type") == ValidationErrors.HED_DEFINITION_UNMATCHED:
+                    return True
+        return False
+
+    def _get_row_number_offset(self):
+        """Returns the number to add to a zero based row number to get the row number shown to users."""
         start_at_one = 1
         if self._has_column_names:
             start_at_one += 1
-        for row_number, text_file_row in self._dataframe.iterrows():
+        return start_at_one
+
+    def _iter_rows(self):
+        """
+        Generates the values of each non blank row in the file.
+
+        Yields
+        -------
+        row_number: int
+            The zero based row number, not counting the column names.
+        row_values: [str]
+            The cell values for the row.
+        """
+        if self._dataframe is None:
+            yield from self._iter_rows_streaming()
+            return
+
+        dataframe = self._dataframe
+        # Convert the whole frame at once, rather than making a Series for each row.  This gives the same values as
+        # iterrows, unless every column holds dates or times, which iterrows would return as Timestamps.
+        row_values = dataframe.to_numpy()
+        if row_values.dtype.kind in "mM":
+            yield from ((row_number, text_file_row.tolist()) for row_number, text_file_row in dataframe.iterrows()
+                        if not all(text_file_row.isnull()))
+            return
+        blank_rows = dataframe.isnull().all(axis=1).to_numpy()
+        for row_number, is_blank, text_file_row in zip(dataframe.index, blank_rows, row_values.tolist()):
             # Skip any blank lines.
-            if all(text_file_row.isnull()):
+            if is_blank:
                 continue
+            yield row_number, text_file_row
 
-            row_dict = mapper.expand_row_tags(text_file_row, do_not_expand_labels)
-            if return_row_dict:
-                yield row_number + start_at_one, row_dict
-            else:
-                yield row_number + start_at_one, row_dict[util_constants.COLUMN_TO_HED_TAGS]
+    def _iter_rows_streaming(self):
+        """
+        Generates the values of each non blank row in the file, reading it stream_chunk_size rows at a time.
+
+        Yields
+        -------
+        row_number: int
+            The zero based row number, not counting the column names.
+        row_values: (str)
+            The cell values for the row.
+        """
+        row_offset = 0
+        for chunk in self._read_csv(chunksize=self._stream_chunk_size, dtype=str):
+            blank_rows = chunk.isnull().all(axis=1).to_numpy()
+            for row_index, row_values in enumerate(chunk.itertuples(index=False, name=None)):
+                if blank_rows[row_index]:
+                    continue
+                yield row_offset + row_index, row_values
+            row_offset += len(chunk)
+
+    def _read_csv(self, **kwargs):
+        """
+        Reads the text file or string this was created from using pandas.
+
+        Parameters
+        ----------
+        kwargs:
+            Passed on to pandas.read_csv, eg nrows or chunksize.
+        Returns
+        -------
+        dataframe: pandas.DataFrame or pandas.io.parsers.TextFileReader
+            The loaded data, or a reader over it if chunksize is passed.
+        """
+        csv_filename_or_data = self._filename
+        if self._csv_string:
+            csv_filename_or_data = io.StringIO(self._csv_string)
+        return pandas.read_csv(csv_filename_or_data, '\t', header=self._pandas_header, **kwargs)
 
     def set_cell(self, row_number, column_number, new_text, include_column_prefix_if_exist=False):
         """
@@ -1,5 +1,6 @@
 from enum import Enum
 from hed.util.hed_string import HedString
+from hed.util.hed_string_arrays import HedStringArrays
 from hed.util.error_types import SidecarErrors, ErrorContext, ValidationErrors
 from hed.util import error_reporter
 
@@ -52,6 +53,9 @@ class ColumnDef:
         self.column_name = name
         self.column_prefix = column_prefix
         self._hed_dict = hed_dict
+        # Each category or value hed string is parsed once, then new HedStrings are built from these for each cell.
+        self._parsed_hed_strings = HedStringArrays()
+        self._parsed_hed_string_indexes = {}
 
     @property
     def hed_dict(self):
@@ -175,15 +179,14 @@ class ColumnDef:
         if column_type == ColumnType.Categorical:
             final_text = self._get_category_hed_string(input_text)
             if final_text:
-                return HedString(final_text), False
+                return self._get_parsed_hed_string(final_text), False
             else:
                 return None, [{"error_type": ValidationErrors.HED_SIDECAR_KEY_MISSING,
                               "tag": input_text,
                               "category_keys": list(self._hed_dict["HED"].keys())}]
         elif column_type == ColumnType.Value:
             prelim_text = self._get_value_hed_string()
-            final_text = prelim_text.replace("#", input_text)
-            return HedString(final_text), False
+            return self._get_parsed_hed_string(prelim_text, input_text), False
         elif column_type == ColumnType.HEDTags:
             hed_string_obj = HedString(input_text)
             new_text = self._prepend_prefix_to_required_tag_column_if_needed(hed_string_obj, self.column_prefix)
@@ -195,6 +198,27 @@ class ColumnDef:
 
         return None, {"error_type": "INTERNAL_ERROR"}
 
+    def _get_parsed_hed_string(self, hed_string, placeholder_value=None):
+        """Returns a new HedString for a category or value hed string, parsing it only the first time it's used.
+
+        Parameters
+        ----------
+        hed_string : str
+            The hed string from the column definition.
+        placeholder_value : str or None
+            If present, each # in hed_string is replaced with this.
+
+        Returns
+        -------
+        hed_string_obj: HedString
+            A new HedString, equivalent to HedString(hed_string) with any # replaced.  Callers are free to modify it.
+        """
+        string_index = self._parsed_hed_string_indexes.get(hed_string)
+        if string_index is None:
+            string_index = self._parsed_hed_strings.append(hed_string)
+            self._parsed_hed_string_indexes[hed_string] = string_index
+        return self._parsed_hed_strings.get_hed_string(string_index, placeholder_value)
+
     @staticmethod
     def _prepend_prefix_to_required_tag_column_if_needed(required_tag_column_tags, required_tag_prefix):
         """Prepends the tag paths to the required tag column tags that need them.
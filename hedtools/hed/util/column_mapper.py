@@ -2,6 +2,7 @@ from hed.util.column_definition import ColumnDef, ColumnType
 from hed.util.column_def_group import ColumnDefGroup
 from hed.util.hed_string import HedString
 from hed.util import util_constants
+from hed.util.stage_timer import ValidationStages, timed_stage
 import copy
 
 
@@ -10,6 +11,9 @@ class ColumnMapper:
 
         Private Functions and variables column and row indexing starts at 0.
         Public functions and variables indexing starts at 1(or 2 if has column names)"""
+    # The most distinct cells expand_row_tags will keep in a cell_cache.
+    MAX_CACHED_CELLS = 10000
+
     def __init__(self, json_def_files=None, tag_columns=None, column_prefix_dictionary=None,
                  attribute_columns=None, definition_mapper=None):
         """Constructor for ColumnMapper
@@ -184,7 +188,8 @@ class ColumnMapper:
         column_entry = self._final_column_map[column_number]
         return column_entry.expand(input_text)
 
-    def expand_row_tags(self, row_text, do_not_expand_labels=False):
+    @timed_stage(ValidationStages.ROW_EXPANSION)
+    def expand_row_tags(self, row_text, do_not_expand_labels=False, cell_cache=None):
         """
         Expands all mapped columns from a given row
 
@@ -194,6 +199,10 @@ class ColumnMapper:
             The text for the given row, one entry per column number.
         do_not_expand_labels: bool
             If true, this will still remove all definition/ tags, but will not expand label tags.
+        cell_cache: dict or None
+            If present, each distinct cell value in a column is only expanded once, and later rows with the same
+            value get the same HedString.  Pass the same dict for every row of a file.
+            The returned HedStrings are shared between rows, and must not be modified.
 
         Returns
         -------
@@ -207,8 +216,25 @@ class ColumnMapper:
         result_dict = {}
         column_to_hed_tags_dictionary = {}
         issues_dict = {}
-        for column_number, cell_text in enumerate(row_text):
-            translated_column, attribute_name_or_error = self._expand_column(column_number, str(cell_text))
+        # Only the mapped columns can expand to anything, unless there's no mapping and every column is used.
+        if self._final_column_map:
+            row_length = len(row_text)
+            columns_to_expand = [(column_number, row_text[column_number])
+                                 for column_number in sorted(self._final_column_map)
+                                 if 0 <= column_number < row_length]
+        else:
+            columns_to_expand = enumerate(row_text)
+        for column_number, cell_text in columns_to_expand:
+            if cell_cache is None:
+                expanded_cell = self._expand_cell(column_number, str(cell_text), do_not_expand_labels)
+            else:
+                cell_key = (column_number, str(cell_text))
+                expanded_cell = cell_cache.get(cell_key)
+                if expanded_cell is None:
+                    expanded_cell = self._expand_cell(column_number, cell_key[1], do_not_expand_labels)
+                    if len(cell_cache) < self.MAX_CACHED_CELLS:
+                        cell_cache[cell_key] = expanded_cell
+            translated_column, attribute_name_or_error, def_issues = expanded_cell
             if translated_column is None:
                 if attribute_name_or_error:
                     if column_number + 1 not in issues_dict:
@@ -218,12 +244,10 @@ class ColumnMapper:
             if attribute_name_or_error:
                 result_dict[attribute_name_or_error] = translated_column
                 continue
-            if self._def_mapper:
-                new_issues = self._def_mapper.replace_and_remove_tags(translated_column, do_not_expand_labels)
-                if new_issues:
-                    if column_number + 1 not in issues_dict:
-                        issues_dict[column_number + 1] = []
-                    issues_dict[column_number + 1] += new_issues
+            if def_issues:
+                if column_number + 1 not in issues_dict:
+                    issues_dict[column_number + 1] = []
+                issues_dict[column_number + 1] += def_issues
 
             column_to_hed_tags_dictionary[column_number + 1] = translated_column
 
@@ -235,6 +259,34 @@ class ColumnMapper:
 
         return result_dict
 
+    def _expand_cell(self, column_number, cell_text, do_not_expand_labels=False):
+        """
+        Expands a single cell, and replaces any definitions and labels in it.
+
+        Parameters
+        ----------
+        column_number : int
+            The zero based column number of the cell.
+        cell_text : str
+            The text of the cell.
+        do_not_expand_labels: bool
+            If true, this will still remove all definition/ tags, but will not expand label tags.
+
+        Returns
+        -------
+        translated_column: HedString or str or None
+            The expanded cell, as returned from _expand_column.
+        attribute_name_or_error_message: False or str or []
+            The attribute name or errors, as returned from _expand_column.
+        def_issues: []
+            Issues found replacing definitions and labels.
+        """
+        translated_column, attribute_name_or_error = self._expand_column(column_number, cell_text)
+        def_issues = []
+        if translated_column is not None and not attribute_name_or_error and self._def_mapper:
+            def_issues = self._def_mapper.replace_and_remove_tags(translated_column, do_not_expand_labels)
+        return translated_column, attribute_name_or_error, def_issues
+
     def remove_prefix_if_needed(self, column_number, input_text):
         """
         Remove required prefix from the given text if the specified column has a prefix.
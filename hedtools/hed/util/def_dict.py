@@ -1,4 +1,5 @@
-from hed.util.hed_string import HedString, HedTag, HedGroup
+from hed.util.hed_string import HedTag, HedGroup
+from hed.util.hed_string_arrays import HedStringArrays
 from hed.util.error_types import DefinitionErrors
 from hed.util import error_reporter
 
@@ -29,6 +30,8 @@ class DefEntry:
         self.name = name
         self.contents = contents_string
         self.takes_value = takes_value
+        # The parsed contents, which each expansion is built from.  Parsed the first time this definition is expanded.
+        self._template = None
 
     def get_definition(self, placeholder_value=None):
         if self.takes_value == (placeholder_value is None):
@@ -37,12 +40,11 @@ class DefEntry:
         output_contents = None
         name = self.name
         if self.contents:
-            hed_string = self.contents
             if placeholder_value:
-                hed_string = hed_string.replace("#", placeholder_value)
                 name = f"{name}/{placeholder_value}"
-
-            output_contents = HedString.split_hed_string_into_groups(hed_string)
+            if self._template is None:
+                self._template = HedStringArrays([self.contents])
+            output_contents = self._template.get_hed_group(0, placeholder_value or None)
 
         # Possibly update this to properly point to the original def tag
         def_tag = HedTag(f"{DefTagNames.ELABEL_ORG_KEY}{name}", span=(0, len(f"{DefTagNames.ELABEL_ORG_KEY}{name}")))
@@ -81,6 +83,9 @@ class DefDict:
     def __iter__(self):
         return iter(self._defs.items())
 
+    def __len__(self):
+        return len(self._defs)
+
     def check_for_definitions(self, hed_string_obj, check_for_issues=True, error_handler=None):
         """
         Check a given hed string for definition tags, and add them to the dictionary if so.
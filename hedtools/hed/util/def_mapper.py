@@ -1,6 +1,7 @@
 from hed.util.hed_string import HedString
 from hed.util.def_dict import DefDict, DefTagNames
 from hed.util.error_types import ValidationErrors
+from hed.util.stage_timer import ValidationStages, timed_stage
 
 class DefinitionMapper:
     """Class responsible for gathering/removing definitions from hed strings,
@@ -16,6 +17,8 @@ class DefinitionMapper:
             DefDicts containing all the definitions this mapper should initialize with.  More can be added later.
         """
         self._gathered_defs = {}
+        # The definitions skipped as duplicates, so adding the same DefDict again doesn't warn again.
+        self._duplicate_defs = {}
 
         self._def_tag_name = DefTagNames.DEF_KEY.lower()
         self._label_tag_name = DefTagNames.DLABEL_KEY.lower()
@@ -52,13 +55,18 @@ class DefinitionMapper:
         -------
         """
         for def_tag, def_value in def_dict:
+            # A DefDict may be added again as it grows, eg while a file's definitions are gathered.
+            if self._gathered_defs.get(def_tag) is def_value or self._duplicate_defs.get(def_tag) is def_value:
+                continue
             if def_tag in self._gathered_defs:
                 # This is a warning.  Errors from a duplicate definition in a single source will be reported
                 # by DefDict
                 print(f"WARNING: Duplicate definition found for '{def_tag}'.")
+                self._duplicate_defs[def_tag] = def_value
                 continue
             self._gathered_defs[def_tag] = def_value
 
+    @timed_stage(ValidationStages.DEFINITION_EXPANSION)
     def replace_and_remove_tags(self, hed_string_obj, do_not_expand_labels=False):
         """Takes a given string and returns the hed string with all definitions removed, and all labels replaced
 
@@ -116,7 +124,7 @@ class DefinitionMapper:
                         continue
                     if do_not_expand_labels:
                        continue
-                    tag_group.replace_tag(tag, def_contents)
+                    hed_string_obj.replace_tag(tag_group, tag, def_contents)
                     continue
 
         if remove_groups:
@@ -2,16 +2,229 @@
 This module is used to report errors found in the validation.
 
 You can scope the formatted errors with calls to push_error_context and pop_error_context.
+Issues can be written out one at a time as they are found with a TextIssueWriter, JsonlIssueWriter or TsvIssueWriter.
 """
+import json
 
 from hed.util.error_types import ValidationErrors, ValidationWarnings, SchemaErrors, \
-    SidecarErrors, SchemaWarnings, ErrorContext, ErrorSeverity, DefinitionErrors
+    SidecarErrors, SchemaWarnings, ErrorContext, ErrorSeverity, DefinitionErrors, IssueLimitErrors
+
+
+class HedIssue(dict):
+    """A single issue found in validation or conversion.
+
+    Issues are dictionaries with the keys code, message, severity, any issue specific keys such as source_tag, and
+    one ec_ key per error context.  The message is only formatted the first time it is read, and the error context is
+    a frame shared with every other issue reported in the same scope.  The dictionary itself is only filled in when
+    the issue is used as a whole, such as by items(), converting to JSON, or modifying it.
+    """
+    __slots__ = ('code', 'severity', 'tag', '_message', '_message_function', '_parameters', '_extra_items',
+                 '_context_frame', '_is_filled')
+
+    def __init__(self, code, severity, message=None, message_function=None, parameters=(), extra_items=(),
+                 context_frame=(), tag=None):
+        """Constructor for the HedIssue class.
+
+        Parameters
+        ----------
+        code: str
+            The error code, eg a value from ValidationErrors.
+        severity: ErrorSeverity
+            If this is an error or warning.
+        message: str or None
+            The message for this issue.  If None, it is created by calling message_function on first use.
+        message_function: func
+            Called with the code and then parameters to create the message.
+        parameters: tuple
+            The values the message is formatted from.
+        extra_items: ((str, object),)
+            Issue specific (key, value) pairs, such as source_tag for schema issues.
+        context_frame: ((str, (object, bool)),)
+            The (context_type, (context, increment_depth_after)) pairs this issue was reported in.
+        tag: str or None
+            The tag or definition name this issue is about, if any.  This isn't one of the dictionary keys.
+        """
+        # Never left empty, as some code (such as json) skips the methods below for empty dictionaries.
+        dict.__setitem__(self, 'code', code)
+        self.code = code
+        self.severity = severity
+        self.tag = tag
+        self._message = message
+        self._message_function = message_function
+        self._parameters = parameters
+        self._extra_items = extra_items
+        self._context_frame = context_frame
+        self._is_filled = False
+
+    @staticmethod
+    def from_dict(issue_dict, context_frame=()):
+        """Creates an issue from a plain dictionary, such as one stored in a ValidationCache.
+
+        Parameters
+        ----------
+        issue_dict: {}
+            An issue with at least the code, message and severity keys.  Any ec_ keys are ignored, and a tag key is
+            used as the issue tag.
+        context_frame: ((str, (object, bool)),)
+            The error context for the new issue.
+        Returns
+        -------
+        issue: HedIssue
+            The new issue.
+        """
+        extra_items = tuple((key, value) for key, value in issue_dict.items()
+                            if key not in ('code', 'message', 'severity', 'tag') and not key.startswith("ec_"))
+        return HedIssue(issue_dict['code'], issue_dict['severity'], message=issue_dict['message'],
+                        extra_items=extra_items, context_frame=context_frame, tag=issue_dict.get('tag'))
+
+    @property
+    def message(self):
+        """The human readable message for this issue."""
+        if self._message is None:
+            self._message = self._message_function(self.code, *self._parameters)
+            self._message_function = None
+            self._parameters = ()
+        return self._message
+
+    def with_context(self, context_frame):
+        """Returns a copy of this issue with a different error context.
+
+        Parameters
+        ----------
+        context_frame: ((str, (object, bool)),)
+            The error context for the new issue.  Use () to remove all context.
+        Returns
+        -------
+        issue: HedIssue
+            The new issue.  The message is shared with this one, formatted or not.
+        """
+        return HedIssue(self.code, self.severity, self._message, self._message_function, self._parameters,
+                        self._extra_items, context_frame, self.tag)
+
+    def copy(self):
+        """Returns a copy of this issue, including any changes made to it."""
+        issue = self.with_context(self._context_frame)
+        if self._is_filled:
+            dict.update(issue, dict.items(self))
+            issue._is_filled = True
+        return issue
+
+    def _fill(self):
+        """Stores every key in the dictionary itself, in the order code, message, issue specific keys, severity,
+        then the error context."""
+        if not self._is_filled:
+            dict.__setitem__(self, 'message', self.message)
+            dict.update(self, self._extra_items)
+            dict.__setitem__(self, 'severity', self.severity)
+            dict.update(self, self._context_frame)
+            self._is_filled = True
+
+    def __getitem__(self, key):
+        if self._is_filled:
+            return dict.__getitem__(self, key)
+        if key == 'code':
+            return self.code
+        if key == 'message':
+            return self.message
+        if key == 'severity':
+            return self.severity
+        for item_key, value in self._extra_items:
+            if item_key == key:
+                return value
+        for context_type, context in self._context_frame:
+            if context_type == key:
+                return context
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        self._fill()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._fill()
+        return dict.__len__(self)
+
+    def __eq__(self, other):
+        self._fill()
+        if isinstance(other, HedIssue):
+            other._fill()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._fill()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        # Pickles and copies as a plain dictionary.
+        return dict, (dict(self.items()),)
+
+    def keys(self):
+        self._fill()
+        return dict.keys(self)
+
+    def values(self):
+        self._fill()
+        return dict.values(self)
+
+    def items(self):
+        self._fill()
+        return dict.items(self)
+
+    def __setitem__(self, key, value):
+        self._fill()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._fill()
+        dict.__delitem__(self, key)
+
+    def setdefault(self, key, default=None):
+        self._fill()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._fill()
+        dict.update(self, *args, **kwargs)
+
+    def pop(self, key, *default):
+        self._fill()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._fill()
+        return dict.popitem(self)
+
+    def clear(self):
+        self._fill()
+        dict.clear(self)
 
 
 class ErrorHandler:
     def __init__(self):
         # The current (ordered) dictionary of contexts.
         self.error_context = []
+        # The error_context as (context_type, (context, increment_depth_after)) pairs, built once per push.
+        self._context_items = []
+        # The error_context as a HedIssue context frame, shared by all issues until the context changes.
+        self._context_frame = None
 
     def push_error_context(self, context_type, context, increment_depth_after=True):
         """
@@ -29,6 +242,8 @@ class ErrorHandler:
         -------
         """
         self.error_context.append((context_type, context, increment_depth_after))
+        self._context_items.append((context_type, (context, increment_depth_after)))
+        self._context_frame = None
 
     def pop_error_context(self):
         """
@@ -38,31 +253,103 @@ class ErrorHandler:
         -------
         """
         self.error_context.pop(-1)
+        self._context_items.pop(-1)
+        self._context_frame = None
 
     def reset_error_context(self):
         """Reset all error context information to defaults
 
         This function should not be needed with proper usage."""
         self.error_context = []
+        self._context_items = []
+        self._context_frame = None
+
+    def _get_context_frame(self):
+        """
+        Returns the current error context in the form stored in a HedIssue.
+
+        Returns
+        -------
+        context_frame: ((str, (object, bool)),)
+            The (context_type, (context, increment_depth_after)) pairs.  A later context of the same type replaces
+            the value of an earlier one.
+        """
+        if self._context_frame is None:
+            context_frame = tuple(self._context_items)
+            if len({context_type for context_type, _ in context_frame}) != len(context_frame):
+                context_frame = tuple(dict(context_frame).items())
+            self._context_frame = context_frame
+        return self._context_frame
+
+    def _create_issue_list(self, error_type, severity, message_function, parameters, extra_items=(), tag=None):
+        """
+        Creates a new issue in the current error context.
+
+        Parameters
+        ----------
+        error_type : str
+            The error code.
+        severity : ErrorSeverity
+            If this is an error or warning.
+        message_function : func
+            Creates the message from the error_type and parameters, when it is first read.
+        parameters : tuple
+            The values the message is formatted from.
+        extra_items: ((str, object),)
+            Issue specific (key, value) pairs, such as source_tag for schema issues.
+        tag: str or None
+            The tag or definition name the issue is about.  Empty tags are stored as None.
+
+        Returns
+        -------
+        issue_list: [HedIssue]
+            A list containing the new issue.
+        """
+        return [HedIssue(error_type, severity, None, message_function, parameters, extra_items,
+                         self._get_context_frame(), tag or None)]
 
-    def _add_context_to_errors(self, error_object=None):
+    def add_context_to_issues(self, issues):
         """
-        Takes an error object and adds relevant context around it, such as row number, or column name.
+        Adds the current error context to a list of issues that were reported without any context.
+
+            The passed in issues are not modified.
 
         Parameters
         ----------
-        error_object : {}
-            Generated error containing at least a code and message entry.
+        issues : [{}]
+            Issues with no context entries, such as ones returned from remove_context_from_issues.
 
         Returns
         -------
-        error_object_list: [{}]
-            The passed in error with any needed context strings added to the start.
+        issues_with_context: [HedIssue]
+            Copies of the passed in issues with the current context added.
         """
-        for (context_type, context, increment_count) in self.error_context:
-            error_object[context_type] = (context, increment_count)
+        context_frame = self._get_context_frame()
+        issues_with_context = []
+        for issue in issues:
+            if isinstance(issue, HedIssue):
+                issues_with_context.append(issue.with_context(context_frame))
+            else:
+                issues_with_context.append(HedIssue.from_dict(issue, context_frame))
+        return issues_with_context
+
+    @staticmethod
+    def remove_context_from_issues(issues):
+        """
+        Returns copies of the issues with all error context entries removed.
+
+        Parameters
+        ----------
+        issues : [{}]
+            Issues returned from the format functions.
 
-        return [error_object]
+        Returns
+        -------
+        issues_without_context: [{}]
+            Copies of the passed in issues without any context entries.
+        """
+        return [issue.with_context(()) if isinstance(issue, HedIssue) else
+                {key: value for key, value in issue.items() if not key.startswith("ec_")} for issue in issues]
 
     def format_val_error(self, error_type, hed_string='', tag='', tag_prefix='', previous_tag='',
                          character='', index=0, unit_class_units='', opening_parentheses_count=0,
@@ -95,9 +382,9 @@ class ErrorHandler:
             List of valid category keys for the given column
         Returns
         -------
-        issue_list: [{}]
-            A list containing a single dictionary with the warning type and warning message related to a particular type
-            of warning.
+        issue_list: [HedIssue]
+            A list containing a single issue with the error type and error message related to a particular type
+            of error.
 
         """
         try:
@@ -105,6 +392,16 @@ class ErrorHandler:
         except AttributeError:
             tag = tag
 
+        return self._create_issue_list(error_type, ErrorSeverity.ERROR, self._get_val_error_message,
+                                       (tag, hed_string, character, index, tag_prefix, unit_class_units,
+                                        opening_parentheses_count, closing_parentheses_count, category_keys),
+                                       tag=tag)
+
+    @staticmethod
+    def _get_val_error_message(error_type, tag='', hed_string='', character='', index=0, tag_prefix='',
+                               unit_class_units='', opening_parentheses_count=0, closing_parentheses_count=0,
+                               category_keys=None):
+        """Returns the message for a format_val_error issue."""
         error_prefix = "ERROR: "
         error_types = {
             ValidationErrors.PARENTHESES: f'{error_prefix}Number of opening and closing parentheses are unequal. '
@@ -126,11 +423,7 @@ class ErrorHandler:
             ValidationErrors.HED_DEFINITION_VALUE_EXTRA: f"{error_prefix}A definition does not take a placeholder value, but was given one.  Definition: '{tag}",
         }
         default_error_message = 'ERROR: Unknown error'
-        error_message = error_types.get(error_type, default_error_message)
-
-        error_object = {'code': error_type, 'message': error_message, 'severity': ErrorSeverity.ERROR}
-        error_object_list = self._add_context_to_errors(error_object)
-        return error_object_list
+        return error_types.get(error_type, default_error_message)
 
     def format_sidecar_error(self, error_type, column_name="", given_type="", expected_type="", pound_sign_count=0,
                              category_count=0, severity=ErrorSeverity.ERROR):
@@ -155,10 +448,17 @@ class ErrorHandler:
             If this is an error or warning.
         Returns
         -------
-        issue_list: [{}]
-            A list containing a single dictionary with the warning type and warning message related to a particular type
-            of warning.
+        issue_list: [HedIssue]
+            A list containing a single issue with the error type and error message related to a particular type
+            of error.
         """
+        return self._create_issue_list(error_type, severity, self._get_sidecar_error_message,
+                                       (column_name, given_type, expected_type, pound_sign_count, category_count))
+
+    @staticmethod
+    def _get_sidecar_error_message(error_type, column_name="", given_type="", expected_type="", pound_sign_count=0,
+                                   category_count=0):
+        """Returns the message for a format_sidecar_error issue."""
         error_prefix = "ERROR: "
         error_types = {
             SidecarErrors.BLANK_HED_STRING: f"{error_prefix}No HED string found for Value or Category column.",
@@ -171,12 +471,7 @@ class ErrorHandler:
         }
 
         default_error_message = f'{error_prefix}Unknown error {error_type}'
-        error_message = error_types.get(error_type, default_error_message)
-
-        error_object = {'code': error_type, 'message': error_message, 'severity': severity}
-
-        error_object_list = self._add_context_to_errors(error_object)
-        return error_object_list
+        return error_types.get(error_type, default_error_message)
 
     def format_val_warning(self, warning_type, tag='', default_unit='', tag_prefix=''):
         """Reports the abc warning based on the type of warning.
@@ -193,8 +488,8 @@ class ErrorHandler:
             The tag prefix that generated the warning.
         Returns
         -------
-        issue_list: [{}]
-            A list containing a single dictionary with the warning type and warning message related to a particular type
+        issue_list: [HedIssue]
+            A list containing a single issue with the warning type and warning message related to a particular type
             of warning.
 
         """
@@ -203,6 +498,12 @@ class ErrorHandler:
         except AttributeError:
             tag = tag
 
+        return self._create_issue_list(warning_type, ErrorSeverity.WARNING, self._get_val_warning_message,
+                                       (tag, default_unit, tag_prefix), tag=tag)
+
+    @staticmethod
+    def _get_val_warning_message(warning_type, tag='', default_unit='', tag_prefix=''):
+        """Returns the message for a format_val_warning issue."""
         warning_prefix = "WARNING: "
 
         warning_types = {
@@ -211,11 +512,7 @@ class ErrorHandler:
             ValidationWarnings.UNIT_CLASS_DEFAULT_USED: f'{warning_prefix}No unit specified. Using "{default_unit}" as the default - "{tag}"'
         }
         default_warning_message = 'WARNING: Unknown warning'
-        warning_message = warning_types.get(warning_type, default_warning_message)
-
-        warning_object = {'code': warning_type, 'message': warning_message, 'severity': ErrorSeverity.WARNING}
-        warning_object_list = self._add_context_to_errors(warning_object)
-        return warning_object_list
+        return warning_types.get(warning_type, default_warning_message)
 
     def reformat_schema_error(self, error, hed_string, offset):
         """
@@ -266,15 +563,27 @@ class ErrorHandler:
             A list of all all possible parents for this tag, if there is more than one.
         Returns
         -------
-        issue_list: [{}]
-            A list containing a single dictionary with the warning type and warning message related to a particular type
-            of warning.
+        issue_list: [HedIssue]
+            A list containing a single issue with the error type and error message related to a particular type
+            of error.
 
         """
         if error_index_end is None:
             error_index_end = len(hed_tag)
 
-        problem_tag = str(hed_tag)[error_index: error_index_end]
+        # The tag may be converted later, so the message uses its text as of now.
+        source_tag = str(hed_tag)
+        extra_items = (('source_tag', source_tag), ('start_index', error_index), ('end_index', error_index_end),
+                       ('expected_parent_tag', expected_parent_tag))
+        return self._create_issue_list(error_type, ErrorSeverity.ERROR, self._get_schema_error_message,
+                                       (source_tag, error_index, error_index_end, expected_parent_tag,
+                                        duplicate_tag_list), extra_items, source_tag)
+
+    @staticmethod
+    def _get_schema_error_message(error_type, hed_tag='', error_index=0, error_index_end=0, expected_parent_tag=None,
+                                  duplicate_tag_list=()):
+        """Returns the message for a format_schema_error issue."""
+        problem_tag = hed_tag[error_index: error_index_end]
 
         error_prefix = f"ERROR: "
 
@@ -286,22 +595,11 @@ class ErrorHandler:
             SchemaErrors.EMPTY_TAG_FOUND: f"{error_prefix}Empty tag cannot be converted.",
             SchemaErrors.INVALID_SCHEMA: f"{error_prefix}Source hed schema is invalid as it contains duplicate tags.  "
                                          f"Please fix if you wish to be abe to convert tags.",
-            SchemaErrors.DUPLICATE_TERMS: f"{error_prefix}Term(Short Tag) '{str(hed_tag)}' used {len(duplicate_tag_list)} places in schema as: {tag_join_delimiter}"
+            SchemaErrors.DUPLICATE_TERMS: f"{error_prefix}Term(Short Tag) '{hed_tag}' used {len(duplicate_tag_list)} places in schema as: {tag_join_delimiter}"
                                           f"{tag_join_delimiter.join(duplicate_tag_list)}"
         }
         default_error_message = f'{error_prefix}Internal Error'
-        error_message = error_types.get(error_type, default_error_message)
-
-        error_object = {'code': error_type,
-                        'message': error_message,
-                        'source_tag': str(hed_tag),
-                        'start_index': error_index,
-                        'end_index': error_index_end,
-                        'expected_parent_tag': expected_parent_tag,
-                        'severity': ErrorSeverity.ERROR}
-
-        error_object_list = self._add_context_to_errors(error_object)
-        return error_object_list
+        return error_types.get(error_type, default_error_message)
 
     def format_schema_warning(self, error_type, hed_tag, hed_desc=None, error_index=0, problem_char=None):
         """Reports the abc warning based on the type of error.
@@ -320,11 +618,18 @@ class ErrorHandler:
             The invalid character
         Returns
         -------
-        issue_list: [{}]
-            A list containing a single dictionary with the warning type and warning message related to a particular type
+        issue_list: [HedIssue]
+            A list containing a single issue with the warning type and warning message related to a particular type
             of warning.
 
         """
+        return self._create_issue_list(error_type, ErrorSeverity.WARNING, self._get_schema_warning_message,
+                                       (hed_tag, hed_desc, error_index, problem_char), (('source_tag', hed_tag),),
+                                       hed_tag)
+
+    @staticmethod
+    def _get_schema_warning_message(error_type, hed_tag='', hed_desc=None, error_index=0, problem_char=None):
+        """Returns the message for a format_schema_warning issue."""
         problem_tag = hed_tag
 
         warning_prefix = f"WARNING: "
@@ -338,20 +643,18 @@ class ErrorHandler:
                                                    f"'{problem_tag}' at position {error_index}.",
         }
         default_warning_message = f'{warning_prefix}Internal Error'
-        warning_message = error_types.get(error_type, default_warning_message)
-
-        error_object = {'code': error_type,
-                        'message': warning_message,
-                        'source_tag': hed_tag,
-                        'severity': ErrorSeverity.WARNING}
-
-        error_object_list = self._add_context_to_errors(error_object)
-        return error_object_list
+        return error_types.get(error_type, default_warning_message)
 
     def format_definition_error(self, error_type, def_name, tag_list=None, expected_count=0):
         tag_list_strings = tag_list
         if tag_list:
             tag_list_strings = [str(tag) for tag in tag_list]
+        return self._create_issue_list(error_type, ErrorSeverity.ERROR, self._get_definition_error_message,
+                                       (def_name, tag_list_strings, expected_count), tag=def_name)
+
+    @staticmethod
+    def _get_definition_error_message(error_type, def_name='', tag_list_strings=None, expected_count=0):
+        """Returns the message for a format_definition_error issue."""
         error_prefix = f"ERROR: "
         error_types = {
             DefinitionErrors.WRONG_NUMBER_DEF_TAGS:
@@ -368,14 +671,46 @@ class ErrorHandler:
                 f"{error_prefix}Term '{def_name}' has an invalid extension.  Definitions can only have one term."
         }
         default_error_message = f'{error_prefix}Internal Error'
-        error_message = error_types.get(error_type, default_error_message)
+        return error_types.get(error_type, default_error_message)
 
-        error_object = {'code': error_type,
-                        'message': error_message,
-                        'severity': ErrorSeverity.ERROR}
+    def format_issue_limit_error(self, error_type, limit, issue_code='', omitted_count=0):
+        """Reports that an IssueBudget stopped validation early or left out issues.
+
+        Parameters
+        ----------
+        error_type: str
+            A value from IssueLimitErrors.
+        limit: int
+            The limit that was reached.
+        issue_code: str
+            For CODE_LIMIT_REACHED, the error code that was limited.
+        omitted_count: int
+            For CODE_LIMIT_REACHED, the number of issues left out.
+        Returns
+        -------
+        issue_list: [HedIssue]
+            A list containing a single issue with the error type and error message.
+        """
+        return self._create_issue_list(error_type, ErrorSeverity.ERROR, self._get_issue_limit_error_message,
+                                       (limit, issue_code, omitted_count))
 
-        error_object_list = self._add_context_to_errors(error_object)
-        return error_object_list
+    @staticmethod
+    def _get_issue_limit_error_message(error_type, limit, issue_code, omitted_count):
+        """Returns the message for a format_issue_limit_error issue."""
+        error_prefix = "ERROR: "
+        error_types = {
+            IssueLimitErrors.ISSUE_LIMIT_REACHED:
+                f"{error_prefix}Validation stopped early after reaching the limit of {limit} issues.  "
+                f"The rest of the input was not validated.",
+            IssueLimitErrors.ERROR_ROW_LIMIT_REACHED:
+                f"{error_prefix}Validation stopped early after reaching the limit of {limit} rows with issues.  "
+                f"The rest of the input was not validated.",
+            IssueLimitErrors.CODE_LIMIT_REACHED:
+                f"{error_prefix}{omitted_count} more '{issue_code}' issues were left out after reaching the limit "
+                f"of {limit} issues per error code."
+        }
+        default_error_message = f'{error_prefix}Internal Error'
+        return error_types.get(error_type, default_error_message)
 
     @staticmethod
     def filter_issues_by_severity(issues_list, severity):
@@ -416,28 +751,10 @@ def get_printable_issue_string(validation_issues, title=None, severity=None, ski
         A str containing printable version of the issues or '[]'.
 
     """
-    last_used_error_context = []
-
-    if severity is not None:
-        validation_issues = ErrorHandler.filter_issues_by_severity(validation_issues, severity)
-
-    issue_string = ""
-    for single_issue in validation_issues:
-        single_issue_context = _get_context_from_issue(single_issue, skip_filename)
-        context_string, tab_string = _get_context_string(single_issue_context, last_used_error_context)
-
-        issue_string += context_string
-        single_issue_message = tab_string + single_issue['message']
-        if "\n" in single_issue_message:
-            single_issue_message = single_issue_message.replace("\n", "\n" + tab_string)
-        issue_string += f"{single_issue_message}\n"
-        last_used_error_context = single_issue_context.copy()
-
-    if issue_string:
-        issue_string += "\n"
-    if title:
-        issue_string = title + '\n' + issue_string
-    return issue_string
+    issue_writer = TextIssueWriter(title=title, severity=severity, skip_filename=skip_filename)
+    issue_writer.write_issues(validation_issues)
+    issue_writer.close()
+    return issue_writer.pop_text()
 
 
 def _get_context_from_issue(val_issue, skip_filename=True):
@@ -538,3 +855,208 @@ def _get_context_string(single_issue_context, last_used_context):
 
     tab_string = '\t' * tab_count
     return context_string, tab_string
+
+
+class IssueWriter:
+    """Base class for writing issues out one at a time, such as while a file is still being validated.
+
+    Issues are written to an open text file, or if there is none, buffered until read with pop_text.
+    """
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, output=None, severity=None):
+        """Constructor for the IssueWriter class.
+
+        Parameters
+        ----------
+        output: file object or None
+            An open text file to write to.  If None, the text is buffered and returned by pop_text.
+        severity: int or None
+            If present, only issues with this severity or lower(more severe) are written.
+        """
+        self._output = output
+        self._buffer = []
+        self._buffer_size = 0
+        self.severity = severity
+        self.issue_count = 0
+        self._closed = False
+
+    def write_issue(self, issue):
+        """Writes a single issue.
+
+        Parameters
+        ----------
+        issue: {}
+            An issue returned from one of the ErrorHandler format functions.
+        """
+        if self.severity is not None and issue['severity'] > self.severity:
+            return
+        self.issue_count += 1
+        self._write_issue(issue)
+
+    def write_issues(self, issues):
+        """Writes each issue from a list or iterator of issues, as it is produced.
+
+        Parameters
+        ----------
+        issues: iterable of {}
+            The issues to write.
+        """
+        for issue in issues:
+            self.write_issue(issue)
+
+    def close(self):
+        """Writes anything that follows the last issue and flushes the output.  The output itself isn't closed."""
+        if self._closed:
+            return
+        self._closed = True
+        self._write_footer()
+        if self._output is not None:
+            self._output.flush()
+
+    def pop_text(self):
+        """Returns the text buffered since the last call, when there is no output file.
+
+        Returns
+        -------
+        text: str
+            The buffered text.
+        """
+        text = "".join(self._buffer)
+        self._buffer = []
+        self._buffer_size = 0
+        return text
+
+    def iter_text(self, issues, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Writes the issues and then closes this writer, yielding the text in chunks as it is ready.
+
+            This is meant for streaming responses, so it should only be used when there is no output file.
+
+        Parameters
+        ----------
+        issues: iterable of {}
+            The issues to write.
+        chunk_size: int
+            Text is yielded once at least this many characters are buffered.
+        Yields
+        ------
+        text: str
+            The next chunk of text.
+        """
+        for issue in issues:
+            self.write_issue(issue)
+            if self._buffer_size >= chunk_size:
+                yield self.pop_text()
+        self.close()
+        text = self.pop_text()
+        if text:
+            yield text
+
+    def _write(self, text):
+        if self._output is None:
+            self._buffer.append(text)
+            self._buffer_size += len(text)
+        else:
+            self._output.write(text)
+
+    def _write_issue(self, issue):
+        raise NotImplementedError("Subclasses of IssueWriter must implement _write_issue")
+
+    def _write_footer(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class TextIssueWriter(IssueWriter):
+    """Writes issues in the human readable form from get_printable_issue_string.
+
+    Context such as the filename, row and column is only written when it changes from the previous issue.
+    """
+    def __init__(self, output=None, title=None, severity=None, skip_filename=True):
+        """Constructor for the TextIssueWriter class.
+
+        Parameters
+        ----------
+        output: file object or None
+            An open text file to write to.  If None, the text is buffered and returned by pop_text.
+        title: str
+            Optional title that will always show up first if present(even if there are no validation issues)
+        severity: int or None
+            If present, only issues with this severity or lower(more severe) are written.
+        skip_filename: bool
+            If true, don't add the filename context to the printable string.
+        """
+        super().__init__(output, severity)
+        self.skip_filename = skip_filename
+        self._last_used_error_context = []
+        if title:
+            self._write(title + '\n')
+
+    def _write_issue(self, issue):
+        single_issue_context = _get_context_from_issue(issue, self.skip_filename)
+        context_string, tab_string = _get_context_string(single_issue_context, self._last_used_error_context)
+
+        single_issue_message = tab_string + issue['message']
+        if "\n" in single_issue_message:
+            single_issue_message = single_issue_message.replace("\n", "\n" + tab_string)
+        self._write(f"{context_string}{single_issue_message}\n")
+        self._last_used_error_context = single_issue_context
+
+    def _write_footer(self):
+        if self.issue_count:
+            self._write("\n")
+
+
+class JsonlIssueWriter(IssueWriter):
+    """Writes each issue as a JSON object on its own line.
+
+    Each error context is written as just its value, eg "ec_row": 3.  HedString values are written as strings.
+    """
+    def _write_issue(self, issue):
+        issue_dict = {}
+        for key, value in issue.items():
+            if key.startswith("ec_"):
+                value = value[0]
+            issue_dict[key] = value
+        self._write(json.dumps(issue_dict, default=str) + "\n")
+
+
+class TsvIssueWriter(IssueWriter):
+    """Writes issues as tab separated rows, with a column for each type of error context.
+
+    Tabs and newlines in the values are replaced with spaces.
+    """
+    CONTEXT_COLUMNS = (ErrorContext.CUSTOM_TITLE, ErrorContext.FILE_NAME, ErrorContext.SIDECAR_COLUMN_NAME,
+                       ErrorContext.SIDECAR_KEY_NAME, ErrorContext.ROW, ErrorContext.COLUMN, ErrorContext.HED_STRING)
+
+    def __init__(self, output=None, severity=None):
+        """Constructor for the TsvIssueWriter class.
+
+        Parameters
+        ----------
+        output: file object or None
+            An open text file to write to.  If None, the text is buffered and returned by pop_text.
+        severity: int or None
+            If present, only issues with this severity or lower(more severe) are written.
+        """
+        super().__init__(output, severity)
+        column_names = [context_type[len("ec_"):] for context_type in self.CONTEXT_COLUMNS]
+        self._write("\t".join(column_names + ['code', 'severity', 'message']) + "\n")
+
+    def _write_issue(self, issue):
+        row_values = []
+        for context_type in self.CONTEXT_COLUMNS:
+            context = issue.get(context_type)
+            row_values.append("" if context is None else self._get_tsv_value(context[0]))
+        row_values += [self._get_tsv_value(issue['code']), self._get_tsv_value(issue['severity']),
+                       self._get_tsv_value(issue['message'])]
+        self._write("\t".join(row_values) + "\n")
+
+    @staticmethod
+    def _get_tsv_value(value):
+        return str(value).replace('\r', ' ').replace('\n', ' ').replace('\t', ' ')
@@ -73,4 +73,11 @@ class DefinitionErrors:
     WRONG_NUMBER_PLACEHOLDER_TAGS = 'wrongNumberPlaceholderTags'
     DUPLICATE_DEFINITION = 'duplicateDefinition'
     TAG_IN_SCHEMA = 'defAlreadyInSchema'
-    INVALID_DEF_EXTENSION = 'invalidDefExtension'
\ No newline at end of file
+    INVALID_DEF_EXTENSION = 'invalidDefExtension'
+
+
+class IssueLimitErrors:
+    # Reported when an IssueBudget stops validation early or leaves out issues
+    ISSUE_LIMIT_REACHED = 'issueLimitReached'
+    ERROR_ROW_LIMIT_REACHED = 'errorRowLimitReached'
+    CODE_LIMIT_REACHED = 'issueCodeLimitReached'
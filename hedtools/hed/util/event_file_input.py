@@ -11,7 +11,8 @@ class EventFileInput(BaseFileInput):
     def __init__(self, filename=None, worksheet_name=None, tag_columns=None,
                  has_column_names=True, column_prefix_dictionary=None,
                  json_def_files=None, attribute_columns=None,
-                 def_dicts=None, csv_string=None):
+                 def_dicts=None, csv_string=None, stream_chunk_size=None,
+                 defer_definitions=False):
         """Constructor for the EventFileInput class.
 
         Parameters
@@ -42,6 +43,12 @@ class EventFileInput(BaseFileInput):
             If this is NOT passed, the class will instead gather definitions from any passed in ColumnDefGroups
         csv_string: str or None
             The data to treat as this file.  eg web services passing a string.
+        stream_chunk_size: int or None
+            If present, the file is read this many rows at a time on each pass instead of being loaded into memory.
+            Only applies to text files.
+        defer_definitions: bool
+            If True, the definitions in the file are gathered during the first pass over its rows, rather than by
+            reading the whole file up front.
         """
         if tag_columns is None:
             tag_columns = []
@@ -71,7 +78,8 @@ class EventFileInput(BaseFileInput):
                                   definition_mapper=def_mapper)
 
         super().__init__(filename, worksheet_name, has_column_names, new_mapper,
-                                  csv_string=csv_string)
+                                  csv_string=csv_string, stream_chunk_size=stream_chunk_size,
+                                  defer_definitions=defer_definitions)
 
         if not self._has_column_names:
             raise ValueError("You are attempting to open a bids style file with no column headers provided.\n"
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import urllib.request
 
 import json
@@ -27,6 +28,9 @@ DEFAULT_HED_LIST_VERSIONS_URL = """https://api.github.com/repos/hed-standard/hed
 HED_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../validator/hed_cache/')
 TIMESTAMP_FILENAME = "last_update.txt"
 CACHE_TIME_THRESHOLD = 300
+COMPILED_SCHEMA_EXTENSION = '.json'
+# Increment this whenever HedSchema.get_compiled_dict changes its format, so older compiled files are rebuilt.
+COMPILED_SCHEMA_FORMAT_VERSION = 2
 
 version_pattern = re.compile(HED_VERSION_FINAL)
 
@@ -328,6 +332,132 @@ def _get_latest_hed_xml_version_from_url(hed_base_url, get_specific_version=None
         return version, hed_versions[version]
 
 
+def is_in_cache_directory(filename, cache_folder=None):
+    """Checks if the given file is located in the hed cache directory.
+
+    Parameters
+    ----------
+    filename: str
+        The file to check.
+    cache_folder: str
+        The cache directory to check.  Defaults to HED_CACHE_DIRECTORY.
+    Returns
+    -------
+    bool
+        True if the file is directly inside the cache directory.
+    """
+    if not cache_folder:
+        cache_folder = HED_CACHE_DIRECTORY
+    file_folder = os.path.dirname(os.path.abspath(filename))
+    return os.path.normcase(os.path.realpath(file_folder)) == \
+        os.path.normcase(os.path.realpath(os.path.abspath(cache_folder)))
+
+
+def get_compiled_schema_filename(hed_xml_file, sha_hash, cache_folder=None):
+    """Returns the filename to store a compiled version of the given schema file in.
+
+    Parameters
+    ----------
+    hed_xml_file: str
+        The source schema file.
+    sha_hash: str
+        The hash of the source schema file from _calculate_sha1.
+    cache_folder: str
+        The directory to store compiled schemas in.  Defaults to HED_CACHE_DIRECTORY.
+    Returns
+    -------
+    str
+        The compiled schema filename, eg HED7.1.1.<sha_hash>.json
+    """
+    if not cache_folder:
+        cache_folder = HED_CACHE_DIRECTORY
+    base_name, _ = os.path.splitext(os.path.basename(hed_xml_file))
+    return os.path.join(cache_folder, f"{base_name}.{sha_hash}{COMPILED_SCHEMA_EXTENSION}")
+
+
+def load_compiled_schema(hed_xml_file, cache_folder=None):
+    """Loads the compiled version of a schema file, if there is a valid one.
+
+    Parameters
+    ----------
+    hed_xml_file: str
+        The source schema file.
+    cache_folder: str
+        The directory compiled schemas are stored in.  Defaults to HED_CACHE_DIRECTORY.
+    Returns
+    -------
+    hed_schema: HedSchema or None
+        The compiled schema.  None if there isn't one matching the current contents of hed_xml_file.
+    """
+    sha_hash = _calculate_sha1(hed_xml_file)
+    if sha_hash is None:
+        return None
+    from hed.schema.hed_schema import HedSchema
+    compiled_filename = get_compiled_schema_filename(hed_xml_file, sha_hash, cache_folder)
+    try:
+        with open(compiled_filename, 'r', encoding='utf-8') as f:
+            compiled_schema = json.load(f)
+        if compiled_schema.get('format_version') != COMPILED_SCHEMA_FORMAT_VERSION or \
+                compiled_schema.get('sha1') != sha_hash:
+            return None
+        return HedSchema.from_compiled_dict(compiled_schema['schema'])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # The file is missing, unreadable, or not in the current format.
+        return None
+
+
+def save_compiled_schema(hed_schema, hed_xml_file, cache_folder=None):
+    """Saves a compiled version of the schema loaded from hed_xml_file, replacing any older compiled versions.
+
+    Parameters
+    ----------
+    hed_schema: HedSchema
+        The schema loaded from hed_xml_file.
+    hed_xml_file: str
+        The source schema file.
+    cache_folder: str
+        The directory to store compiled schemas in.  Defaults to HED_CACHE_DIRECTORY.
+    Returns
+    -------
+    compiled_filename: str or None
+        The compiled schema filename on success, None on failure.
+    """
+    sha_hash = _calculate_sha1(hed_xml_file)
+    if sha_hash is None:
+        return None
+    compiled_filename = get_compiled_schema_filename(hed_xml_file, sha_hash, cache_folder)
+    compiled_folder, compiled_basename = os.path.split(compiled_filename)
+    compiled_schema = {'format_version': COMPILED_SCHEMA_FORMAT_VERSION,
+                       'sha1': sha_hash,
+                       'schema': hed_schema.get_compiled_dict()}
+    temp_filename = None
+    try:
+        os.makedirs(compiled_folder, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=compiled_folder, suffix=".tmp",
+                                         delete=False) as f:
+            temp_filename = f.name
+            json.dump(compiled_schema, f)
+        # Temporary files are only readable by their owner.  Use the mode the cached xml files get instead, so a
+        # shared cache folder works for everyone.
+        os.chmod(temp_filename, _get_default_file_mode())
+        os.replace(temp_filename, compiled_filename)
+    except (OSError, TypeError, ValueError):
+        if temp_filename and os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        return None
+
+    # Remove compiled versions of older contents of the same file.
+    stale_prefix = compiled_basename[:-len(COMPILED_SCHEMA_EXTENSION) - len(sha_hash)]
+    for filename in os.listdir(compiled_folder):
+        if filename.startswith(stale_prefix) and filename.endswith(COMPILED_SCHEMA_EXTENSION) \
+                and len(filename) == len(compiled_basename) and filename != compiled_basename:
+            try:
+                os.remove(os.path.join(compiled_folder, filename))
+            except OSError:
+                pass
+    return compiled_filename
+
+
 def _calculate_sha1(filename):
     try:
         with open(filename, 'rb') as f:
@@ -340,6 +470,21 @@ def _calculate_sha1(filename):
         return None
 
 
+def _get_default_file_mode():
+    """
+    Returns the permissions a newly created file gets, given the current umask.
+
+    Returns
+    -------
+    file_mode: int
+        The permission bits, eg 0o644 for a umask of 0o022.
+    """
+    # The umask can only be read by setting it.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 def _safe_copy_tmp_to_folder(temp_hed_xml_file, dest_filename):
     """
     Copies the schema file to destination folder, and renames it.
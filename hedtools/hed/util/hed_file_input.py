@@ -6,7 +6,8 @@ class HedFileInput(BaseFileInput):
     """A class to parse basic hed style spreadsheets into a more general format."""
     def __init__(self, filename=None, worksheet_name=None, tag_columns=None,
                  has_column_names=True, column_prefix_dictionary=None,
-                 definition_mapper=None, csv_string=None):
+                 definition_mapper=None, csv_string=None, stream_chunk_size=None,
+                 defer_definitions=False):
         """Constructor for the HedFileInput class.
 
         Parameters
@@ -30,6 +31,12 @@ class HedFileInput(BaseFileInput):
             The definition mapper to use to remove and replace definition labels in HED data.
         csv_string: str or None
             The data to treat as this file.  eg web services passing a string.
+        stream_chunk_size: int or None
+            If present, the file is read this many rows at a time on each pass instead of being loaded into memory.
+            Only applies to text files.
+        defer_definitions: bool
+            If True, the definitions in the file are gathered during the first pass over its rows, rather than by
+            reading the whole file up front.
         """
         if tag_columns is None:
             tag_columns = [2]
@@ -39,4 +46,5 @@ class HedFileInput(BaseFileInput):
         new_mapper = ColumnMapper(tag_columns=tag_columns, column_prefix_dictionary=column_prefix_dictionary,
                                   definition_mapper=definition_mapper)
         super().__init__(filename, worksheet_name, has_column_names, new_mapper,
-                                  csv_string=csv_string)
+                                  csv_string=csv_string, stream_chunk_size=stream_chunk_size,
+                                  defer_definitions=defer_definitions)
@@ -3,6 +3,7 @@ This module is used to split tags in a HED string.
 """
 
 from hed.util import hed_string_util
+from hed.util.stage_timer import ValidationStages, timed_stage
 
 
 class HedString:
@@ -24,17 +25,29 @@ class HedString:
         # The original hed string(all clean does is remove new lines)
         self.hed_string = self._clean_hed_string(hed_string)
 
+        string_scan = hed_string_util.scan_hed_string(hed_string)
+
         # This is a tree like structure containing the entire hed string
         try:
-            self._top_level_group = self.split_hed_string_into_groups(hed_string)
+            self._top_level_group = self.split_hed_string_into_groups(hed_string, string_scan.split_positions)
         except ValueError:
             self._top_level_group = None
 
+        # The basic syntax issues of the hed string, found in the same pass that split it.
+        string_scan.split_positions = None
+        self._string_scan = string_scan
+
+        # Incremented by the functions here that change the groups, so the cached lists below are recomputed.
+        self._structure_version = 0
+        # (structure version, top level group, all tags, all groups), see _get_all_tags_and_groups
+        self._flattened = None
+
     @staticmethod
     def create_from_other(hed_string_obj_list):
         hed_string = ",".join([hed_string_obj.hed_string for hed_string_obj in hed_string_obj_list])
         new_hed_string_obj = HedString("")
         new_hed_string_obj.hed_string = hed_string
+        new_hed_string_obj._string_scan = None
         children = []
         for hed_string_obj in hed_string_obj_list:
             children += hed_string_obj._top_level_group.get_direct_children()
@@ -42,6 +55,30 @@ class HedString:
 
         return new_hed_string_obj
 
+    @staticmethod
+    def create_from_group(hed_string, top_level_group):
+        """Creates a HedString from an already split top level group, rather than parsing hed_string.
+
+        Parameters
+        ----------
+        hed_string: str
+            The hed string the group was split from.
+        top_level_group: HedGroup
+            The top level group of hed_string, without parentheses.
+        Returns
+        -------
+        hed_string_obj: HedString
+            The new HedString.
+        """
+        # Skip __init__, as there's nothing left to parse.
+        new_hed_string_obj = HedString.__new__(HedString)
+        new_hed_string_obj.hed_string = HedString._clean_hed_string(hed_string)
+        new_hed_string_obj._string_scan = None
+        new_hed_string_obj._top_level_group = top_level_group
+        new_hed_string_obj._structure_version = 0
+        new_hed_string_obj._flattened = None
+        return new_hed_string_obj
+
     def get_all_groups(self):
         """
         Returns all tag groups, including the top level one with no parentheses
@@ -51,7 +88,7 @@ class HedString:
         group_list: [HedGroup]
             A list of all groups
         """
-        return self._top_level_group.get_all_groups()
+        return list(self._get_all_tags_and_groups()[1])
 
     def get_all_tags(self):
         """
@@ -62,7 +99,54 @@ class HedString:
         tag_list: [HedTag]
             A list of all tags
         """
-        return self._top_level_group.get_all_tags()
+        return list(self._get_all_tags_and_groups()[0])
+
+    def iter_all_groups(self):
+        """
+        Returns an iterator over all tag groups, including the top level one with no parentheses.
+
+            The groups are found as they are iterated, so the string must not be changed until it finishes.
+
+        Returns
+        -------
+        group_iterator: iterator over HedGroup
+            The groups in the same order as get_all_groups.
+        """
+        return self._top_level_group.iter_all_groups()
+
+    def iter_all_tags(self):
+        """
+        Returns an iterator over all tags, regardless of group level.
+
+            The tags are found as they are iterated, so the string must not be changed until it finishes.
+
+        Returns
+        -------
+        tag_iterator: iterator over HedTag
+            The tags in the same order as get_all_tags.
+        """
+        return self._top_level_group.iter_all_tags()
+
+    def _get_all_tags_and_groups(self):
+        """Returns the cached lists of all tags and all groups, recomputing them if the structure changed.
+
+            Only changes made with replace_tag and remove_groups are detected.  Changing a group directly
+            isn't, unless it replaces the top level group.
+
+        Returns
+        -------
+        tag_list: [HedTag]
+            All tags, regardless of group level.  This is the cached list, and must not be modified.
+        group_list: [HedGroup]
+            All groups, including the top level one.  This is the cached list, and must not be modified.
+        """
+        flattened = self._flattened
+        if flattened is None or flattened[0] != self._structure_version \
+                or flattened[1] is not self._top_level_group:
+            tag_list, group_list = self._top_level_group.get_all_tags_and_groups()
+            flattened = (self._structure_version, self._top_level_group, tag_list, group_list)
+            self._flattened = flattened
+        return flattened[2], flattened[3]
 
     def get_original_hed_string(self):
         """Gets the original input hed string.
@@ -74,6 +158,7 @@ class HedString:
         """
         return self.hed_string
 
+    @timed_stage(ValidationStages.CANONICAL_CONVERSION)
     def calculate_canonical_forms(self, hed_schema, error_handler=None):
         if not hed_schema.short_tag_mapping:
             return []
@@ -128,15 +213,50 @@ class HedString:
 
         for group in self.get_all_groups():
             group._children = [child for child in group._children if child not in remove_groups]
+        self._structure_version += 1
+
+    def replace_tag(self, tag_group, tag, new_contents):
+        """
+        Replaces a tag in one of the groups of this HedString with a new tag, list, or group
+
+        Parameters
+        ----------
+        tag_group : HedGroup
+            The group in this HedString that directly contains tag.
+        tag : HedTag
+            The tag to replace.  It must exist in tag_group or this will raise an error.
+        new_contents : HedTag or HedGroup or [HedTag or HedGroup]
+            What to replace the tag with.
+        """
+        tag_group.replace_tag(tag, new_contents)
+        self._structure_version += 1
+
+    def get_string_scan(self, hed_string):
+        """Returns the scan of the original string if it matches hed_string, so the scan can be reused in validation.
+
+        Parameters
+        ----------
+        hed_string: str
+            The string about to be validated, usually str(self).
+        Returns
+        -------
+        string_scan: HedStringScan or None
+            The scan made when this was parsed, or None if it was of a different string.
+        """
+        if self._string_scan is not None and self._string_scan.hed_string == hed_string:
+            return self._string_scan
+        return None
 
     @staticmethod
-    def split_hed_string_into_groups(hed_string):
+    def split_hed_string_into_groups(hed_string, input_tags=None):
         """Splits the hed_string into a tree of tag groups, tags, and delimiters.
 
         Parameters
         ----------
         hed_string
             A hed string consisting of tags and tag groups.
+        input_tags: [tuple]
+            The result of hed_string_util.split_hed_string for hed_string, if it has already been split.
         Returns
         -------
 
@@ -144,7 +264,8 @@ class HedString:
         # Stack variable while processing
         current_tag_group = [HedGroup(hed_string, include_paren=False)]
 
-        input_tags = hed_string_util.split_hed_string(hed_string)
+        if input_tags is None:
+            input_tags = hed_string_util.split_hed_string(hed_string)
         for is_hed_tag, (startpos, endpos) in input_tags:
             if is_hed_tag:
                 new_tag = HedTag(hed_string, (startpos, endpos))
@@ -207,6 +328,8 @@ class HedTag:
     """
         A single HedTag in a string, keeps track of original value and positioning
     """
+    __slots__ = ('_hed_string', 'span', '_tag', '_long_tag', '_short_tag_index')
+
     def __init__(self, hed_string, span):
         """
 
@@ -307,6 +430,8 @@ class HedGroup:
     """
         A single HedGroup in a string, containing HedTags and HedGroups
     """
+    __slots__ = ('_children', '_startpos', '_endpos', '_include_paren', '_hed_string')
+
     def __init__(self, hed_string="", startpos=None, endpos=None, include_paren=True,
                  contents=None):
         """
@@ -338,6 +463,9 @@ class HedGroup:
         """
         Add a tag or group to this group.
 
+            This is for building groups.  A HedString that already holds this group won't see the new child in its
+            cached lists.
+
         Parameters
         ----------
         new_tag_or_group : HedTag or HedGroup
@@ -374,17 +502,7 @@ class HedGroup:
         tag_list: [HedTag]
             The list of all tags in this group, including descendants.
         """
-        node_list = [self]
-        final_list = []
-
-        # Using an iterator is worse performance wise here.
-        while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = current_group_or_tag._children + node_list
-            else:
-                final_list.append(current_group_or_tag)
-        return final_list
+        return self.get_all_tags_and_groups()[0]
 
     def get_all_groups(self):
         """
@@ -395,17 +513,72 @@ class HedGroup:
         group_list: [HedGroup]
             The list of all HedGroups in this group, including descendants and self.
         """
-        node_list = [self]
-        final_list = []
+        return self.get_all_tags_and_groups()[1]
 
-        # Using an iterator is worse performance wise here.
-        while node_list:
-            current_group_or_tag = node_list.pop(0)
-            if isinstance(current_group_or_tag, HedGroup):
-                node_list = current_group_or_tag._children + node_list
-                final_list.append(current_group_or_tag)
+    def get_all_tags_and_groups(self):
+        """
+        Returns all the tags and all the HedGroups in a single walk of this group.
 
-        return final_list
+        Returns
+        -------
+        tag_list: [HedTag]
+            The list of all tags in this group, including descendants.
+        group_list: [HedGroup]
+            The list of all HedGroups in this group, including descendants and self.
+        """
+        tag_list = []
+        group_list = [self]
+        # The children of each group being walked, innermost last
+        child_iterators = [iter(self._children)]
+        while child_iterators:
+            for child in child_iterators[-1]:
+                if isinstance(child, HedGroup):
+                    group_list.append(child)
+                    child_iterators.append(iter(child._children))
+                    break
+                tag_list.append(child)
+            else:
+                child_iterators.pop()
+        return tag_list, group_list
+
+    def iter_all_tags(self):
+        """
+        Returns an iterator over all the tags, including descendants.
+
+        Returns
+        -------
+        tag_iterator: iterator over HedTag
+            The tags in the same order as get_all_tags.
+        """
+        child_iterators = [iter(self._children)]
+        while child_iterators:
+            for child in child_iterators[-1]:
+                if isinstance(child, HedGroup):
+                    child_iterators.append(iter(child._children))
+                    break
+                yield child
+            else:
+                child_iterators.pop()
+
+    def iter_all_groups(self):
+        """
+        Returns an iterator over all the HedGroups, including descendants and self.
+
+        Returns
+        -------
+        group_iterator: iterator over HedGroup
+            The groups in the same order as get_all_groups.
+        """
+        yield self
+        child_iterators = [iter(self._children)]
+        while child_iterators:
+            for child in child_iterators[-1]:
+                if isinstance(child, HedGroup):
+                    yield child
+                    child_iterators.append(iter(child._children))
+                    break
+            else:
+                child_iterators.pop()
 
     def tags(self):
         """
@@ -453,6 +626,8 @@ class HedGroup:
     def replace_tag(self, tag, new_contents):
         """ Replaces an existing tag in the group with a new tag, list, or group
 
+            Use HedString.replace_tag instead for a group in a HedString, so it knows the group changed.
+
         Parameters
         ----------
         tag : HedTag
@@ -0,0 +1,322 @@
+"""
+This module stores the parsed structure of many hed strings in flat arrays, rather than as HedTag and HedGroup objects.
+
+Each tag and group in a string is an item, stored in the order it appears in the string.  Items only become
+HedString, HedTag and HedGroup objects when get_hed_string is called for that string.
+"""
+from array import array
+from bisect import bisect_left
+
+from hed.util import hed_string_util
+from hed.util.hed_string import HedString, HedGroup, HedTag
+
+
+class HedStringArrays:
+    """The tags and groups of a list of hed strings, stored as spans, parents and depths in flat arrays."""
+
+    def __init__(self, hed_strings=None):
+        """Constructor for the HedStringArrays class.
+
+        Parameters
+        ----------
+        hed_strings: [str]
+            The hed strings to parse and add.
+        """
+        self._hed_strings = []
+        # The items of string n are _item_offsets[n] to _item_offsets[n + 1].
+        self._item_offsets = array('l', [0])
+        self._parsed = array('b')
+        self._item_is_group = array('b')
+        self._item_starts = array('l')
+        self._item_ends = array('l')
+        # The index of the enclosing group item, relative to the first item of the string.  -1 for the top level.
+        self._item_parents = array('l')
+        self._item_depths = array('l')
+        # The positions of each # in a string, by string index.  Only found for strings used as templates.
+        self._placeholder_positions = {}
+        if hed_strings:
+            for hed_string in hed_strings:
+                self.append(hed_string)
+
+    def append(self, hed_string, split_positions=None):
+        """Parses a hed string and adds it to the end of the arrays.
+
+        Parameters
+        ----------
+        hed_string: str
+            The hed string to add.
+        split_positions: [tuple]
+            The result of hed_string_util.split_hed_string for hed_string, if it has already been split.
+        Returns
+        -------
+        string_index: int
+            The index of the new string.
+        """
+        if split_positions is None:
+            split_positions = hed_string_util.split_hed_string(hed_string)
+
+        item_is_group = []
+        item_starts = []
+        item_ends = []
+        item_parents = []
+        item_depths = []
+        # The item index of each open group, and the innermost one.
+        open_groups = []
+        parent = -1
+        parsed = True
+        for is_hed_tag, (startpos, endpos) in split_positions:
+            if is_hed_tag:
+                item_is_group.append(0)
+                item_starts.append(startpos)
+                item_ends.append(endpos)
+                item_parents.append(parent)
+                item_depths.append(len(open_groups))
+                continue
+
+            string_portion = hed_string[startpos:endpos]
+            delimiter_index = len(string_portion) - len(string_portion.lstrip())
+            if delimiter_index == len(string_portion):
+                delimiter_index = 0
+            delimiter_char = string_portion[delimiter_index]
+            if delimiter_char == HedString.OPENING_GROUP_CHARACTER:
+                item_is_group.append(1)
+                item_starts.append(startpos + delimiter_index)
+                item_ends.append(-1)
+                item_parents.append(parent)
+                item_depths.append(len(open_groups))
+                parent = len(item_starts) - 1
+                open_groups.append(parent)
+            elif delimiter_char == HedString.CLOSING_GROUP_CHARACTER:
+                if not open_groups:
+                    parsed = False
+                    break
+                item_ends[open_groups.pop()] = startpos + delimiter_index + 1
+                parent = open_groups[-1] if open_groups else -1
+
+        if parsed and not open_groups:
+            self._item_is_group.extend(item_is_group)
+            self._item_starts.extend(item_starts)
+            self._item_ends.extend(item_ends)
+            self._item_parents.extend(item_parents)
+            self._item_depths.extend(item_depths)
+        else:
+            parsed = False
+
+        self._hed_strings.append(hed_string)
+        self._parsed.append(parsed)
+        self._item_offsets.append(len(self._item_starts))
+        return len(self._hed_strings) - 1
+
+    def __len__(self):
+        return len(self._hed_strings)
+
+    def __getitem__(self, string_index):
+        return self.get_hed_string(string_index)
+
+    def get_original_hed_string(self, string_index):
+        """Returns the hed string at string_index, as it was added."""
+        return self._hed_strings[string_index]
+
+    def is_parsed(self, string_index):
+        """Returns False if the string at string_index couldn't be split into groups, due to unmatched parentheses."""
+        return bool(self._parsed[string_index])
+
+    def get_tag_spans(self, string_index):
+        """Returns the spans of all tags in a string, regardless of group level.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        Returns
+        -------
+        tag_spans: [(int, int)]
+            The start and end index of each tag in the original string, in order.
+        """
+        first_item, last_item = self._item_offsets[string_index], self._item_offsets[string_index + 1]
+        item_starts = self._item_starts
+        item_ends = self._item_ends
+        return [(item_starts[i], item_ends[i]) for i in range(first_item, last_item) if not self._item_is_group[i]]
+
+    def get_tag_strings(self, string_index):
+        """Returns the text of all tags in a string, regardless of group level.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        Returns
+        -------
+        tags: [str]
+            The text of each tag in the original string, in order.
+        """
+        hed_string = self._hed_strings[string_index]
+        return [hed_string[start:end] for start, end in self.get_tag_spans(string_index)]
+
+    def get_group_spans(self, string_index):
+        """Returns the spans and depths of all parenthesized groups in a string.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        Returns
+        -------
+        group_spans: [((int, int), int)]
+            The span of each group including the parentheses, and how many groups enclose it.
+        """
+        first_item, last_item = self._item_offsets[string_index], self._item_offsets[string_index + 1]
+        return [((self._item_starts[i], self._item_ends[i]), self._item_depths[i])
+                for i in range(first_item, last_item) if self._item_is_group[i]]
+
+    def get_str(self, string_index):
+        """Returns the same text as str(HedString) for the string, without creating the tag or group objects.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        Returns
+        -------
+        hed_string: str
+            The string rejoined from its tags and groups.
+        """
+        hed_string = self._hed_strings[string_index]
+        if not self._parsed[string_index]:
+            return HedString._clean_hed_string(hed_string)
+
+        pieces = []
+        # Whether the group at each open level has had a child added yet.
+        level_has_children = [False]
+        for i in range(self._item_offsets[string_index], self._item_offsets[string_index + 1]):
+            depth = self._item_depths[i]
+            while len(level_has_children) > depth + 1:
+                level_has_children.pop()
+                pieces.append(")")
+            if level_has_children[-1]:
+                pieces.append(",")
+            level_has_children[-1] = True
+            if self._item_is_group[i]:
+                pieces.append("(")
+                level_has_children.append(False)
+            else:
+                pieces.append(hed_string[self._item_starts[i]:self._item_ends[i]])
+        pieces.append(")" * (len(level_has_children) - 1))
+        return "".join(pieces)
+
+    def get_hed_string(self, string_index, placeholder_value=None):
+        """Creates the HedString for a string, building its tags and groups from the arrays without reparsing.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        placeholder_value: str or None
+            If present, each # in the string is replaced with this.
+        Returns
+        -------
+        hed_string_obj: HedString
+            The parsed string, equivalent to HedString(original string) with any # replaced.
+        """
+        hed_string = self._replace_placeholder(string_index, placeholder_value)
+        if not self._parsed[string_index] or not self._can_splice(placeholder_value):
+            return HedString(hed_string)
+
+        return HedString.create_from_group(hed_string,
+                                           self._build_top_level_group(string_index, hed_string, placeholder_value))
+
+    def get_hed_group(self, string_index, placeholder_value=None):
+        """Creates the top level group for a string, building its tags and groups from the arrays without reparsing.
+
+            raises ValueError if the string cannot be split into groups.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        placeholder_value: str or None
+            If present, each # in the string is replaced with this.
+        Returns
+        -------
+        top_level_group: HedGroup
+            The group without parentheses containing the whole string, equivalent to
+            HedString.split_hed_string_into_groups(original string) with any # replaced.
+        """
+        hed_string = self._replace_placeholder(string_index, placeholder_value)
+        if not self._parsed[string_index] or not self._can_splice(placeholder_value):
+            return HedString.split_hed_string_into_groups(hed_string)
+
+        return self._build_top_level_group(string_index, hed_string, placeholder_value)
+
+    def _replace_placeholder(self, string_index, placeholder_value):
+        """Returns the string at string_index with each # replaced by placeholder_value, if there is one."""
+        hed_string = self._hed_strings[string_index]
+        if placeholder_value is not None:
+            hed_string = hed_string.replace("#", placeholder_value)
+        return hed_string
+
+    @staticmethod
+    def _can_splice(placeholder_value):
+        """Returns False if replacing # with placeholder_value could change how the string splits.
+
+            This is the case if it is empty, has a delimiter or starts or ends with a space(which is trimmed from tags).
+        """
+        if placeholder_value is None:
+            return True
+        return bool(placeholder_value) and placeholder_value[0] != " " and placeholder_value[-1] != " " \
+            and not any(char in placeholder_value for char in ",()")
+
+    def _build_top_level_group(self, string_index, hed_string, placeholder_value):
+        """Builds the tags and groups of a parsed string from the arrays.
+
+        Parameters
+        ----------
+        string_index: int
+            The index of the string.
+        hed_string: str
+            The string the new tags and groups are in, with any # already replaced by placeholder_value.
+        placeholder_value: str or None
+            The value replacing each #.  The spans after each # are shifted by the difference in length.
+        Returns
+        -------
+        top_level_group: HedGroup
+            The group without parentheses containing the whole string.
+        """
+        placeholder_positions = None
+        shift = 0
+        if placeholder_value is not None:
+            placeholder_positions = self._get_placeholder_positions(string_index)
+            shift = len(placeholder_value) - 1
+        if not placeholder_positions:
+            shift = 0
+
+        first_item, last_item = self._item_offsets[string_index], self._item_offsets[string_index + 1]
+        top_level_group = HedGroup(hed_string, include_paren=False)
+        # The new item for each item of the string, with the top level group last so a parent of -1 finds it.
+        items = [None] * (last_item - first_item) + [top_level_group]
+        for i, is_group, startpos, endpos, parent in zip(range(last_item - first_item),
+                                                         self._item_is_group[first_item:last_item],
+                                                         self._item_starts[first_item:last_item],
+                                                         self._item_ends[first_item:last_item],
+                                                         self._item_parents[first_item:last_item]):
+            if shift:
+                startpos += shift * bisect_left(placeholder_positions, startpos)
+                endpos += shift * bisect_left(placeholder_positions, endpos)
+            if is_group:
+                new_item = HedGroup(hed_string, startpos, endpos)
+            else:
+                new_item = HedTag(hed_string, (startpos, endpos))
+            items[i] = new_item
+            # These are all new groups, so nothing cached depends on their structure yet.
+            items[parent]._children.append(new_item)
+
+        return top_level_group
+
+    def _get_placeholder_positions(self, string_index):
+        """Returns the sorted indexes of each # in the string at string_index, finding them the first time."""
+        placeholder_positions = self._placeholder_positions.get(string_index)
+        if placeholder_positions is None:
+            placeholder_positions = [index for index, char in enumerate(self._hed_strings[string_index])
+                                     if char == "#"]
+            self._placeholder_positions[string_index] = placeholder_positions
+        return placeholder_positions
@@ -1,9 +1,159 @@
+import re
+
+from hed.util.error_types import ValidationErrors
+from hed.util.stage_timer import ValidationStages, timed_stage
+
+INVALID_STRING_CHARS = '[]{}~'
+
+# Each match is a single delimiter, or a tag running from its first to its last character that isn't a space
+_token_pattern = re.compile(r"[,()]|[^,() ](?:[^,()]*[^,() ])?")
+_invalid_char_patterns = {}
+
+
+class HedStringScan:
+    """The results of a single pass over a hed string, see scan_hed_string."""
+    __slots__ = ('hed_string', 'split_positions', 'invalid_characters', 'opening_parentheses_count',
+                 'closing_parentheses_count', 'delimiter_issues')
+
+    def __init__(self, hed_string):
+        """Constructor for the HedStringScan class.
+
+        Parameters
+        ----------
+        hed_string: str
+            The hed string that was scanned.
+        """
+        self.hed_string = hed_string
+        # The (is_hed_tag, (start_pos, end_pos)) tuples from splitting the string, see split_hed_string
+        self.split_positions = []
+        # (index, character) for each invalid character found
+        self.invalid_characters = []
+        self.opening_parentheses_count = 0
+        self.closing_parentheses_count = 0
+        # (error_type, kwargs) for each empty tag or missing comma found, in order
+        self.delimiter_issues = []
+
+
+def _get_invalid_char_pattern(invalid_chars):
+    """Returns a compiled pattern matching any one of invalid_chars."""
+    pattern = _invalid_char_patterns.get(invalid_chars)
+    if pattern is None:
+        pattern = re.compile("[" + re.escape(invalid_chars) + "]")
+        _invalid_char_patterns[invalid_chars] = pattern
+    return pattern
+
+
+@timed_stage(ValidationStages.TOKENIZE)
+def scan_hed_string(hed_string, invalid_chars=INVALID_STRING_CHARS, check_syntax=True):
+    """
+    Splits a hed string into delimiters and tags, checking its basic syntax in the same pass.
+
+    This finds invalid characters, counts the parentheses and finds empty tags and missing commas, the
+    checks done by TagValidator.run_hed_string_validators.
+
+    Parameters
+    ----------
+        hed_string: str
+            the hed string to scan
+        invalid_chars: str
+            the characters that are not allowed anywhere in a hed string
+        check_syntax: bool
+            If False, only split the string and leave the syntax issue fields empty.
+    Returns
+    -------
+    HedStringScan
+        The split positions of the string along with any syntax problems found.
+    """
+    scan = HedStringScan(hed_string)
+    if check_syntax:
+        if invalid_chars:
+            scan.invalid_characters = [(match.start(), match.group())
+                                       for match in _get_invalid_char_pattern(invalid_chars).finditer(hed_string)]
+        scan.opening_parentheses_count = hed_string.count("(")
+        scan.closing_parentheses_count = hed_string.count(")")
+    delimiter_issues = scan.delimiter_issues
+
+    # Delimiter check state.  The current tag runs from current_tag_start to the current position.
+    check_delimiters = check_syntax
+    last_non_empty_valid_character = ''
+    last_non_empty_valid_index = 0
+    current_tag_start = 0
+    current_tag_has_content = False
+
+    # Split state.  last_end_pos is the start of the current delimiter, and after_tag is True if a tag just ended.
+    result_positions = scan.split_positions
+    last_end_pos = 0
+    after_tag = False
+    for token in _token_pattern.finditer(hed_string):
+        start, end = token.span()
+        text = token.group()
+        if text not in ",()":
+            if check_delimiters:
+                # Only whitespace other than spaces counts as part of a tag when splitting, but not as content.
+                stripped_text = text.strip()
+                if stripped_text:
+                    if last_non_empty_valid_character == ")":
+                        delimiter_issues.append((ValidationErrors.COMMA_MISSING, {
+                            'tag': hed_string[current_tag_start:start + len(text) - len(text.lstrip())]}))
+                        check_delimiters = False
+                    else:
+                        current_tag_has_content = True
+                        last_non_empty_valid_character = stripped_text[-1]
+                        last_non_empty_valid_index = start + len(text.rstrip()) - 1
+
+            if last_end_pos != start:
+                result_positions.append((False, (last_end_pos, start)))
+            result_positions.append((True, (start, end)))
+            last_end_pos = end
+            after_tag = True
+            continue
+
+        if text == "(":
+            if check_delimiters:
+                if not current_tag_has_content:
+                    current_tag_start = end
+                else:
+                    delimiter_issues.append((ValidationErrors.COMMA_MISSING,
+                                             {'tag': hed_string[current_tag_start:end]}))
+                last_non_empty_valid_character = text
+                last_non_empty_valid_index = start
+        elif text == ")":
+            if check_delimiters:
+                current_tag_has_content = True
+                last_non_empty_valid_character = text
+                last_non_empty_valid_index = start
+        elif check_delimiters:
+            if not current_tag_has_content:
+                delimiter_issues.append((ValidationErrors.EMPTY_TAG, {'character': text, 'index': start}))
+            else:
+                last_non_empty_valid_character = text
+                last_non_empty_valid_index = start
+            current_tag_start = end
+            current_tag_has_content = False
+
+        # The first delimiter after a tag extends the delimiter back to the end of the tag.
+        if after_tag:
+            after_tag = False
+        else:
+            if last_end_pos != start:
+                result_positions.append((False, (last_end_pos, start)))
+            last_end_pos = start
+
+    if last_end_pos != len(hed_string):
+        result_positions.append((False, (last_end_pos, len(hed_string))))
+
+    if last_non_empty_valid_character == ",":
+        delimiter_issues.append((ValidationErrors.EMPTY_TAG, {'character': last_non_empty_valid_character,
+                                                              'index': last_non_empty_valid_index}))
+    return scan
+
 
 def split_hed_string(hed_string):
     """
     Takes a hed string and splits it into delimiters and tags
 
-    Note: This does not validate tags or delimiters in any form.
+    Note: This does not validate tags or delimiters in any form.  See scan_hed_string to also check the basic
+    syntax of the string in the same pass.
 
     Parameters
     ----------
@@ -20,54 +170,7 @@ def split_hed_string(hed_string):
         end_pos: int
             index of end of string in hed_string
     """
-    tag_delimiters = ",()"
-    current_spacing = 0
-    found_symbol = True
-    result_positions = []
-    tag_start_pos = None
-    last_end_pos = 0
-    for i, char in enumerate(hed_string):
-        if char == " ":
-            current_spacing += 1
-            continue
-
-        if char in tag_delimiters:
-            if found_symbol:
-                # view_string = hed_string[last_end_pos: i]
-                if last_end_pos != i:
-                    result_positions.append((False, (last_end_pos, i)))
-                last_end_pos = i
-            elif not found_symbol:
-                found_symbol = True
-                last_end_pos = i - current_spacing
-                # view_string = hed_string[tag_start_pos: last_end_pos]
-                result_positions.append((True, (tag_start_pos, last_end_pos)))
-                current_spacing = 0
-                tag_start_pos = None
-            continue
-
-        # If we have a current delimiter, end it here.
-        if found_symbol and last_end_pos is not None:
-            # view_string = hed_string[last_end_pos: i]
-            if last_end_pos != i:
-                result_positions.append((False, (last_end_pos, i)))
-            last_end_pos = None
-
-        found_symbol = False
-        current_spacing = 0
-        if tag_start_pos is None:
-            tag_start_pos = i
-
-    if last_end_pos is not None and len(hed_string) != last_end_pos:
-        # view_string = hed_string[last_end_pos: len(hed_string)]
-        result_positions.append((False, (last_end_pos, len(hed_string))))
-    if tag_start_pos is not None:
-        # view_string = hed_string[tag_start_pos: len(hed_string)]
-        result_positions.append((True, (tag_start_pos, len(hed_string) - current_spacing)))
-        if current_spacing:
-            result_positions.append((False, (len(hed_string) - current_spacing, len(hed_string))))
-
-    return result_positions
+    return scan_hed_string(hed_string, check_syntax=False).split_positions
 
 
 def split_hed_string_return_tags(hed_string):
@@ -0,0 +1,106 @@
+"""
+This module contains IssueBudget, which limits how many issues validation reports before stopping.
+
+Pass one to HedValidator.validate_input so a badly mismatched file stops early, rather than reporting the same
+errors for every row.
+"""
+from collections import Counter
+
+from hed.util.error_types import IssueLimitErrors
+
+
+class IssueBudget:
+    """Limits on the number of issues to report, and counts of the issues reported so far.
+
+    The counts carry over between calls, so one budget can limit several strings or files together.
+    """
+
+    def __init__(self, max_issues=None, max_issues_per_code=None, max_error_rows=None):
+        """Constructor for the IssueBudget class.
+
+        Parameters
+        ----------
+        max_issues: int or None
+            Stop validating once this many issues have been reported.
+        max_issues_per_code: int or None
+            Leave out any issues of an error code after this many have been reported.  Validation continues.
+        max_error_rows: int or None
+            Stop validating once this many rows or strings have had issues.
+        """
+        self.max_issues = max_issues
+        self.max_issues_per_code = max_issues_per_code
+        self.max_error_rows = max_error_rows
+        self.issue_count = 0
+        self.error_row_count = 0
+        self.code_counts = Counter()
+        # The IssueLimitErrors value of the limit that stopped validation, or None.
+        self.exhausted_by = None
+        # Issues left out per error code, that haven't been reported by get_truncation_issues yet.
+        self._omitted_code_counts = Counter()
+        self._exhausted_reported = False
+
+    @property
+    def exhausted(self):
+        """True once validation should stop."""
+        return self.exhausted_by is not None
+
+    def add_issues(self, issues):
+        """Counts the issues found in a single row or string.
+
+        Parameters
+        ----------
+        issues: [{}]
+            The issues found.
+        Returns
+        -------
+        kept_issues: [{}]
+            The issues that fit in the budget, in the same order.
+        """
+        if not issues or self.exhausted:
+            return []
+
+        kept_issues = []
+        for issue in issues:
+            code = issue['code']
+            if self.max_issues_per_code is not None and self.code_counts[code] >= self.max_issues_per_code:
+                self._omitted_code_counts[code] += 1
+                continue
+            self.code_counts[code] += 1
+            self.issue_count += 1
+            kept_issues.append(issue)
+            if self.max_issues is not None and self.issue_count >= self.max_issues:
+                self.exhausted_by = IssueLimitErrors.ISSUE_LIMIT_REACHED
+                break
+
+        self.error_row_count += 1
+        if not self.exhausted and self.max_error_rows is not None and self.error_row_count >= self.max_error_rows:
+            self.exhausted_by = IssueLimitErrors.ERROR_ROW_LIMIT_REACHED
+        return kept_issues
+
+    def get_truncation_issues(self, error_handler):
+        """Returns issues describing what the budget left out since the last call.
+
+        Parameters
+        ----------
+        error_handler: ErrorHandler
+            Used to format the issues, in its current error context.
+        Returns
+        -------
+        truncation_issues: [HedIssue]
+            A CODE_LIMIT_REACHED issue for each error code with issues left out, then an ISSUE_LIMIT_REACHED or
+            ERROR_ROW_LIMIT_REACHED issue the first time the budget stops validation.
+        """
+        truncation_issues = []
+        for code, omitted_count in self._omitted_code_counts.items():
+            truncation_issues += error_handler.format_issue_limit_error(IssueLimitErrors.CODE_LIMIT_REACHED,
+                                                                        self.max_issues_per_code, code,
+                                                                        omitted_count)
+        self._omitted_code_counts = Counter()
+        if self.exhausted and not self._exhausted_reported:
+            self._exhausted_reported = True
+            if self.exhausted_by == IssueLimitErrors.ISSUE_LIMIT_REACHED:
+                limit = self.max_issues
+            else:
+                limit = self.max_error_rows
+            truncation_issues += error_handler.format_issue_limit_error(self.exhausted_by, limit)
+        return truncation_issues
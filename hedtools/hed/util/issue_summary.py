@@ -0,0 +1,146 @@
+"""
+This module contains IssueSummary, which counts validation issues without keeping or formatting them.
+
+Pass one to HedValidator.validate_input to summarize a file, or add issues to it directly.
+"""
+import random
+from collections import Counter
+
+from hed.util.error_types import ErrorContext, ErrorSeverity
+
+
+class IssueSummary:
+    """Counts issues by error code, severity, file, column and tag, and keeps a bounded random sample of them.
+
+    Memory use doesn't depend on the number of issues.  Only the most common tags are kept once there are more than
+    max_tags distinct ones, so the tag counts are a lower bound after that.  Likewise the rows seen are forgotten once
+    there are more than max_rows of them, so a row can be counted again after that.
+    """
+    DEFAULT_MAX_EXAMPLES = 20
+    DEFAULT_MAX_TAGS = 1000
+    DEFAULT_MAX_ROWS = 100000
+
+    def __init__(self, max_examples=DEFAULT_MAX_EXAMPLES, max_tags=DEFAULT_MAX_TAGS, max_rows=DEFAULT_MAX_ROWS,
+                 seed=None):
+        """Constructor for the IssueSummary class.
+
+        Parameters
+        ----------
+        max_examples: int
+            The number of issues to keep as examples, sampled evenly from all the issues added.
+        max_tags: int
+            The maximum number of distinct tags to count.
+        max_rows: int
+            The maximum number of distinct rows to remember when counting rows with issues.
+        seed: int or None
+            The random seed used to pick the examples.
+        """
+        self.max_examples = max_examples
+        self.max_tags = max_tags
+        self.max_rows = max_rows
+        self.issue_count = 0
+        # The number of distinct rows with issues, counting each file's rows separately.
+        self.row_count = 0
+        self.code_counts = Counter()
+        self.severity_counts = Counter()
+        self.file_counts = Counter()
+        self.column_counts = Counter()
+        self.tag_counts = Counter()
+        # True once tags have been dropped from tag_counts to stay within max_tags.
+        self.tags_truncated = False
+        # True once the rows seen have been forgotten to stay within max_rows, so row_count is an upper bound.
+        self.rows_truncated = False
+        self.examples = []
+        self._random = random.Random(seed)
+        self._seen_rows = set()
+
+    def add_issue(self, issue):
+        """Counts a single issue.  The issue message is never read.
+
+        Parameters
+        ----------
+        issue: {}
+            An issue returned from one of the ErrorHandler format functions.
+        """
+        self.issue_count += 1
+        self.code_counts[issue['code']] += 1
+        self.severity_counts[issue['severity']] += 1
+
+        file_context = issue.get(ErrorContext.FILE_NAME)
+        filename = file_context[0] if file_context else None
+        if filename is not None:
+            self.file_counts[filename] += 1
+        column_context = issue.get(ErrorContext.COLUMN)
+        if column_context:
+            self.column_counts[column_context[0]] += 1
+        row_context = issue.get(ErrorContext.ROW)
+        if row_context:
+            self._add_row((filename, row_context[0]))
+
+        tag = getattr(issue, 'tag', None) or issue.get('source_tag')
+        if tag:
+            self._add_tag(tag)
+        self._add_example(issue)
+
+    def add_issues(self, issues):
+        """Counts each issue from a list or iterator of issues.
+
+        Parameters
+        ----------
+        issues: iterable of {}
+            The issues to count.
+        """
+        for issue in issues:
+            self.add_issue(issue)
+
+    def get_summary_dict(self, top_count=10):
+        """Returns the counts as a dictionary of basic types, suitable for converting to JSON.
+
+        Parameters
+        ----------
+        top_count: int
+            The number of files, columns and tags to list, from most to least common.
+        Returns
+        -------
+        summary: {}
+            Contains the keys issue_count, error_count, warning_count, row_count, rows_truncated, code_counts,
+            top_files, top_columns, top_tags, tags_truncated and examples.
+        """
+        return {'issue_count': self.issue_count,
+                'error_count': self.severity_counts[ErrorSeverity.ERROR],
+                'warning_count': self.severity_counts[ErrorSeverity.WARNING],
+                'row_count': self.row_count,
+                'rows_truncated': self.rows_truncated,
+                'code_counts': dict(self.code_counts.most_common()),
+                'top_files': self.file_counts.most_common(top_count),
+                'top_columns': self.column_counts.most_common(top_count),
+                'top_tags': self.tag_counts.most_common(top_count),
+                'tags_truncated': self.tags_truncated,
+                'examples': [{'code': issue['code'], 'message': issue['message']} for issue in self.examples]}
+
+    def _add_tag(self, tag):
+        tag_counts = self.tag_counts
+        if tag not in tag_counts and len(tag_counts) >= self.max_tags:
+            # Keep the more common half, so dropping tags is rare.
+            self.tag_counts = tag_counts = Counter(dict(tag_counts.most_common(self.max_tags // 2)))
+            self.tags_truncated = True
+        tag_counts[tag] += 1
+
+    def _add_row(self, row):
+        seen_rows = self._seen_rows
+        if row in seen_rows:
+            return
+        if len(seen_rows) >= self.max_rows:
+            seen_rows.clear()
+            self.rows_truncated = True
+        seen_rows.add(row)
+        self.row_count += 1
+
+    def _add_example(self, issue):
+        # Reservoir sampling, so every issue added is equally likely to be an example.
+        if len(self.examples) < self.max_examples:
+            self.examples.append(issue)
+            return
+        example_index = self._random.randrange(self.issue_count)
+        if example_index < self.max_examples:
+            self.examples[example_index] = issue
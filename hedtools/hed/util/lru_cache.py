@@ -0,0 +1,87 @@
+"""
+This module contains a small bounded least recently used cache with hit and miss counters.
+"""
+from collections import OrderedDict
+
+
+class LRUCache:
+    """A dictionary like cache that discards the least recently used entry once it reaches max_size."""
+
+    def __init__(self, max_size=4096):
+        """Constructor for the LRUCache class.
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of entries to keep.  If this is 0 or less, nothing is stored.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """Returns the entry for key, marking it as the most recently used.
+
+        Parameters
+        ----------
+        key: hashable
+            The key to look up.
+        default: object
+            Returned if key is not in the cache.
+        Returns
+        -------
+        value: object
+            The cached value, or default if not found.
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Adds or replaces an entry, evicting the least recently used entry if the cache is full.
+
+        Parameters
+        ----------
+        key: hashable
+            The key to store the value under.
+        value: object
+            The value to store.
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Removes all entries and resets the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_stats(self):
+        """Returns a dictionary describing the current cache usage.
+
+        Returns
+        -------
+        stats: {}
+            Contains the keys hits, misses, evictions, size and max_size.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self._entries), 'max_size': self.max_size}
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
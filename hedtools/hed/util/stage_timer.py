@@ -0,0 +1,122 @@
+"""
+This module contains StageTimer, which records the time spent in each stage of validation.
+
+Timing is off unless a StageTimer is active in the current thread, either by setting HedValidator.stage_timer or with
+StageTimer.activate.  While off, each timed function only pays for one extra function call.
+"""
+import functools
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+class ValidationStages:
+    TOKENIZE = 'tokenize'
+    STRING_CHECKS = 'string_checks'
+    CANONICAL_CONVERSION = 'canonical_conversion'
+    TAG_CHECKS = 'tag_checks'
+    TAG_LEVEL_CHECKS = 'tag_level_checks'
+    INDIVIDUAL_TAG_CHECKS = 'individual_tag_checks'
+    GROUP_CHECKS = 'group_checks'
+    DEFINITION_EXPANSION = 'definition_expansion'
+    ROW_EXPANSION = 'row_expansion'
+
+
+# The number of threads with an active timer, checked first so timing costs nothing extra when it's off everywhere.
+_active_timer_count = 0
+_active_timer_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+class StageTimer:
+    """Cumulative time and call counts for each validation stage.
+
+    Stages can be nested, so the times overlap.  For example, row expansion includes tokenizing the expanded strings.
+    """
+
+    def __init__(self):
+        """Constructor for the StageTimer class."""
+        self.stage_seconds = Counter()
+        self.stage_counts = Counter()
+
+    def add_time(self, stage, seconds):
+        """Records one call of a stage.
+
+        Parameters
+        ----------
+        stage: str
+            The ValidationStages value of the stage.
+        seconds: float
+            The time the call took.
+        """
+        self.stage_seconds[stage] += seconds
+        self.stage_counts[stage] += 1
+
+    def reset(self):
+        """Clears the times and counts recorded so far."""
+        self.stage_seconds.clear()
+        self.stage_counts.clear()
+
+    @contextmanager
+    def activate(self):
+        """Records the timed stages run by the current thread inside a with block in this timer.
+
+        An already active timer is replaced until the with block ends.
+        """
+        global _active_timer_count
+        previous_timer = getattr(_thread_state, 'timer', None)
+        _thread_state.timer = self
+        if previous_timer is None:
+            with _active_timer_lock:
+                _active_timer_count += 1
+        try:
+            yield self
+        finally:
+            _thread_state.timer = previous_timer
+            if previous_timer is None:
+                with _active_timer_lock:
+                    _active_timer_count -= 1
+
+    def get_report(self):
+        """Returns the times and counts as a dictionary of basic types, suitable for converting to JSON.
+
+        Returns
+        -------
+        report: {}
+            For each stage that was run, a dictionary with the keys count, total_seconds and mean_seconds.
+        """
+        report = {}
+        for stage, count in self.stage_counts.items():
+            total_seconds = self.stage_seconds[stage]
+            report[stage] = {'count': count, 'total_seconds': total_seconds, 'mean_seconds': total_seconds / count}
+        return report
+
+
+def timed_stage(stage):
+    """Returns a decorator that records each call of a function in the active StageTimer, if there is one.
+
+    Parameters
+    ----------
+    stage: str
+        The ValidationStages value to record the calls under.
+    Returns
+    -------
+    decorator: func
+        Wraps a function to time it.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def timed_function(*args, **kwargs):
+            if not _active_timer_count:
+                return function(*args, **kwargs)
+            stage_timer = getattr(_thread_state, 'timer', None)
+            if stage_timer is None:
+                return function(*args, **kwargs)
+            start_time = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stage_timer.add_time(stage, time.perf_counter() - start_time)
+        return timed_function
+    return decorator
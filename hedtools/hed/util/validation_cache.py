@@ -0,0 +1,230 @@
+"""
+This module contains a persistent cache of validation issues, stored in a SQLite database in a local directory.
+
+Issues are stored without their error context, so a cached result can be reused for any row, column or file.
+The cache can be inspected and pruned from the command line:
+
+    python -m hed.util.validation_cache info <cache_folder>
+    python -m hed.util.validation_cache prune <cache_folder> --max-size-mb 50
+    python -m hed.util.validation_cache clear <cache_folder>
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+from hashlib import sha1
+
+VALIDATION_CACHE_FILENAME = 'validation_cache.sqlite3'
+# Increment this whenever the stored issue format changes, so older entries are ignored.
+VALIDATION_CACHE_FORMAT_VERSION = 2
+
+
+class ValidationCache:
+    """The issues found validating each string, stored on disk by a hash of everything that affects validation."""
+    DEFAULT_MAX_SIZE_BYTES = 100 * 1024 * 1024
+    # Approximate per entry overhead of the key, sizes and times, used when totaling the cache size.
+    ENTRY_OVERHEAD_BYTES = 48
+
+    def __init__(self, cache_folder, max_size_bytes=DEFAULT_MAX_SIZE_BYTES):
+        """Constructor for the ValidationCache class.
+
+        Parameters
+        ----------
+        cache_folder: str
+            The directory to store the cache database in.  It is created if it doesn't exist.
+        max_size_bytes: int
+            The approximate maximum size of the stored issues.  The least recently used entries are removed once
+            this is exceeded.
+        """
+        os.makedirs(cache_folder, exist_ok=True)
+        self.cache_folder = cache_folder
+        self.filename = os.path.join(cache_folder, VALIDATION_CACHE_FILENAME)
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # New entries and the keys read since the last flush, written out together.
+        self._pending_entries = {}
+        self._used_keys = set()
+        self._connection = sqlite3.connect(self.filename, timeout=30)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS issues "
+                                 "(key BLOB PRIMARY KEY, issues TEXT, size INTEGER, last_used REAL)")
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(*key_parts):
+        """Creates a cache key from strings, such as the schema fingerprint, validator flags and hed string.
+
+        Parameters
+        ----------
+        key_parts: str
+            Everything that affects the validation result.
+        Returns
+        -------
+        key: bytes
+            A hash of the key parts.
+        """
+        key_hash = sha1(f"{VALIDATION_CACHE_FORMAT_VERSION}".encode('utf-8'))
+        for key_part in key_parts:
+            encoded_part = str(key_part).encode('utf-8', 'surrogatepass')
+            key_hash.update(f"\0{len(encoded_part)}\0".encode('utf-8'))
+            key_hash.update(encoded_part)
+        return key_hash.digest()
+
+    def get(self, key):
+        """Returns the issues stored for key.
+
+        Parameters
+        ----------
+        key: bytes
+            A key from make_key.
+        Returns
+        -------
+        issues: [{}] or None
+            The stored issues, without error context.  None if key isn't in the cache.
+        """
+        issues_text = self._pending_entries.get(key)
+        if issues_text is None:
+            row = self._connection.execute("SELECT issues FROM issues WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            issues_text = row[0]
+            self._used_keys.add(key)
+        self.hits += 1
+        if not issues_text:
+            return []
+        return json.loads(issues_text)
+
+    def put(self, key, issues):
+        """Stores the issues for key.  They are written to disk on the next flush.
+
+        Parameters
+        ----------
+        key: bytes
+            A key from make_key.
+        issues: [{}]
+            The issues to store.  These should have no error context, eg from ErrorHandler.remove_context_from_issues.
+        """
+        if issues:
+            self._pending_entries[key] = json.dumps([self._get_issue_dict(issue) for issue in issues],
+                                                    separators=(',', ':'))
+        else:
+            self._pending_entries[key] = ""
+
+    @staticmethod
+    def _get_issue_dict(issue):
+        """Returns an issue as a plain dictionary, including the tag of a HedIssue for HedIssue.from_dict."""
+        issue_dict = dict(issue.items())
+        tag = getattr(issue, 'tag', None)
+        if tag is not None:
+            issue_dict['tag'] = tag
+        return issue_dict
+
+    def flush(self):
+        """Writes new entries and usage times to disk, then removes old entries if the cache is too large."""
+        if not self._pending_entries and not self._used_keys:
+            return
+        now = time.time()
+        with self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?)",
+                                         [(key, issues_text, len(issues_text) + self.ENTRY_OVERHEAD_BYTES, now)
+                                          for key, issues_text in self._pending_entries.items()])
+            self._connection.executemany("UPDATE issues SET last_used = ? WHERE key = ?",
+                                         [(now, key) for key in self._used_keys])
+        self._pending_entries = {}
+        self._used_keys = set()
+        self.prune()
+
+    def prune(self, max_size_bytes=None):
+        """Removes the least recently used entries until the cache is no larger than max_size_bytes.
+
+        Parameters
+        ----------
+        max_size_bytes: int or None
+            The size to reduce the cache to.  Defaults to the max size of this cache.
+        Returns
+        -------
+        removed_count: int
+            The number of entries removed.
+        """
+        if max_size_bytes is None:
+            max_size_bytes = self.max_size_bytes
+        total_size = self.get_size_bytes()
+        if total_size <= max_size_bytes:
+            return 0
+
+        removed_keys = []
+        for key, size in self._connection.execute("SELECT key, size FROM issues ORDER BY last_used"):
+            if total_size <= max_size_bytes:
+                break
+            removed_keys.append((key,))
+            total_size -= size
+        with self._connection:
+            self._connection.executemany("DELETE FROM issues WHERE key = ?", removed_keys)
+        self.evictions += len(removed_keys)
+        return len(removed_keys)
+
+    def clear(self):
+        """Removes all entries and resets the counters."""
+        with self._connection:
+            self._connection.execute("DELETE FROM issues")
+        self._pending_entries = {}
+        self._used_keys = set()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_size_bytes(self):
+        """Returns the approximate size of the stored entries, not including unflushed ones."""
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM issues").fetchone()[0]
+
+    def get_stats(self):
+        """Returns a dictionary describing the current cache usage.
+
+        Returns
+        -------
+        stats: {}
+            Contains the keys hits, misses, evictions, size, size_bytes and max_size_bytes.
+        """
+        size = self._connection.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': size, 'size_bytes': self.get_size_bytes(), 'max_size_bytes': self.max_size_bytes}
+
+    def close(self):
+        """Flushes any pending entries and closes the database."""
+        self.flush()
+        self._connection.close()
+
+
+def main(arg_list=None):
+    """Inspects, prunes or clears a validation cache from the command line.
+
+    Parameters
+    ----------
+    arg_list: [str]
+        The command line arguments.  Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Inspect or prune a HED validation cache.")
+    parser.add_argument("command", choices=["info", "prune", "clear"])
+    parser.add_argument("cache_folder", help="The directory containing the validation cache.")
+    parser.add_argument("--max-size-mb", type=float, default=None,
+                        help="For prune, the size in megabytes to reduce the cache to.")
+    args = parser.parse_args(arg_list)
+
+    cache = ValidationCache(args.cache_folder)
+    if args.command == "prune":
+        max_size_bytes = None
+        if args.max_size_mb is not None:
+            max_size_bytes = int(args.max_size_mb * 1024 * 1024)
+        print(f"Removed {cache.prune(max_size_bytes)} entries")
+    elif args.command == "clear":
+        cache.clear()
+    stats = cache.get_stats()
+    print(f"{cache.filename}: {stats['size']} entries, {stats['size_bytes'] / (1024 * 1024):.2f} MB")
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+This module validates a collection of BIDS style event files in parallel, using a pool of worker processes.
+
+Each worker process creates its HedValidator once when it starts, so the schema is only transferred to each worker one
+time rather than being reloaded for every file.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from hed.util.column_def_group import ColumnDefGroup
+from hed.util.event_file_input import EventFileInput
+from hed.validator.hed_validator import HedValidator
+
+# Set in each worker process by _init_worker.
+_worker_validator = None
+_worker_column_group = None
+_worker_def_dicts = None
+
+
+def _init_worker(hed_schema, json_def_files, check_for_warnings):
+    """Creates the validator and loads the shared sidecars once per worker process."""
+    global _worker_validator, _worker_column_group, _worker_def_dicts
+    _worker_validator = HedValidator(hed_schema=hed_schema, check_for_warnings=check_for_warnings)
+    _worker_column_group = None
+    _worker_def_dicts = None
+    if json_def_files:
+        _worker_column_group = ColumnDefGroup.load_multiple_json_files(json_def_files)
+        _worker_def_dicts = ColumnDefGroup.extract_defs_from_list(_worker_column_group)
+
+
+def _validate_events_file(events_file):
+    """Validates a single events file in a worker process.
+
+    Parameters
+    ----------
+    events_file: str or (str, str or [str])
+        An events filename, or a tuple of (events filename, json sidecar files) to use instead of the shared ones.
+    Returns
+    -------
+    filename: str
+        The events filename.
+    validation_issues: [{}]
+        The issues found in the file.
+    """
+    if isinstance(events_file, tuple):
+        filename, json_def_files = events_file
+        input_file = EventFileInput(filename, json_def_files=json_def_files)
+    else:
+        filename = events_file
+        input_file = EventFileInput(filename, json_def_files=_worker_column_group, def_dicts=_worker_def_dicts)
+    return filename, _worker_validator.validate_input(input_file)
+
+
+def iter_validate_events_files(events_files, hed_schema, json_def_files=None, check_for_warnings=False,
+                               max_workers=None, chunk_size=1):
+    """Validates a list of events files in parallel, yielding the issues for each file as it finishes.
+
+        Files are yielded in the same order as events_files.
+
+    Parameters
+    ----------
+    events_files: [str or (str, str or [str])]
+        The events files to validate.  An entry can be a tuple of (events filename, json sidecar files) to
+        use different sidecars than json_def_files for that file.
+    hed_schema: HedSchema
+        The schema to validate against.  This is sent once to each worker process.
+    json_def_files: str or [str] or None
+        The json sidecar files to use for every events file that doesn't specify its own.
+    check_for_warnings: bool
+        True if the validator should check for warnings. False if the validator should only report errors.
+    max_workers: int or None
+        The number of worker processes to use.  Defaults to the number of processors on the machine.
+    chunk_size: int
+        The number of files to send to a worker at a time.  Larger values reduce overhead for many small files.
+    Yields
+    -------
+    filename: str
+        The events filename.
+    validation_issues: [{}]
+        The issues found in that file, with the filename as context.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(hed_schema, json_def_files, check_for_warnings)) as executor:
+        yield from executor.map(_validate_events_file, events_files, chunksize=chunk_size)
+
+
+def validate_events_files(events_files, hed_schema, json_def_files=None, check_for_warnings=False,
+                          max_workers=None, chunk_size=1):
+    """Validates a list of events files in parallel.
+
+    Parameters
+    ----------
+    events_files: [str or (str, str or [str])]
+        The events files to validate.  An entry can be a tuple of (events filename, json sidecar files) to
+        use different sidecars than json_def_files for that file.
+    hed_schema: HedSchema
+        The schema to validate against.  This is sent once to each worker process.
+    json_def_files: str or [str] or None
+        The json sidecar files to use for every events file that doesn't specify its own.
+    check_for_warnings: bool
+        True if the validator should check for warnings. False if the validator should only report errors.
+    max_workers: int or None
+        The number of worker processes to use.  Defaults to the number of processors on the machine.
+    chunk_size: int
+        The number of files to send to a worker at a time.  Larger values reduce overhead for many small files.
+    Returns
+    -------
+    validation_issues: [{}]
+        The issues found in all files, in the order of events_files.
+    """
+    validation_issues = []
+    for _, file_issues in iter_validate_events_files(events_files, hed_schema, json_def_files, check_for_warnings,
+                                                      max_workers, chunk_size):
+        validation_issues += file_issues
+    return validation_issues
@@ -4,6 +4,8 @@ types include .tsv, .txt, .xls, and .xlsx. To get the validation issues after cr
 the get_validation_issues() function.
 
 """
+import contextlib
+
 from hed.util.error_types import ErrorContext
 from hed.util import hed_cache
 from hed.util import error_reporter
@@ -13,12 +15,16 @@ from hed.util.hed_string import HedString
 from hed.validator.tag_validator import TagValidator
 from hed.util.hed_file_input import BaseFileInput
 from hed.util import util_constants
+from hed.util.stage_timer import ValidationStages, timed_stage
 
 
 class HedValidator:
+    # The most distinct column and row strings to keep the issues of when validating a file with cache_cells.
+    MAX_CACHED_CELL_ISSUES = 20000
+
     def __init__(self, check_for_warnings=False, run_semantic_validation=True,
                  hed_xml_file='', xml_version_number=None,
-                 hed_schema=None, error_handler=None):
+                 hed_schema=None, error_handler=None, validation_cache=None, stage_timer=None):
         """Constructor for the HedValidator class.
 
         Parameters
@@ -38,6 +44,12 @@ class HedValidator:
             Name of already prepared HedSchema to use.  This overrides hed_xml_file and xml_version_number.
         error_handler : ErrorHandler or None
             Used to report errors.  Uses a default one if none passed in.
+        validation_cache : ValidationCache or None
+            If present, the issues found in each string are stored in this cache, and reused when the same string is
+            validated again with the same schema and flags.
+        stage_timer : StageTimer or None
+            If present, the time spent in each validation stage is recorded in this timer.  This can be changed any
+            time with the stage_timer attribute.
         Returns
         -------
         HedValidator object
@@ -67,7 +79,17 @@ class HedValidator:
 
         self._run_semantic_validation = run_semantic_validation
 
-    def validate_input(self, hed_input, display_filename=None):
+        self._validation_cache = validation_cache
+        self._validation_cache_key_parts = ()
+        if validation_cache is not None:
+            schema_fingerprint = self._hed_schema.get_fingerprint() if run_semantic_validation else ""
+            self._validation_cache_key_parts = (schema_fingerprint, check_for_warnings, run_semantic_validation)
+
+        # Records the stages run by validate_input and iter_validation_issues, if not None.
+        self.stage_timer = stage_timer
+
+    def validate_input(self, hed_input, display_filename=None, cache_cells=False, issue_summary=None,
+                       issue_budget=None):
         """
             Validates any given hed_input string, file, or list and returns a list of issues.
 
@@ -79,26 +101,116 @@ class HedValidator:
         display_filename: str
             If present, will use this as the filename for context, rather than using the actual filename
             Useful for temp filenames.
+        cache_cells: bool
+            Only applies to files.  If True, each distinct cell value in a column is expanded and validated once, and
+            its issues are reported for every row with that value.  Useful for files with repetitive columns.
+        issue_summary: IssueSummary
+            If present, the issues are counted in this summary as they are found rather than kept, and it is returned
+            instead of the issues.  Memory use then doesn't grow with the number of issues.
+        issue_budget: IssueBudget
+            If present, only the issues that fit in this budget are reported, followed by issues saying what was left
+            out.  Files stop being validated once the budget is used up.  A list of strings is still validated
+            together, but issues past the budget are left out.
         Returns
         -------
-        validation_issues : [{}]
+        validation_issues : [{}] or IssueSummary
         """
+        with self._activate_stage_timer():
+            return self._validate_input(hed_input, display_filename, cache_cells, issue_summary, issue_budget)
+
+    def _validate_input(self, hed_input, display_filename, cache_cells, issue_summary, issue_budget):
+        """Validates hed_input, see validate_input."""
+        if issue_summary is not None:
+            issue_summary.add_issues(self.iter_validation_issues(hed_input, display_filename, cache_cells,
+                                                                 issue_budget))
+            return issue_summary
+
         is_file = isinstance(hed_input, BaseFileInput)
         if not display_filename and is_file:
             display_filename = hed_input.filename
         if isinstance(hed_input, list):
             validation_issues = self._validate_hed_strings(hed_input)
+            if issue_budget is not None:
+                validation_issues = self._apply_issue_budget_to_strings(validation_issues, issue_budget)
         elif is_file:
             self._error_handler.push_error_context(ErrorContext.FILE_NAME, display_filename)
-            validation_issues = self._validate_hed_tags_in_file(hed_input)
+            validation_issues = self._validate_hed_tags_in_file(hed_input, cache_cells, issue_budget)
         else:
             validation_issues = self._validate_hed_strings([hed_input])[0]
+            if issue_budget is not None:
+                validation_issues = issue_budget.add_issues(validation_issues)
+                validation_issues += issue_budget.get_truncation_issues(self._error_handler)
 
         if is_file:
             # If we have a custom title and found no issues, we need to still print the title.
             self._error_handler.pop_error_context()
+        if self._validation_cache is not None:
+            self._validation_cache.flush()
         return validation_issues
 
+    def iter_validation_issues(self, hed_input, display_filename=None, cache_cells=False, issue_budget=None):
+        """
+            Validates hed_input like validate_input, yielding the issues as they are found.
+
+            The issues of a file are yielded row by row while it is being read, so they can be passed to an
+            IssueWriter without keeping them all in memory.  If the file was opened with defer_definitions, rows that
+            used a definition from later in the file and the definition issues are yielded last, rather than in row
+            order.
+
+        Parameters
+        ----------
+        hed_input: str or list or HedFileInput object
+            A list of HED strings, a single HED string, or a HedFileInput object.
+        display_filename: str
+            If present, will use this as the filename for context, rather than using the actual filename
+        cache_cells: bool
+            Only applies to files.  If True, each distinct cell value in a column is validated once.
+        issue_budget: IssueBudget
+            If present, only the issues that fit in this budget are yielded, as in validate_input.
+        Yields
+        ------
+        issue: {}
+            The next validation issue.
+        """
+        issues = self._iter_validation_issues(hed_input, display_filename, cache_cells, issue_budget)
+        if self.stage_timer is None:
+            yield from issues
+            return
+        # The timer is only active while finding each issue, so code run between issues isn't timed.
+        while True:
+            with self.stage_timer.activate():
+                issue = next(issues, None)
+            if issue is None:
+                return
+            yield issue
+
+    def _iter_validation_issues(self, hed_input, display_filename, cache_cells, issue_budget):
+        """Yields the validation issues of hed_input, see iter_validation_issues."""
+        if isinstance(hed_input, list):
+            for string_issues in self.validate_input(hed_input, display_filename, issue_budget=issue_budget):
+                yield from string_issues
+            return
+        if not isinstance(hed_input, BaseFileInput):
+            yield from self.validate_input(hed_input, display_filename, issue_budget=issue_budget)
+            return
+
+        if not display_filename:
+            display_filename = hed_input.filename
+        self._error_handler.push_error_context(ErrorContext.FILE_NAME, display_filename)
+        try:
+            # Definitions found before validating are reported first, as validate_input does.
+            def_issue_count = len(hed_input.file_def_dict_issues)
+            yield from hed_input.file_def_dict_issues[:def_issue_count]
+            for _, row_issues in self._iter_file_row_issues(hed_input, cache_cells, issue_budget):
+                yield from row_issues
+            yield from hed_input.file_def_dict_issues[def_issue_count:]
+            if issue_budget is not None:
+                yield from issue_budget.get_truncation_issues(self._error_handler)
+        finally:
+            self._error_handler.pop_error_context()
+            if self._validation_cache is not None:
+                self._validation_cache.flush()
+
     def get_tag_validator(self):
         """Gets a TagValidator object.
 
@@ -113,6 +225,12 @@ class HedValidator:
         """
         return self._tag_validator
 
+    def _activate_stage_timer(self):
+        """Returns a context manager that records validation stages in stage_timer while active, if there is one."""
+        if self.stage_timer is None:
+            return contextlib.nullcontext()
+        return self.stage_timer.activate()
+
     @staticmethod
     def _get_hed_schema(hed_xml_file, get_specific_version=None):
         """
@@ -139,24 +257,89 @@ class HedValidator:
         hed_schema = load_schema(final_hed_xml_file)
         return hed_schema
 
-    def _validate_hed_tags_in_file(self, hed_input):
+    def _validate_hed_tags_in_file(self, hed_input, cache_cells=False, issue_budget=None):
         """
 
         Parameters
         ----------
         hed_input: HedFileInput object
             A file to validate.  This function does no type checking on this.
+        cache_cells: bool
+            If True, rows with the same cell values share their HedStrings, and each is only validated once.
+        issue_budget: IssueBudget or None
+            If present, validation stops once the budget is used up.
         Returns
         -------
         validation_issues : [{}]
         """
+        # Files opened with defer_definitions gather their definitions during this pass, and may return rows out of
+        # order, so the issues are put back in row order once the definition issues are all known.
+        row_issues = list(self._iter_file_row_issues(hed_input, cache_cells, issue_budget))
+        row_issues.sort(key=lambda row_number_and_issues: row_number_and_issues[0])
+
         validation_issues = []
         validation_issues += hed_input.file_def_dict_issues
-        for row_number, row_dict in hed_input.iter_dataframe(return_row_dict=True):
-            validation_issues = self._append_validation_issues_if_found(validation_issues, row_number, row_dict)
+        for _, issues in row_issues:
+            validation_issues += issues
+        if issue_budget is not None:
+            validation_issues += issue_budget.get_truncation_issues(self._error_handler)
+        return validation_issues
+
+    def _apply_issue_budget_to_strings(self, string_issues, issue_budget):
+        """Leaves out the issues of a list of strings that don't fit in a budget.
+
+        Parameters
+        ----------
+        string_issues: [[{}]]
+            The issues of each string, from validate_batch.
+        issue_budget: IssueBudget
+            The budget to apply.
+        Returns
+        -------
+        validation_issues: [[{}]]
+            The issues of each string that fit in the budget.  The issues saying what was left out are added to the
+            string the budget ran out on, or the last string.
+        """
+        validation_issues = []
+        truncation_index = len(string_issues) - 1
+        for index, issues in enumerate(string_issues):
+            was_exhausted = issue_budget.exhausted
+            validation_issues.append(issue_budget.add_issues(issues))
+            if issue_budget.exhausted and not was_exhausted:
+                truncation_index = index
+        if validation_issues:
+            validation_issues[truncation_index] += issue_budget.get_truncation_issues(self._error_handler)
         return validation_issues
 
-    def _append_validation_issues_if_found(self, validation_issues, row_number, row_dict):
+    def _iter_file_row_issues(self, hed_input, cache_cells=False, issue_budget=None):
+        """Validates each row of a file as it is read.
+
+        Parameters
+        ----------
+        hed_input: HedFileInput object
+            A file to validate.
+        cache_cells: bool
+            If True, rows with the same cell values share their HedStrings, and each is only validated once.
+        issue_budget: IssueBudget or None
+            If present, only the issues within the budget are yielded, and no more rows are read once it's used up.
+        Yields
+        ------
+        row_number: int
+            The row the issues are from.
+        row_issues: [{}]
+            The issues found in the row.
+        """
+        cell_issues = {} if cache_cells else None
+        for row_number, row_dict in hed_input.iter_dataframe(return_row_dict=True, cache_cells=cache_cells):
+            row_issues = self._append_validation_issues_if_found([], row_number, row_dict, cell_issues)
+            if issue_budget is None:
+                yield row_number, row_issues
+                continue
+            yield row_number, issue_budget.add_issues(row_issues)
+            if issue_budget.exhausted:
+                break
+
+    def _append_validation_issues_if_found(self, validation_issues, row_number, row_dict, cell_issues=None):
         """Appends the issues associated with a particular row and/or column in a spreadsheet.
 
          Parameters
@@ -169,6 +352,8 @@ class HedValidator:
             The HED string associated with a row.
         column_to_hed_tags_dictionary: dict
             A dictionary which associates columns with HED tags
+        cell_issues: dict or None
+            If present, the issues of column and row strings shared between rows, so they're only validated once.
          Returns
          -------
          list
@@ -179,11 +364,16 @@ class HedValidator:
         column_to_hed_tags_dictionary = row_dict[util_constants.COLUMN_TO_HED_TAGS]
         expansion_column_issues = row_dict.get(util_constants.COLUMN_ISSUES, {})
         self._append_column_validation_issues_if_found(validation_issues, row_number, column_to_hed_tags_dictionary,
-                                                       expansion_column_issues)
-        self._append_row_validation_issues_if_found(validation_issues, row_number, row_hed_string)
+                                                       expansion_column_issues, cell_issues)
+        row_cell_key = None
+        if cell_issues is not None:
+            row_cell_key = tuple(column_to_hed_tags_dictionary.values())
+        self._append_row_validation_issues_if_found(validation_issues, row_number, row_hed_string,
+                                                    cell_issues, row_cell_key)
         return validation_issues
 
-    def _append_row_validation_issues_if_found(self, validation_issues, row_number, row_hed_string):
+    def _append_row_validation_issues_if_found(self, validation_issues, row_number, row_hed_string,
+                                               cell_issues=None, row_cell_key=None):
         """Appends the issues associated with a particular row in a spreadsheet.
 
          Parameters
@@ -194,6 +384,10 @@ class HedValidator:
             The row number that the issues are associated with.
         row_hed_string: str
             The HED string associated with a row.
+        cell_issues: dict or None
+            If present, the issues of column and row strings shared between rows, so they're only validated once.
+        row_cell_key: tuple or None
+            The column HedStrings the row was made from, used to look it up in cell_issues.
          Returns
          -------
          []
@@ -203,15 +397,14 @@ class HedValidator:
         if row_hed_string:
             self._error_handler.push_error_context(ErrorContext.ROW, row_number)
             self._error_handler.push_error_context(ErrorContext.HED_STRING, row_hed_string, increment_depth_after=False)
-            row_validation_issues = self._validate_tags_in_hed_string(row_hed_string)
-            row_validation_issues += self._validate_tag_levels_in_hed_string(row_hed_string)
-            validation_issues += row_validation_issues
+            validation_issues += self._validate_cell(cell_issues, row_cell_key, row_hed_string,
+                                                     self._validate_row_cell)
             self._error_handler.pop_error_context()
             self._error_handler.pop_error_context()
         return validation_issues
 
     def _append_column_validation_issues_if_found(self, validation_issues, row_number, column_to_hed_tags_dictionary,
-                                                  expansion_issues):
+                                                  expansion_issues, cell_issues=None):
         """Appends the issues associated with a particular row column in a spreadsheet.
 
          Parameters
@@ -225,6 +418,8 @@ class HedValidator:
         expansion_issues: {int: {}}
             A dict containing an issue expanding a column that should be added as an error.
             This is primarily a missing category key in a json file.
+        cell_issues: dict or None
+            If present, the issues of column and row strings shared between rows, so they're only validated once.
          Returns
          -------
          []
@@ -242,8 +437,8 @@ class HedValidator:
                 column_hed_string = column_to_hed_tags_dictionary[column_number]
                 self._error_handler.push_error_context(ErrorContext.HED_STRING, column_hed_string,
                                                        increment_depth_after=False)
-                validation_issues += column_hed_string.calculate_canonical_forms(self._hed_schema, self._error_handler)
-                validation_issues += self.validate_column_hed_string(column_hed_string)
+                validation_issues += self._validate_cell(cell_issues, column_hed_string, column_hed_string,
+                                                         self._validate_column_cell)
                 self._error_handler.pop_error_context()
                 self._error_handler.pop_error_context()
             self._error_handler.pop_error_context()
@@ -263,12 +458,207 @@ class HedValidator:
 
          """
         validation_issues = []
-        validation_issues += self._tag_validator.run_hed_string_validators(str(column_hed_string))
+        validation_issues += self._run_hed_string_validators(column_hed_string)
         if not validation_issues:
             validation_issues += self._validate_individual_tags_in_hed_string(column_hed_string)
             validation_issues += self._validate_groups_in_hed_string(column_hed_string)
         return validation_issues
 
+    def validate_batch(self, hed_strings):
+        """Validates a batch of HED strings, running each validation stage across the whole batch.
+
+            Identical strings are only parsed and validated once, so the cost scales with the number of
+            unique strings rather than the total number of strings.
+
+        Parameters
+        ----------
+        hed_strings: [str]
+            A list of HED strings.
+        Returns
+        -------
+        validation_issues: [[{}]]
+            A list containing the issues for each HED string, in the same order as hed_strings.
+        """
+        unique_indexes = {}
+        string_indexes = []
+        for hed_string in hed_strings:
+            string_indexes.append(unique_indexes.setdefault(hed_string, len(unique_indexes)))
+
+        hed_string_objs = [HedString(hed_string) for hed_string in unique_indexes]
+        unique_issues = [[] for _ in hed_string_objs]
+
+        uncached_indexes = range(len(hed_string_objs))
+        cache_keys = None
+        if self._validation_cache is not None:
+            cache_keys = [self._validation_cache.make_key(*self._validation_cache_key_parts, "string", hed_string)
+                          for hed_string in unique_indexes]
+            uncached_indexes = []
+            for index, cache_key in enumerate(cache_keys):
+                cached_issues = self._validation_cache.get(cache_key)
+                if cached_issues is None:
+                    uncached_indexes.append(index)
+                elif cached_issues:
+                    self._error_handler.push_error_context(ErrorContext.HED_STRING, hed_string_objs[index],
+                                                           increment_depth_after=False)
+                    unique_issues[index] = self._error_handler.add_context_to_issues(cached_issues)
+                    self._error_handler.pop_error_context()
+
+        pending = self._run_batch_stage(hed_string_objs, uncached_indexes, unique_issues,
+                                        self._run_hed_string_validators)
+        pending = self._run_batch_stage(hed_string_objs, pending, unique_issues,
+                                        lambda hed_string_obj: hed_string_obj.calculate_canonical_forms(
+                                            self._hed_schema, self._error_handler))
+        for validate_stage in (self._validate_tags_in_hed_string, self._validate_tag_levels_in_hed_string,
+                               self._validate_individual_tags_in_hed_string, self._validate_groups_in_hed_string):
+            self._run_batch_stage(hed_string_objs, pending, unique_issues, validate_stage)
+
+        if cache_keys is not None:
+            for index in uncached_indexes:
+                self._validation_cache.put(cache_keys[index],
+                                           self._error_handler.remove_context_from_issues(unique_issues[index]))
+
+        validation_issues = []
+        for unique_index in string_indexes:
+            validation_issues.append([issue.copy() for issue in unique_issues[unique_index]])
+        return validation_issues
+
+    def _run_batch_stage(self, hed_string_objs, indexes, batch_issues, validate_stage):
+        """Runs a single validation stage over the given strings in a batch.
+
+        Parameters
+        ----------
+        hed_string_objs: [HedString]
+            The parsed strings in the batch.
+        indexes: iterable of int
+            The indexes into hed_string_objs to validate in this stage.
+        batch_issues: [[{}]]
+            The issues found so far for each string.  This is updated in place.
+        validate_stage: func
+            Takes a HedString and returns a list of issues.
+        Returns
+        -------
+        passed_indexes: [int]
+            The indexes that produced no issues in this stage.
+        """
+        passed_indexes = []
+        for index in indexes:
+            hed_string_obj = hed_string_objs[index]
+            self._error_handler.push_error_context(ErrorContext.HED_STRING, hed_string_obj, increment_depth_after=False)
+            stage_issues = validate_stage(hed_string_obj)
+            self._error_handler.pop_error_context()
+            if stage_issues:
+                batch_issues[index] += stage_issues
+            else:
+                passed_indexes.append(index)
+        return passed_indexes
+
+    def _validate_with_cache(self, validation_type, hed_string_obj, validate_function):
+        """Runs a validation function on a string, or returns its cached issues if the string was already validated.
+
+        Parameters
+        ----------
+        validation_type: str
+            Identifies which validation function this is, so the results of different functions are cached separately.
+        hed_string_obj: HedString
+            The string to validate.
+        validate_function: func
+            Takes a HedString and returns a list of issues.
+        Returns
+        -------
+        validation_issues: [{}]
+            The issues found in the string, with the current error context.
+        """
+        if self._validation_cache is None:
+            return validate_function(hed_string_obj)
+
+        # The original text of each tag is part of the key, as it's used in the issue messages.
+        cache_key = self._validation_cache.make_key(*self._validation_cache_key_parts, validation_type,
+                                                    str(hed_string_obj),
+                                                    *[tag.org_tag for tag in hed_string_obj.iter_all_tags()])
+        cached_issues = self._validation_cache.get(cache_key)
+        if cached_issues is None:
+            validation_issues = validate_function(hed_string_obj)
+            self._validation_cache.put(cache_key, self._error_handler.remove_context_from_issues(validation_issues))
+            return validation_issues
+        return self._error_handler.add_context_to_issues(cached_issues)
+
+    def _validate_cell(self, cell_issues, cell_key, hed_string_obj, validate_function):
+        """Validates a column or row string, or reports the issues from the first time it was validated.
+
+        Parameters
+        ----------
+        cell_issues: dict or None
+            The issues of strings validated so far, by cell_key.  If None, the string is always validated.
+        cell_key: HedString or tuple
+            The shared HedString, or the column HedStrings a row was made from.  These are kept alive in cell_issues,
+            so their ids can't be reused.
+        hed_string_obj: HedString
+            The string to validate.
+        validate_function: func
+            Takes a HedString and returns a list of issues.
+        Returns
+        -------
+        validation_issues: [{}]
+            The issues found in the string, with the current error context.
+        """
+        if cell_issues is None:
+            return validate_function(hed_string_obj)
+
+        cell_id = id(cell_key) if isinstance(cell_key, HedString) else tuple(id(key) for key in cell_key)
+        cached_cell = cell_issues.get(cell_id)
+        if cached_cell is None:
+            validation_issues = validate_function(hed_string_obj)
+            if len(cell_issues) < self.MAX_CACHED_CELL_ISSUES:
+                cell_issues[cell_id] = (cell_key, self._error_handler.remove_context_from_issues(validation_issues))
+            return validation_issues
+        return self._error_handler.add_context_to_issues(cached_cell[1])
+
+    def _validate_column_cell(self, column_hed_string):
+        """Converts a column string to canonical form and validates it.
+
+        Parameters
+        ----------
+        column_hed_string: HedString
+            The HED string associated with a row column.
+        Returns
+        -------
+        validation_issues: [{}]
+            The conversion and validation issues found in the column string.
+        """
+        validation_issues = column_hed_string.calculate_canonical_forms(self._hed_schema, self._error_handler)
+        validation_issues += self._validate_with_cache("column", column_hed_string, self.validate_column_hed_string)
+        return validation_issues
+
+    def _validate_row_cell(self, row_hed_string):
+        """Validates the full string for a row, using the validation cache if there is one.
+
+        Parameters
+        ----------
+        row_hed_string: HedString
+            The HED string associated with a row.
+        Returns
+        -------
+        validation_issues: [{}]
+            The issues found in the row.
+        """
+        return self._validate_with_cache("row", row_hed_string, self._validate_row_hed_string)
+
+    def _validate_row_hed_string(self, row_hed_string):
+        """Validates the tags and tag levels of the full hed string for a row.
+
+        Parameters
+        ----------
+        row_hed_string: HedString
+            The HED string associated with a row.
+        Returns
+        -------
+        validation_issues: [{}]
+            The issues found in the row.
+        """
+        validation_issues = self._validate_tags_in_hed_string(row_hed_string)
+        validation_issues += self._validate_tag_levels_in_hed_string(row_hed_string)
+        return validation_issues
+
     def _validate_hed_strings(self, hed_strings):
         """Validates the tags in an array of HED strings
 
@@ -282,23 +672,26 @@ class HedValidator:
              The issues associated with the HED strings.
 
          """
-        eeg_issues = []
-        for i in range(0, len(hed_strings)):
-            hed_string = hed_strings[i]
-            hed_string_obj = HedString(hed_string)
-            self._error_handler.push_error_context(ErrorContext.HED_STRING, hed_string_obj, increment_depth_after=False)
-            validation_issues = self._tag_validator.run_hed_string_validators(str(hed_string_obj))
-            if not validation_issues:
-                validation_issues += hed_string_obj.calculate_canonical_forms(self._hed_schema, self._error_handler)
-                if not validation_issues:
-                    validation_issues += self._validate_tags_in_hed_string(hed_string_obj)
-                    validation_issues += self._validate_tag_levels_in_hed_string(hed_string_obj)
-                    validation_issues += self._validate_individual_tags_in_hed_string(hed_string_obj)
-                    validation_issues += self._validate_groups_in_hed_string(hed_string_obj)
-            eeg_issues.append(validation_issues)
-            self._error_handler.pop_error_context()
-        return eeg_issues
+        return self.validate_batch(hed_strings)
+
+    @timed_stage(ValidationStages.STRING_CHECKS)
+    def _run_hed_string_validators(self, hed_string_obj):
+        """Runs the string level syntax checks, reusing the scan from parsing the string if it's still current.
+
+        Parameters
+        ----------
+        hed_string_obj: HedString
+            The parsed HED string.
+        Returns
+        -------
+        validation_issues: [{}]
+            The invalid character, parentheses and delimiter issues in the string.
+        """
+        validation_string = str(hed_string_obj)
+        return self._tag_validator.run_hed_string_validators(validation_string,
+                                                             hed_string_obj.get_string_scan(validation_string))
 
+    @timed_stage(ValidationStages.TAG_LEVEL_CHECKS)
     def _validate_tag_levels_in_hed_string(self, hed_string_delimiter):
         """Validates the tags at each level in a HED string. This pertains to the top-level, all groups, and nested
            groups.
@@ -320,6 +713,7 @@ class HedValidator:
 
         return validation_issues
 
+    @timed_stage(ValidationStages.TAG_CHECKS)
     def _validate_tags_in_hed_string(self, hed_string_delimiter):
         """Validates the multi-tag properties in a hed string, eg required tags.
 
@@ -338,6 +732,7 @@ class HedValidator:
         validation_issues += self._tag_validator._run_tag_validators(tags)
         return validation_issues
 
+    @timed_stage(ValidationStages.GROUP_CHECKS)
     def _validate_groups_in_hed_string(self, hed_string_delimiter):
         """Validates the groups in a HED string.
 
@@ -357,6 +752,7 @@ class HedValidator:
             validation_issues += self._tag_validator.run_tag_group_validators(tag_group)
         return validation_issues
 
+    @timed_stage(ValidationStages.INDIVIDUAL_TAG_CHECKS)
     def _validate_individual_tags_in_hed_string(self, hed_string_delimiter):
         """Validates the individual tags in a HED string.
 
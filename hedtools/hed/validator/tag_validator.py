@@ -5,21 +5,37 @@ This module is used to validate the HED tags as strings.
 
 import datetime
 import re
-import inflect
 
 from hed.util.error_types import ValidationErrors, ValidationWarnings
 from hed.util import error_reporter
+from hed.util import hed_string_util
+from hed.util.lru_cache import LRUCache
 from hed.schema.hed_schema_constants import HedKey
+from hed.schema.unit_matcher import pluralize
 
-pluralize = inflect.engine()
-pluralize.defnoun("hertz", "hertz")
+
+class _SchemaCacheKey:
+    """Part of a tag cache key that matches only the same schema object.
+
+    This keeps the schema alive while its results are cached, so its id can't be reused by another schema.
+    """
+    __slots__ = ('hed_schema',)
+
+    def __init__(self, hed_schema):
+        self.hed_schema = hed_schema
+
+    def __eq__(self, other):
+        return isinstance(other, _SchemaCacheKey) and self.hed_schema is other.hed_schema
+
+    def __hash__(self):
+        return id(self.hed_schema)
 
 
 class TagValidator:
     CAMEL_CASE_EXPRESSION = r'([A-Z-]+\s*[a-z-]*)+'
     DIGIT_EXPRESSION = r'^-?[\d.]+(?:e-?\d+)?$'
     DIGIT_OR_POUND_EXPRESSION = r'^(-?[\d.]+(?:e-?\d+)?|#)$'
-    INVALID_STRING_CHARS = '[]{}~'
+    INVALID_STRING_CHARS = hed_string_util.INVALID_STRING_CHARS
     OPENING_GROUP_CHARACTER = '('
     CLOSING_GROUP_CHARACTER = ')'
     DOUBLE_QUOTE = '"'
@@ -27,9 +43,10 @@ class TagValidator:
     CLOCK_TIME_UNIT_CLASS = 'clockTime'
     DATE_TIME_UNIT_CLASS = 'dateTime'
     TIME_UNIT_CLASS = 'time'
+    DEFAULT_TAG_CACHE_SIZE = 4096
 
     def __init__(self, hed_schema=None, check_for_warnings=False, run_semantic_validation=True,
-                 allow_numbers_to_be_pound_sign=False, error_handler=None):
+                 allow_numbers_to_be_pound_sign=False, error_handler=None, tag_cache=None):
         """Constructor for the Tag_Validator class.
 
         Parameters
@@ -40,6 +57,9 @@ class TagValidator:
             If true, considers # equal to a number for validation purposes.  This is so it can validate templates.
         error_handler : ErrorHandler or None
             Used to report errors.  Uses a default one if none passed in.
+        tag_cache : LRUCache or None
+            Cache of individual tag results.  Can be shared between validators.
+            Uses a new one of DEFAULT_TAG_CACHE_SIZE if none passed in.
         Returns
         -------
         TagValidator
@@ -52,8 +72,12 @@ class TagValidator:
         self._hed_schema = hed_schema
         if hed_schema:
             self._hed_schema_dictionaries = hed_schema.dictionaries
+            self._unique_prefix_index = self._build_prefix_index(HedKey.Unique)
+            self._required_prefix_index = self._build_prefix_index(HedKey.RequiredPrefix)
         else:
             self._hed_schema_dictionaries = None
+            self._unique_prefix_index = None
+            self._required_prefix_index = None
         self._check_for_warnings = check_for_warnings
         self._run_semantic_validation = run_semantic_validation
         self._placeholders_allowed_in_strings = allow_numbers_to_be_pound_sign
@@ -63,9 +87,16 @@ class TagValidator:
         else:
             self._digit_expression = self.DIGIT_EXPRESSION
 
+        if tag_cache is None:
+            tag_cache = LRUCache(self.DEFAULT_TAG_CACHE_SIZE)
+        self._tag_cache = tag_cache
+        self._schema_cache_key = _SchemaCacheKey(hed_schema)
+
     def run_individual_tag_validators(self, original_tag):
         """Runs the validators on the individual tags in a HED string.
 
+            Results are cached per tag, so repeated tags only report the cached issues with the current context.
+
          Parameters
          ----------
          original_tag: HedTag
@@ -75,6 +106,39 @@ class TagValidator:
          []
              The validation issues associated with the top-level in the HED string.
          """
+        cache_key = (self._schema_cache_key, self._check_for_warnings, self._run_semantic_validation,
+                     self._placeholders_allowed_in_strings, str(original_tag), original_tag.org_tag)
+        cached_issues = self._tag_cache.get(cache_key)
+        if cached_issues is None:
+            cached_issues = self._error_handler.remove_context_from_issues(
+                self._run_individual_tag_validators(original_tag))
+            self._tag_cache.put(cache_key, cached_issues)
+        if not cached_issues:
+            return []
+        return self._error_handler.add_context_to_issues(cached_issues)
+
+    def get_tag_cache_stats(self):
+        """Returns the hit and miss counters of the individual tag cache.
+
+        Returns
+        -------
+        stats: {}
+            Contains the keys hits, misses, evictions, size and max_size.
+        """
+        return self._tag_cache.get_stats()
+
+    def _run_individual_tag_validators(self, original_tag):
+        """Runs the validators on an individual tag without using the cache.
+
+         Parameters
+         ----------
+         original_tag: HedTag
+            A original tag.
+         Returns
+         -------
+         []
+             The validation issues associated with the tag.
+         """
         validation_issues = []
         validation_issues += self.check_tag_formatting(original_tag)
         if not validation_issues:
@@ -104,23 +168,27 @@ class TagValidator:
         # There are currently no checks for groups.  This placeholder left intentionally.
         return validation_issues
 
-    def run_hed_string_validators(self, hed_string):
+    def run_hed_string_validators(self, hed_string, string_scan=None):
         """Do the most basic high level checks of the hed string, for basic invalid characters or bad delimiters
 
          Parameters
          ----------
          hed_string: str
             A HED string.
+         string_scan: HedStringScan
+            The result of hed_string_util.scan_hed_string for this string, if it's already been scanned.
          Returns
          -------
          []
              The validation issues associated with a HED string.
 
          """
+        if string_scan is None or string_scan.hed_string != hed_string:
+            string_scan = hed_string_util.scan_hed_string(hed_string, self.INVALID_STRING_CHARS)
         validation_issues = []
-        validation_issues += self.find_invalid_character_issues(hed_string)
-        validation_issues += self.count_tag_group_parentheses(hed_string)
-        validation_issues += self.find_delimiter_issues_in_hed_string(hed_string)
+        validation_issues += self._format_invalid_character_issues(string_scan)
+        validation_issues += self._format_parentheses_issues(string_scan)
+        validation_issues += self._format_delimiter_issues(string_scan)
         return validation_issues
 
     def run_tag_level_validators(self, original_tag_list):
@@ -174,12 +242,11 @@ class TagValidator:
         """
         validation_issues = []
         formatted_tag = original_tag.lower()
-        is_extension_tag = self.is_extension_allowed_tag(formatted_tag)
         if self._hed_schema_dictionaries[HedKey.AllTags].get(formatted_tag) or \
                 self.tag_takes_value(formatted_tag):
             return validation_issues
 
-        if not is_extension_tag:
+        if not self.is_extension_allowed_tag(formatted_tag):
             validation_issues += self._error_handler.format_val_error(ValidationErrors.INVALID_TAG, tag=original_tag)
         return validation_issues
 
@@ -237,8 +304,8 @@ class TagValidator:
         return validation_issues
 
     def is_extension_allowed_tag(self, formatted_tag):
-        """Checks to see if the tag has the 'extensionAllowed' attribute. It will strip the tag until there are no more
-        slashes to check if its ancestors have the attribute.
+        """Checks to see if the tag has the 'extensionAllowed' attribute. It finds the deepest ancestor of the tag
+        that is in the schema, and checks if that ancestor or any tag above it has the attribute.
 
         Parameters
         ----------
@@ -249,12 +316,18 @@ class TagValidator:
         tag_takes_extension: bool
             True if the tag has the 'extensionAllowed' attribute. False, if otherwise.
         """
-        tag_slash_indices = self.get_tag_slash_indices(formatted_tag)
-        for tag_slash_index in tag_slash_indices:
-            tag_substring = self.split_tag_substring_by_index(formatted_tag, tag_slash_index)
-            if self._hed_schema.tag_has_attribute(tag_substring,
-                                                  HedKey.ExtensionAllowedPropagated):
+        get_tag_entry = self._hed_schema.get_tag_entry
+        if formatted_tag.startswith('/'):
+            tag_entry = get_tag_entry(formatted_tag)
+            if tag_entry is not None and tag_entry.extension_allowed:
                 return True
+
+        slash_index = formatted_tag.rfind('/')
+        while slash_index > 0:
+            tag_entry = get_tag_entry(formatted_tag[:slash_index])
+            if tag_entry is not None:
+                return tag_entry.extension_allowed_ancestor
+            slash_index = formatted_tag.rfind('/', 0, slash_index)
         return False
 
     def tag_takes_value(self, formatted_tag):
@@ -272,9 +345,8 @@ class TagValidator:
         """
         if not self._hed_schema:
             return False
-        takes_value_tag = self.replace_tag_name_with_pound(formatted_tag)
-        return self._hed_schema.tag_has_attribute(takes_value_tag,
-                                                  HedKey.TakesValue)
+        takes_value_entry = self._hed_schema.get_takes_value_entry(formatted_tag)
+        return takes_value_entry is not None and takes_value_entry.takes_value
 
     def is_unit_class_tag(self, formatted_tag):
         """Checks to see if the tag has the 'unitClass' attribute.
@@ -289,11 +361,10 @@ class TagValidator:
             True if the tag has the 'unitClass' attribute. False, if otherwise.
 
         """
-        takes_value_tag = self.replace_tag_name_with_pound(formatted_tag)
         if not self._hed_schema.has_unit_classes:
             return False
-        return self._hed_schema.tag_has_attribute(takes_value_tag,
-                                                  HedKey.UnitClass)
+        takes_value_entry = self._hed_schema.get_takes_value_entry(formatted_tag)
+        return takes_value_entry is not None and takes_value_entry.has_unit_class
 
     def replace_tag_name_with_pound(self, formatted_tag):
         """Replaces the tag name with the pound sign.
@@ -330,10 +401,11 @@ class TagValidator:
         validation_issues = []
         formatted_tag = original_tag.lower()
         if not self.tag_exists_in_schema(formatted_tag) and self.is_unit_class_tag(formatted_tag):
-            tag_unit_classes = self.get_tag_unit_classes(formatted_tag)
+            unit_matcher = self._hed_schema.get_takes_value_entry(formatted_tag).unit_matcher
+            tag_unit_classes = unit_matcher.unit_classes
             formatted_tag_unit_value = self.get_tag_name(formatted_tag)
             original_tag_unit_value = self.get_tag_name(str(original_tag))
-            tag_unit_class_units = tuple(self.get_tag_unit_class_units(formatted_tag))
+            tag_unit_class_units = unit_matcher.units
             if (TagValidator.DATE_TIME_UNIT_CLASS in
                     self._hed_schema_dictionaries[HedKey.Units]):
                 if (TagValidator.DATE_TIME_UNIT_CLASS in tag_unit_classes
@@ -350,9 +422,7 @@ class TagValidator:
                         and TagValidator.is_clock_face_time(formatted_tag_unit_value)):
                     return validation_issues
             if re.search(self.DIGIT_OR_POUND_EXPRESSION,
-                         self.validate_units(original_tag_unit_value,
-                                             formatted_tag_unit_value,
-                                             tag_unit_class_units)):
+                         unit_matcher.strip_unit(original_tag_unit_value, formatted_tag_unit_value)):
                 pass
             else:
                 validation_issues += self._error_handler.format_val_error(ValidationErrors.UNIT_CLASS_INVALID_UNIT,
@@ -379,45 +449,6 @@ class TagValidator:
             derivative_units.append(pluralize.plural(unit))
         return derivative_units
 
-    def _strip_off_units_if_valid(self, unit_value, unit, is_unit_symbol):
-        """Validates and strips units from a value.
-
-        Parameters
-        ----------
-        unit_value: str
-            The value to validate.
-        unit: str
-            The unit to strip.
-        is_unit_symbol: bool
-            Whether the unit is a symbol.
-        Returns
-        -------
-        tuple
-            The found unit and the stripped value.
-        """
-        found_unit = False
-        stripped_value = ''
-
-        if str(unit_value).startswith(unit):
-            found_unit = True
-            stripped_value = str(unit_value)[len(unit):].strip()
-        elif str(unit_value).endswith(unit):
-            found_unit = True
-            stripped_value = str(unit_value)[0:-len(unit)].strip()
-
-        if found_unit and self._hed_schema.has_unit_modifiers:
-            if is_unit_symbol:
-                modifier_key = HedKey.SIUnitSymbolModifier
-            else:
-                modifier_key = HedKey.SIUnitModifier
-
-            for unit_modifier in self._hed_schema_dictionaries[modifier_key]:
-                if stripped_value.startswith(unit_modifier):
-                    stripped_value = stripped_value[len(unit_modifier):].strip()
-                elif stripped_value.endswith(unit_modifier):
-                    stripped_value = stripped_value[0:-len(unit_modifier)].strip()
-        return found_unit, stripped_value
-
     def validate_units(self, original_tag_unit_value, formatted_tag_unit_value, tag_unit_class_units):
         """Checks to see if the specified string has a valid unit, and removes it if so.
 
@@ -436,23 +467,8 @@ class TagValidator:
             Otherwise, returns tag_unit_values
 
         """
-        tag_unit_class_units = sorted(tag_unit_class_units, key=len, reverse=True)
-        for unit in tag_unit_class_units:
-            derivative_units = self.get_valid_unit_plural(unit)
-            for derivative_unit in derivative_units:
-                if self._hed_schema.has_unit_modifiers and \
-                        self._hed_schema_dictionaries[HedKey.UnitSymbol].get(unit):
-                    found_unit, stripped_value = self._strip_off_units_if_valid(original_tag_unit_value,
-                                                                                derivative_unit,
-                                                                                True)
-                else:
-                    found_unit, stripped_value = self._strip_off_units_if_valid(formatted_tag_unit_value,
-                                                                                derivative_unit,
-                                                                                False)
-                if found_unit:
-                    return stripped_value
-
-        return formatted_tag_unit_value
+        unit_matcher = self._hed_schema.get_unit_matcher(tag_unit_class_units)
+        return unit_matcher.strip_unit(original_tag_unit_value, formatted_tag_unit_value)
 
     def check_if_tag_unit_class_units_exist(self, original_tag):
         """Reports a validation warning if the tag provided has a unit class but no units are not specified.
@@ -511,10 +527,8 @@ class TagValidator:
 
         """
         unit_classes = []
-        unit_class_tag = self.replace_tag_name_with_pound(formatted_tag)
         if self.is_unit_class_tag(formatted_tag):
-            unit_classes = self._hed_schema_dictionaries[HedKey.UnitClass][unit_class_tag]
-            unit_classes = unit_classes.split(',')
+            unit_classes = list(self._hed_schema.get_takes_value_entry(formatted_tag).unit_classes)
         return unit_classes
 
     def get_tag_unit_class_units(self, formatted_tag):
@@ -532,17 +546,8 @@ class TagValidator:
 
         """
         units = []
-        unit_class_tag = self.replace_tag_name_with_pound(formatted_tag)
         if self.is_unit_class_tag(formatted_tag):
-            unit_classes = self._hed_schema_dictionaries[HedKey.UnitClass][unit_class_tag]
-            unit_classes = unit_classes.split(',')
-
-            for unit_class in unit_classes:
-                try:
-                    units += (self._hed_schema_dictionaries[HedKey.Units][unit_class])
-                # Todo: What is this exception handling doing?
-                except Exception:
-                    continue
+            units = list(self._hed_schema.get_takes_value_entry(formatted_tag).unit_matcher.units)
         return units
 
     def get_unit_class_default_unit(self, formatted_tag):
@@ -560,14 +565,9 @@ class TagValidator:
 
         """
         default_unit = ''
-        unit_class_tag = self.replace_tag_name_with_pound(formatted_tag)
         if self.is_unit_class_tag(formatted_tag):
-            if unit_class_tag in self._hed_schema_dictionaries[HedKey.UnitClass]:
-                unit_classes = \
-                    self._hed_schema_dictionaries[HedKey.UnitClass][unit_class_tag].split(',')
-                first_unit_class = unit_classes[0]
-                default_unit = self._hed_schema_dictionaries[HedKey.DefaultUnits][
-                    first_unit_class]
+            first_unit_class = self._hed_schema.get_takes_value_entry(formatted_tag).unit_classes[0]
+            default_unit = self._hed_schema_dictionaries[HedKey.DefaultUnits][first_unit_class]
         return default_unit
 
     def check_if_tag_requires_child(self, original_tag):
@@ -584,7 +584,8 @@ class TagValidator:
 
         """
         validation_issues = []
-        if self._hed_schema_dictionaries[HedKey.RequireChild].get(original_tag.lower()):
+        tag_entry = self._hed_schema.get_tag_entry(original_tag.lower())
+        if tag_entry is not None and tag_entry.require_child:
             validation_issues += self._error_handler.format_val_error(ValidationErrors.REQUIRE_CHILD,
                                                                       tag=original_tag)
         return validation_issues
@@ -603,13 +604,12 @@ class TagValidator:
         """
         validation_issues = []
         required_tag_prefixes = self._hed_schema_dictionaries[HedKey.RequiredPrefix]
-        for required_tag_prefix in required_tag_prefixes:
-            capitalized_required_tag_prefix = \
-                self._hed_schema_dictionaries[HedKey.RequiredPrefix][required_tag_prefix]
-            if sum([x.lower().startswith(required_tag_prefix) for x in tags]) < 1:
+        prefix_counts = self._count_prefix_matches(tags, self._required_prefix_index)
+        for required_tag_prefix, prefix_count in prefix_counts.items():
+            if prefix_count < 1:
                 validation_issues += self._error_handler.format_val_warning(
                     ValidationWarnings.REQUIRED_PREFIX_MISSING,
-                    tag_prefix=capitalized_required_tag_prefix)
+                    tag_prefix=required_tag_prefixes[required_tag_prefix])
         return validation_issues
 
     def check_if_multiple_unique_tags_exist(self, original_tag_list):
@@ -626,14 +626,59 @@ class TagValidator:
         """
         validation_issues = []
         unique_tag_prefixes = self._hed_schema_dictionaries[HedKey.Unique]
-        for unique_tag_prefix in unique_tag_prefixes:
-            unique_tag_prefix_bool_mask = [x.lower().startswith(unique_tag_prefix) for x in original_tag_list]
-            if sum(unique_tag_prefix_bool_mask) > 1:
+        prefix_counts = self._count_prefix_matches(original_tag_list, self._unique_prefix_index)
+        for unique_tag_prefix, prefix_count in prefix_counts.items():
+            if prefix_count > 1:
                 validation_issues += self._error_handler.format_val_error(
                     ValidationErrors.MULTIPLE_UNIQUE,
-                    tag_prefix=self._hed_schema_dictionaries[HedKey.Unique][unique_tag_prefix])
+                    tag_prefix=unique_tag_prefixes[unique_tag_prefix])
         return validation_issues
 
+    def _build_prefix_index(self, tag_attribute):
+        """Groups the tag prefixes with an attribute by length, so a tag can be checked against all of them at once.
+
+        Parameters
+        ----------
+        tag_attribute: str
+            The schema attribute the prefixes have, eg HedKey.Unique.
+        Returns
+        -------
+        prefix_index: ([int], [str])
+            The distinct prefix lengths in increasing order, and the prefixes in schema order.
+        """
+        tag_prefixes = list(self._hed_schema_dictionaries.get(tag_attribute, {}))
+        return sorted({len(tag_prefix) for tag_prefix in tag_prefixes}), tag_prefixes
+
+    @staticmethod
+    def _count_prefix_matches(tags, prefix_index):
+        """Counts how many of the tags start with each prefix, lower casing each tag once.
+
+        Parameters
+        ----------
+        tags: [HedTag]
+            The tags to check.
+        prefix_index: ([int], [str])
+            The prefixes to count, from _build_prefix_index.
+        Returns
+        -------
+        prefix_counts: {str: int}
+            The number of tags starting with each prefix, in schema order.
+        """
+        prefix_lengths, tag_prefixes = prefix_index
+        if not tag_prefixes:
+            return {}
+        prefix_counts = dict.fromkeys(tag_prefixes, 0)
+        for tag in tags:
+            formatted_tag = tag.lower()
+            tag_length = len(formatted_tag)
+            for prefix_length in prefix_lengths:
+                if prefix_length > tag_length:
+                    break
+                tag_prefix = formatted_tag[:prefix_length]
+                if tag_prefix in prefix_counts:
+                    prefix_counts[tag_prefix] += 1
+        return prefix_counts
+
     def tag_has_unique_prefix(self, tag):
         """Checks to see if the tag starts with a prefix.
 
@@ -647,11 +692,8 @@ class TagValidator:
             True if the tag starts with a unique prefix. False if otherwise.
 
         """
-        unique_tag_prefixes = self._hed_schema_dictionaries[HedKey.Unique]
-        for unique_tag_prefix in unique_tag_prefixes:
-            if tag.lower().startswith(unique_tag_prefix):
-                return True
-        return False
+        prefix_counts = self._count_prefix_matches([tag], self._unique_prefix_index)
+        return any(prefix_counts.values())
 
     def check_if_duplicate_tags_exist(self, original_tag_list):
         """Reports a validation error if two or more tags are the same.
@@ -728,41 +770,18 @@ class TagValidator:
             A validation issues list. If no issues are found then an empty list is returned.
 
         """
-        last_non_empty_valid_character = ''
-        last_non_empty_valid_index = 0
-        current_tag = ''
-        issues = []
+        string_scan = hed_string_util.scan_hed_string(hed_string, self.INVALID_STRING_CHARS)
+        return self._format_delimiter_issues(string_scan)
 
-        for i in range(len(hed_string)):
-            current_character = hed_string[i]
-            current_tag += current_character
-            if not current_character.strip():
-                continue
-            if TagValidator.character_is_delimiter(current_character):
-                if current_tag.strip() == current_character:
-                    issues += self._error_handler.format_val_error(ValidationErrors.EMPTY_TAG,
-                                                                   character=current_character,
-                                                                   index=i,
-                                                                   hed_string=hed_string)
-                    current_tag = ''
-                    continue
-                current_tag = ''
-            elif current_character == self.OPENING_GROUP_CHARACTER:
-                if current_tag.strip() == self.OPENING_GROUP_CHARACTER:
-                    current_tag = ''
-                else:
-                    issues += self._error_handler.format_val_error(ValidationErrors.COMMA_MISSING, tag=current_tag)
-            elif TagValidator.comma_is_missing_after_closing_parentheses(last_non_empty_valid_character,
-                                                                         current_character):
-                issues += self._error_handler.format_val_error(ValidationErrors.COMMA_MISSING, tag=current_tag[:-1])
-                break
-            last_non_empty_valid_character = current_character
-            last_non_empty_valid_index = i
-        if TagValidator.character_is_delimiter(last_non_empty_valid_character):
-            issues += self._error_handler.format_val_error(ValidationErrors.EMPTY_TAG,
-                                                           character=last_non_empty_valid_character,
-                                                           index=last_non_empty_valid_index,
-                                                           hed_string=hed_string)
+    def _format_delimiter_issues(self, string_scan):
+        """Formats the empty tag and missing comma issues found by scan_hed_string."""
+        issues = []
+        for error_type, error_params in string_scan.delimiter_issues:
+            if error_type == ValidationErrors.EMPTY_TAG:
+                issues += self._error_handler.format_val_error(error_type, hed_string=string_scan.hed_string,
+                                                               **error_params)
+            else:
+                issues += self._error_handler.format_val_error(error_type, **error_params)
         return issues
 
     def report_invalid_character_error(self, character, index, hed_string):
@@ -841,11 +860,14 @@ class TagValidator:
             A validation issues []. If no issues are found then an empty list is returned.
 
         """
-        validation_issues = []
-        for index, character in enumerate(hed_string):
-            if character in TagValidator.INVALID_STRING_CHARS:
-                validation_issues += self.report_invalid_character_error(character, index, hed_string)
+        string_scan = hed_string_util.scan_hed_string(hed_string, self.INVALID_STRING_CHARS)
+        return self._format_invalid_character_issues(string_scan)
 
+    def _format_invalid_character_issues(self, string_scan):
+        """Formats the invalid characters found by scan_hed_string."""
+        validation_issues = []
+        for index, character in string_scan.invalid_characters:
+            validation_issues += self.report_invalid_character_error(character, index, string_scan.hed_string)
         return validation_issues
 
     def count_tag_group_parentheses(self, hed_string):
@@ -862,9 +884,14 @@ class TagValidator:
             A validation issues list. If no issues are found then an empty list is returned.
 
         """
+        string_scan = hed_string_util.scan_hed_string(hed_string, self.INVALID_STRING_CHARS)
+        return self._format_parentheses_issues(string_scan)
+
+    def _format_parentheses_issues(self, string_scan):
+        """Formats an issue if scan_hed_string found an unequal number of opening and closing parentheses."""
         validation_issues = []
-        number_of_opening_parentheses = hed_string.count('(')
-        number_of_closing_parentheses = hed_string.count(')')
+        number_of_opening_parentheses = string_scan.opening_parentheses_count
+        number_of_closing_parentheses = string_scan.closing_parentheses_count
         if number_of_opening_parentheses != number_of_closing_parentheses:
             validation_issues += self._error_handler.format_val_error(
                 ValidationErrors.PARENTHESES,
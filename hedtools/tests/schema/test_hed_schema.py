@@ -3,6 +3,7 @@ import os
 
 from hed import schema
 from hed.schema import HedKey
+from hed.schema.tag_conversion_reference import convert_to_canonical_tag_reference
 from hed.util.exceptions import HedFileError
 from hed.util.hed_string import HedString
 
@@ -141,6 +142,38 @@ class TestHedSchema(unittest.TestCase):
         self.assertDictEqual(actual_default_units_dictionary, default_units)
         self.assertDictEqual(actual_all_units_dictionary, all_units)
 
+    def test_unit_class_matcher(self):
+        unit_matcher = self.hed_schema.get_unit_class_matcher('attribute/direction/top/#')
+        self.assertEqual(unit_matcher.unit_classes, ['angle', 'physicalLength', 'pixels'])
+        self.assertEqual(unit_matcher.units, ['radian', 'rad', 'degree', 'metre', 'm', 'foot', 'mile', 'pixel', 'px'])
+        self.assertIs(unit_matcher, self.hed_schema.get_unit_matcher(unit_matcher.units))
+        self.assertIsNone(self.hed_schema.get_unit_class_matcher('attribute/direction/top'))
+
+        self.assertEqual(unit_matcher.strip_unit('45 degrees', '45 degrees'), '45')
+        self.assertEqual(unit_matcher.strip_unit('3 pixels', '3 pixels'), '3')
+        self.assertEqual(unit_matcher.strip_unit('2 feet', '2 feet'), '2')
+        self.assertEqual(unit_matcher.strip_unit('2 yards', '2 yards'), '2 yards')
+
+    def test_tag_entries(self):
+        tag_entry = self.hed_schema.get_tag_entry('event/duration')
+        self.assertEqual(tag_entry.long_tag, 'Event/Duration')
+        self.assertTrue(tag_entry.require_child)
+        self.assertFalse(tag_entry.takes_value)
+        self.assertIs(tag_entry.takes_value_entry, self.hed_schema.get_tag_entry('event/duration/#'))
+        self.assertIs(self.hed_schema.get_takes_value_entry('event/duration/3 ms'), tag_entry.takes_value_entry)
+        self.assertTrue(tag_entry.takes_value_entry.takes_value)
+        self.assertEqual(tag_entry.takes_value_entry.unit_classes, ['time'])
+
+        tag_entry = self.hed_schema.get_tag_entry('event/label')
+        self.assertTrue(tag_entry.unique)
+        self.assertTrue(tag_entry.required)
+        self.assertIsNone(self.hed_schema.get_tag_entry('event/not a tag'))
+        self.assertIsNone(self.hed_schema.get_takes_value_entry('event/not a tag/3'))
+
+        self.assertTrue(self.hed_schema.get_tag_entry('item/object').extension_allowed_ancestor)
+        self.assertTrue(self.hed_schema.get_tag_entry('item/object/vehicle/train').extension_allowed_ancestor)
+        self.assertFalse(self.hed_schema.get_tag_entry('event/category').extension_allowed_ancestor)
+
     def test_large_dictionaries(self):
         expected_tag_count = {
             'isNumeric': 80,
@@ -297,3 +330,20 @@ class TestHedSchema(unittest.TestCase):
     def test_short_tag_mapping(self):
         self.assertFalse(self.hed_schema.short_tag_mapping)
         self.assertEqual(len(self.hed_schema_3g.short_tag_mapping), 1023)
+
+    def test_tag_path_lookup(self):
+        for hed_schema in (self.hed_schema, self.hed_schema_3g):
+            for long_tag in hed_schema.get_all_tags():
+                if not long_tag.endswith("/#"):
+                    self.assertEqual(hed_schema._tag_path_lookup[long_tag.lower()], long_tag)
+
+    def test_convert_to_canonical_tag_matches_reference(self):
+        test_tags = []
+        for long_tag in self.hed_schema_3g.get_all_tags():
+            split_tag = long_tag.split("/")
+            test_tags += [split_tag[-1], "/".join(split_tag[-2:]), long_tag.upper(), long_tag + "/Extension",
+                          split_tag[-1] + "/Extension/" + split_tag[0], "Junk/" + split_tag[-1], long_tag[3:]]
+        test_tags += ["", "/", "Event//Sensory-event", "Event/", "Duration/3 ms"]
+        for test_tag in test_tags:
+            self.assertEqual(self.hed_schema_3g._convert_to_canonical_tag(test_tag),
+                             convert_to_canonical_tag_reference(self.hed_schema_3g, test_tag), test_tag)
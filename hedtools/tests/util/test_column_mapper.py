@@ -116,6 +116,24 @@ class Test(unittest.TestCase):
         expanded_column = mapper._expand_column(2, "go")
         self.assertTrue(isinstance(expanded_column[0], HedString))
 
+    def test_expand_column_parses_once(self):
+        mapper = ColumnMapper()
+        mapper.add_json_file_defs(self.basic_events_json)
+        mapper.set_column_map(self.basic_column_map)
+        expanded_column, _ = mapper._expand_column(2, "go")
+        expanded_column2, _ = mapper._expand_column(2, "go")
+        self.assertIsNot(expanded_column, expanded_column2)
+        self.assertEqual(str(expanded_column), str(expanded_column2))
+        # Each cell gets its own copy, so changing one doesn't change the others.
+        for tag in expanded_column.get_all_tags():
+            tag.add_prefix_if_not_present(self.required_prefix)
+        self.assertEqual(str(mapper._expand_column(2, "go")[0]), str(expanded_column2))
+
+        column_def = mapper._final_column_map[3]
+        self.assertEqual(column_def.column_type, ColumnType.Value)
+        self.assertEqual(str(column_def.expand("1.435")[0]),
+                         str(HedString(column_def.hed_dict["HED"].replace("#", "1.435"))))
+
     def test_expand_row_tags(self):
         mapper = ColumnMapper()
         mapper.add_json_file_defs(self.basic_events_json)
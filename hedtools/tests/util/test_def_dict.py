@@ -6,7 +6,7 @@ from hed import schema
 from hed.util.def_dict import DefDict
 from hed.util import error_reporter
 from hed.util.error_types import DefinitionErrors
-from hed.util.hed_string import HedString
+from hed.util.hed_string import HedString, HedTag
 
 class TestDefBase(unittest.TestCase):
     schema_file = '../data/legacy_xml/HED8.0.0-alpha.1.xml'
@@ -90,6 +90,28 @@ class TestDefDict(TestDefBase):
 
         self.check_def_base(test_strings, expected_results)
 
+    def test_get_definition(self):
+        def_dict = DefDict()
+        def_dict.check_for_definitions(HedString(f"({self.placehodler_def_string}),{self.basic_def_string}"))
+        def_entry = def_dict._defs["testdefplaceholder"]
+        self.assertIsNone(def_entry.get_definition())
+
+        for placeholder_value in ["5", "12.5 Hz", "a,b", " 5"]:
+            def_tag, def_contents = def_entry.get_definition(placeholder_value)
+            self.assertEqual(str(def_tag), f"Def-expand/TestDefPlaceholder/{placeholder_value}")
+            expected_contents = HedString.split_hed_string_into_groups(
+                self.placeholder_def_contents.replace("#", placeholder_value))
+            self.assertEqual(str(def_contents), str(expected_contents))
+            self.assertEqual([tag.org_tag for tag in def_contents.get_all_tags()],
+                             [tag.org_tag for tag in expected_contents.get_all_tags()])
+
+        # Each expansion is a new copy, so changing one doesn't change the next.
+        def_entry = def_dict._defs["testdef"]
+        def_tag, def_contents = def_entry.get_definition()
+        next(def_contents.get_direct_children()).replace_tag(def_contents.get_all_tags()[0], HedTag("Item", (0, 4)))
+        def_tag, def_contents = def_entry.get_definition()
+        self.assertEqual(str(def_contents), self.def_contents_string)
+
     def test__check_tag_starts_with(self):
         target_tag_name = "definition/"
 
@@ -1,3 +1,5 @@
+import io
+import json
 import unittest
 from hed.util import error_reporter
 from hed.util import error_types
@@ -73,3 +75,79 @@ class Test(unittest.TestCase):
         self.assertTrue(len(error_list) == 2)
         filtered_list = self.error_handler.filter_issues_by_severity(issues_list=error_list, severity=ErrorSeverity.ERROR)
         self.assertTrue(len(filtered_list) == 1)
+
+    def test_issue_records(self):
+        self.error_handler.push_error_context(ErrorContext.ROW, 2)
+        error_list = self.error_handler.format_val_error(error_types.ValidationErrors.INVALID_TAG, tag="Bad/Tag")
+        error_list += self.error_handler.format_schema_error(error_types.SchemaErrors.NO_VALID_TAG_FOUND, "Bad/Tag",
+                                                             0, 3)
+        self.error_handler.reset_error_context()
+        self.assertEqual(error_list[0], {'code': error_types.ValidationErrors.INVALID_TAG,
+                                         'message': 'ERROR: Invalid tag - "Bad/Tag"',
+                                         'severity': ErrorSeverity.ERROR,
+                                         ErrorContext.ROW: (2, True)})
+        self.assertEqual(list(error_list[1]), ['code', 'message', 'source_tag', 'start_index', 'end_index',
+                                               'expected_parent_tag', 'severity', ErrorContext.ROW])
+        self.assertIs(error_list[0]._context_frame, error_list[1]._context_frame)
+
+        issues_without_context = self.error_handler.remove_context_from_issues(error_list)
+        self.assertEqual(dict(issues_without_context[1].items()),
+                         {key: value for key, value in error_list[1].items() if key != ErrorContext.ROW})
+        self.error_handler.push_error_context(ErrorContext.COLUMN, 4)
+        stored_issues = [dict(issue.items()) for issue in issues_without_context]
+        issues_with_context = self.error_handler.add_context_to_issues(stored_issues)
+        self.assertEqual(issues_with_context, self.error_handler.add_context_to_issues(issues_without_context))
+        self.error_handler.reset_error_context()
+        self.assertEqual(issues_with_context[0][ErrorContext.COLUMN], (4, True))
+        self.assertIn("Issues in column 4:", error_reporter.get_printable_issue_string(issues_with_context))
+
+    def test_issue_records_are_dicts(self):
+        self.error_handler.push_error_context(ErrorContext.ROW, 2)
+        issue = self.error_handler.format_val_error(error_types.ValidationErrors.INVALID_TAG, tag="Bad/Tag")[0]
+        self.error_handler.reset_error_context()
+        self.assertIsInstance(issue, dict)
+        self.assertEqual(json.loads(json.dumps(issue)), {'code': error_types.ValidationErrors.INVALID_TAG,
+                                                         'message': 'ERROR: Invalid tag - "Bad/Tag"',
+                                                         'severity': ErrorSeverity.ERROR,
+                                                         ErrorContext.ROW: [2, True]})
+        self.assertEqual(dict(issue), {**issue})
+        issue_copy = issue.copy()
+        issue['note'] = "Checked"
+        self.assertEqual(issue['note'], "Checked")
+        self.assertNotIn('note', issue_copy)
+        self.assertEqual(issue.copy()['note'], "Checked")
+        self.assertEqual(len(issue), 5)
+
+    def test_issue_writers(self):
+        self.error_handler.push_error_context(ErrorContext.FILE_NAME, "events.tsv")
+        issues = []
+        for row in range(2, 4):
+            self.error_handler.push_error_context(ErrorContext.ROW, row)
+            issues += self.error_handler.format_val_error(error_types.ValidationErrors.INVALID_TAG, tag="Bad\tTag")
+            issues += self.error_handler.format_val_warning(error_types.ValidationWarnings.CAPITALIZATION, tag="tag")
+            self.error_handler.pop_error_context()
+        self.error_handler.reset_error_context()
+
+        text_writer = error_reporter.TextIssueWriter(title="Title", severity=ErrorSeverity.ERROR)
+        chunks = list(text_writer.iter_text(issues, chunk_size=1))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(text_writer.issue_count, 2)
+        self.assertEqual("".join(chunks),
+                         error_reporter.get_printable_issue_string(issues, "Title", severity=ErrorSeverity.ERROR))
+
+        output = io.StringIO()
+        with error_reporter.JsonlIssueWriter(output) as jsonl_writer:
+            jsonl_writer.write_issues(issues)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(json.loads(lines[2])[ErrorContext.ROW], 3)
+        self.assertEqual(json.loads(lines[2])['message'], issues[2]['message'])
+
+        tsv_writer = error_reporter.TsvIssueWriter()
+        tsv_writer.write_issues(issues)
+        rows = [line.split("\t") for line in tsv_writer.pop_text().splitlines()]
+        self.assertEqual(rows[0], ['title', 'filename', 'sidecarColumnName', 'sidecarKeyName', 'row', 'column',
+                                   'HedString', 'code', 'severity', 'message'])
+        self.assertEqual(rows[1], ['', 'events.tsv', '', '', '2', '', '', error_types.ValidationErrors.INVALID_TAG,
+                                   '1', 'ERROR: Invalid tag - "Bad Tag"'])
+        self.assertEqual(len(rows), 5)
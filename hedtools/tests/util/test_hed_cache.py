@@ -1,7 +1,12 @@
 import unittest
 import os
 import itertools
+import json
+import shutil
+import stat
+import tempfile
 from hed.util import hed_cache
+from hed.schema.hed_schema_file import load_schema
 
 
 class Test(unittest.TestCase):
@@ -88,5 +93,57 @@ class Test(unittest.TestCase):
             final_version = f"HED{version}.xml"
             self.assertFalse(hed_cache.version_pattern.match(final_version))
 
+    def test_compiled_schema_cache(self):
+        saved_cache_dir = hed_cache.HED_CACHE_DIRECTORY
+        with tempfile.TemporaryDirectory() as cache_dir:
+            hed_cache.set_cache_directory(cache_dir)
+            try:
+                xml_path = os.path.join(cache_dir, "HED8.0.0-alpha.2.xml")
+                shutil.copy(os.path.join(self.hed_base_dir, "legacy_xml/HED8.0.0-alpha.2.xml"), xml_path)
+                loaded_schema = load_schema(xml_path)
+                compiled_files = [name for name in os.listdir(cache_dir)
+                                  if name.endswith(hed_cache.COMPILED_SCHEMA_EXTENSION)]
+                self.assertEqual(len(compiled_files), 1)
+                if os.name != 'nt':
+                    # The compiled file gets the same permissions as any other new file, not the temp file ones.
+                    plain_filename = os.path.join(cache_dir, "plain.txt")
+                    with open(plain_filename, "w") as f:
+                        f.write("")
+                    self.assertEqual(stat.S_IMODE(os.stat(os.path.join(cache_dir, compiled_files[0])).st_mode),
+                                     stat.S_IMODE(os.stat(plain_filename).st_mode))
+
+                compiled_schema = hed_cache.load_compiled_schema(xml_path)
+                self.assertEqual(compiled_schema, loaded_schema)
+                # The lookups that aren't saved are rebuilt.
+                self.assertEqual(compiled_schema._tag_path_lookup, loaded_schema._tag_path_lookup)
+                self.assertEqual(compiled_schema._tag_entries.keys(), loaded_schema._tag_entries.keys())
+                self.assertEqual(compiled_schema._unit_class_matchers.keys(),
+                                 loaded_schema._unit_class_matchers.keys())
+                self.assertEqual(compiled_schema._convert_to_canonical_tag("Sensory-event/Extension")[:2],
+                                 loaded_schema._convert_to_canonical_tag("Sensory-event/Extension")[:2])
+                self.assertEqual(load_schema(xml_path).filename, xml_path)
+
+                # Changing the xml makes the compiled version stale, and it is replaced on the next load.
+                with open(xml_path, "a") as f:
+                    f.write("\n")
+                self.assertIsNone(hed_cache.load_compiled_schema(xml_path))
+                self.assertEqual(load_schema(xml_path), loaded_schema)
+                new_compiled_files = [name for name in os.listdir(cache_dir)
+                                      if name.endswith(hed_cache.COMPILED_SCHEMA_EXTENSION)]
+                self.assertEqual(len(new_compiled_files), 1)
+                self.assertNotEqual(new_compiled_files, compiled_files)
+
+                # A corrupted compiled file is ignored.
+                with open(os.path.join(cache_dir, new_compiled_files[0]), "wb") as f:
+                    f.write(b"not a schema")
+                self.assertIsNone(hed_cache.load_compiled_schema(xml_path))
+                with open(os.path.join(cache_dir, new_compiled_files[0]), "w") as f:
+                    json.dump({'format_version': hed_cache.COMPILED_SCHEMA_FORMAT_VERSION,
+                               'sha1': new_compiled_files[0].split(".")[-2], 'schema': {'dictionaries': []}}, f)
+                self.assertIsNone(hed_cache.load_compiled_schema(xml_path))
+                self.assertEqual(load_schema(xml_path), loaded_schema)
+            finally:
+                hed_cache.set_cache_directory(saved_cache_dir)
+
 if __name__ == '__main__':
     unittest.main()
@@ -69,6 +69,34 @@ class Test(unittest.TestCase):
             self.assertEqual(row_number, row_number2)
             self.assertEqual(column_dict, column_dict)
 
+    def test_file_streaming(self):
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events.json")
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+        input_file = EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict)
+        streamed_file = EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict,
+                                       stream_chunk_size=2)
+
+        rows = list(input_file.iter_dataframe(return_row_dict=True))
+        streamed_rows = list(streamed_file.iter_dataframe(return_row_dict=True))
+        self.assertEqual(len(rows), len(streamed_rows))
+        for (row_number, row_dict), (row_number2, row_dict2) in zip(rows, streamed_rows):
+            self.assertEqual(row_number, row_number2)
+            self.assertEqual(str(row_dict["HED"]), str(row_dict2["HED"]))
+        self.assertRaises(ValueError, streamed_file.to_csv)
+
+    def test_iter_dataframe_skips_blank_rows(self):
+        events_string = "onset\tduration\tHED\n1\t2.5\tEvent\n\t\t\n3\t\tItem,Attribute\n4\t5\t\n"
+        input_file = HedFileInput("events.tsv", csv_string=events_string, tag_columns=[1, 3])
+        rows = [(row_number, {column_number: str(column_hed_string)
+                              for column_number, column_hed_string in column_to_hed_tags.items()})
+                for row_number, column_to_hed_tags in input_file]
+        self.assertEqual(rows, [(2, {1: "1.0", 3: "Event"}), (4, {1: "3.0", 3: "Item,Attribute"}), (5, {1: "4.0"})])
+
+    def test_file_streaming_spreadsheet(self):
+        self.assertRaises(HedFileError, HedFileInput, self.default_test_file_name, stream_chunk_size=2)
+
     def test_bad_file_inputs(self):
         self.assertRaises(HedFileError, EventFileInput, None)
 
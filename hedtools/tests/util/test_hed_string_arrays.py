@@ -0,0 +1,59 @@
+import unittest
+
+from hed.util.hed_string import HedString
+from hed.util.hed_string_arrays import HedStringArrays
+
+
+class TestHedStringArrays(unittest.TestCase):
+    test_strings = [
+        "Tag1,Tag2",
+        " Event/Extension , (Item/Object, (Attribute/Color/Red,Attribute/Size)) ,Label/1 ",
+        "(Tag1,Tag2,(Tag3,Tag4))",
+        "((Tag1,Tag2,(Tag3,Tag4))",
+        "(Tag1,Tag2,(Tag3,Tag4)))",
+        "Tag1,\n(Tag2 ,,Tag3),",
+        "",
+    ]
+
+    def test_matches_hed_string(self):
+        arrays = HedStringArrays(self.test_strings)
+        self.assertEqual(len(arrays), len(self.test_strings))
+        for string_index, test_string in enumerate(self.test_strings):
+            hed_string_obj = HedString(test_string)
+            parsed = hed_string_obj._top_level_group is not None
+            self.assertEqual(arrays.is_parsed(string_index), parsed)
+            self.assertEqual(arrays.get_str(string_index), str(hed_string_obj))
+            self.assertEqual(str(arrays.get_hed_string(string_index)), str(hed_string_obj))
+            if parsed:
+                self.assertEqual(arrays.get_tag_strings(string_index),
+                                 [tag.org_tag for tag in hed_string_obj.get_all_tags()])
+                self.assertEqual([span for span, _ in arrays.get_group_spans(string_index)],
+                                 [group.span for group in hed_string_obj.get_all_groups()[1:]])
+
+    def test_get_hed_string(self):
+        arrays = HedStringArrays()
+        string_index = arrays.append(self.test_strings[1])
+        self.assertEqual(arrays.get_group_spans(string_index), [((19, 70), 0), ((33, 69), 1)])
+        hed_string_obj = arrays[string_index]
+        groups = hed_string_obj.get_all_groups()
+        self.assertEqual(len(groups), 3)
+        self.assertEqual(groups[1].get_original_hed_string(), "(Item/Object, (Attribute/Color/Red,Attribute/Size))")
+        self.assertEqual([str(tag) for tag in groups[2].tags()], ["Attribute/Color/Red", "Attribute/Size"])
+
+    def test_get_hed_string_placeholder(self):
+        template = "Item/#, (Attribute/#/Label, Event), #"
+        arrays = HedStringArrays([template])
+        for placeholder_value in ["5", "12.5 Hz", "a,b", " 5", ""]:
+            expected_string = HedString(template.replace("#", placeholder_value))
+            hed_string_obj = arrays.get_hed_string(0, placeholder_value)
+            self.assertEqual(str(hed_string_obj), str(expected_string))
+            self.assertEqual([tag.org_tag for tag in hed_string_obj.get_all_tags()],
+                             [tag.org_tag for tag in expected_string.get_all_tags()])
+            self.assertEqual([group.span for group in hed_string_obj.get_all_groups()[1:]],
+                             [group.span for group in expected_string.get_all_groups()[1:]])
+        self.assertEqual(str(arrays.get_hed_group(0)), "Item/#,(Attribute/#/Label,Event),#")
+        self.assertIsNot(arrays.get_hed_group(0), arrays.get_hed_group(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 
 from hed.util import hed_string_util
+from hed.util.error_types import ValidationErrors
 
 
 class TestHedStringUtil(unittest.TestCase):
@@ -39,6 +40,21 @@ class TestHedStringUtil(unittest.TestCase):
 
         self.compare_split_results(test_strings, expected_results)
 
+    def test_scan_hed_string(self):
+        test_string = 'Event/Extension, (Event~, ,Event/Extension3)(Item'
+        string_scan = hed_string_util.scan_hed_string(test_string)
+        self.assertEqual(string_scan.split_positions, hed_string_util.split_hed_string(test_string))
+        self.assertEqual(string_scan.invalid_characters, [(23, '~')])
+        self.assertEqual(string_scan.opening_parentheses_count, 2)
+        self.assertEqual(string_scan.closing_parentheses_count, 1)
+        self.assertEqual(string_scan.delimiter_issues,
+                         [(ValidationErrors.EMPTY_TAG, {'character': ',', 'index': 26}),
+                          (ValidationErrors.COMMA_MISSING, {'tag': 'Event/Extension3)('})])
+
+        string_scan = hed_string_util.scan_hed_string('Event, (Item/Object),')
+        self.assertEqual(string_scan.invalid_characters, [])
+        self.assertEqual(string_scan.delimiter_issues, [(ValidationErrors.EMPTY_TAG, {'character': ',', 'index': 20})])
+
 
 if __name__ == '__main__':
     unittest.main()
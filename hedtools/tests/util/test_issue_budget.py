@@ -0,0 +1,53 @@
+import unittest
+
+from hed.util.error_reporter import ErrorHandler
+from hed.util.error_types import ErrorContext, IssueLimitErrors, ValidationErrors, ValidationWarnings
+from hed.util.issue_budget import IssueBudget
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.error_handler = ErrorHandler()
+        cls.row_issues = []
+        for row in range(1, 6):
+            cls.error_handler.push_error_context(ErrorContext.ROW, row)
+            issues = cls.error_handler.format_val_error(ValidationErrors.INVALID_TAG, tag="Bad/Tag")
+            issues += cls.error_handler.format_val_warning(ValidationWarnings.CAPITALIZATION, tag="tag")
+            cls.row_issues.append(issues)
+            cls.error_handler.pop_error_context()
+
+    def test_max_issues(self):
+        issue_budget = IssueBudget(max_issues=3)
+        kept_issues = [issue_budget.add_issues(issues) for issues in self.row_issues]
+        self.assertEqual([len(issues) for issues in kept_issues], [2, 1, 0, 0, 0])
+        self.assertEqual(issue_budget.exhausted_by, IssueLimitErrors.ISSUE_LIMIT_REACHED)
+
+        truncation_issues = issue_budget.get_truncation_issues(self.error_handler)
+        self.assertEqual([issue['code'] for issue in truncation_issues], [IssueLimitErrors.ISSUE_LIMIT_REACHED])
+        self.assertIn("3 issues", truncation_issues[0]['message'])
+        self.assertEqual(issue_budget.get_truncation_issues(self.error_handler), [])
+
+    def test_max_issues_per_code(self):
+        issue_budget = IssueBudget(max_issues_per_code=2)
+        for issues in self.row_issues:
+            issue_budget.add_issues(issues)
+        self.assertFalse(issue_budget.exhausted)
+        self.assertEqual(issue_budget.issue_count, 4)
+
+        truncation_issues = issue_budget.get_truncation_issues(self.error_handler)
+        self.assertEqual([issue['code'] for issue in truncation_issues], [IssueLimitErrors.CODE_LIMIT_REACHED] * 2)
+        self.assertIn(ValidationErrors.INVALID_TAG, truncation_issues[0]['message'])
+        self.assertIn("3", truncation_issues[0]['message'])
+
+    def test_max_error_rows(self):
+        issue_budget = IssueBudget(max_error_rows=2)
+        issue_budget.add_issues([])
+        self.assertEqual(issue_budget.error_row_count, 0)
+        kept_issues = [issue_budget.add_issues(issues) for issues in self.row_issues]
+        self.assertEqual([len(issues) for issues in kept_issues], [2, 2, 0, 0, 0])
+        self.assertEqual(issue_budget.exhausted_by, IssueLimitErrors.ERROR_ROW_LIMIT_REACHED)
+
+
+if __name__ == '__main__':
+    unittest.main()
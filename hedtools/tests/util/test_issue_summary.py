@@ -0,0 +1,68 @@
+import unittest
+
+from hed.util.error_reporter import ErrorHandler
+from hed.util.error_types import ErrorContext, ErrorSeverity, ValidationErrors, ValidationWarnings
+from hed.util.issue_summary import IssueSummary
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        error_handler = ErrorHandler()
+        error_handler.push_error_context(ErrorContext.FILE_NAME, "events.tsv")
+        cls.issues = []
+        for row in range(1, 11):
+            error_handler.push_error_context(ErrorContext.ROW, row)
+            error_handler.push_error_context(ErrorContext.COLUMN, row % 2)
+            cls.issues += error_handler.format_val_error(ValidationErrors.INVALID_TAG, tag=f"Bad/Tag{row % 3}")
+            cls.issues += error_handler.format_val_warning(ValidationWarnings.CAPITALIZATION, tag="tag")
+            error_handler.pop_error_context()
+            error_handler.pop_error_context()
+
+    def test_add_issues(self):
+        summary = IssueSummary(max_examples=5, seed=0)
+        summary.add_issues(self.issues)
+        self.assertEqual(summary.issue_count, 20)
+        self.assertEqual(summary.row_count, 10)
+        self.assertEqual(summary.code_counts[ValidationErrors.INVALID_TAG], 10)
+        self.assertEqual(summary.severity_counts[ErrorSeverity.WARNING], 10)
+        self.assertEqual(summary.file_counts["events.tsv"], 20)
+        self.assertEqual(summary.column_counts[0], 10)
+        self.assertEqual(summary.tag_counts.most_common(1), [("tag", 10)])
+        # The summary doesn't need the messages.
+        self.assertTrue(all(issue._message is None for issue in self.issues))
+        self.assertEqual(len(summary.examples), 5)
+        for issue in summary.examples:
+            self.assertTrue(any(issue is other_issue for other_issue in self.issues))
+
+        summary_dict = summary.get_summary_dict(top_count=2)
+        self.assertEqual(summary_dict['error_count'], 10)
+        self.assertEqual(summary_dict['top_tags'], [("tag", 10), ("Bad/Tag1", 4)])
+        self.assertFalse(summary_dict['tags_truncated'])
+
+    def test_row_count(self):
+        # Issues from the same row don't have to be next to each other, eg when a later pass checks every row again.
+        summary = IssueSummary()
+        summary.add_issues(self.issues[::2])
+        summary.add_issues(self.issues[1::2])
+        self.assertEqual(summary.issue_count, 20)
+        self.assertEqual(summary.row_count, 10)
+        self.assertFalse(summary.get_summary_dict()['rows_truncated'])
+
+    def test_max_rows(self):
+        summary = IssueSummary(max_rows=4)
+        summary.add_issues(self.issues)
+        self.assertEqual(summary.row_count, 10)
+        self.assertTrue(summary.rows_truncated)
+        self.assertLessEqual(len(summary._seen_rows), 4)
+
+    def test_max_tags(self):
+        summary = IssueSummary(max_tags=2)
+        summary.add_issues(self.issues)
+        self.assertTrue(summary.tags_truncated)
+        self.assertLessEqual(len(summary.tag_counts), 2)
+        self.assertLessEqual(summary.tag_counts["tag"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
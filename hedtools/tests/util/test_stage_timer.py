@@ -0,0 +1,51 @@
+import threading
+import unittest
+
+from hed.util import hed_string_util
+from hed.util.stage_timer import StageTimer, ValidationStages, timed_stage
+
+
+@timed_stage(ValidationStages.STRING_CHECKS)
+def _timed_function(value):
+    return value
+
+
+class Test(unittest.TestCase):
+    def test_timed_stage(self):
+        stage_timer = StageTimer()
+        self.assertEqual(_timed_function(1), 1)
+        self.assertEqual(stage_timer.get_report(), {})
+        with stage_timer.activate():
+            self.assertEqual(_timed_function(2), 2)
+            self.assertEqual(_timed_function(3), 3)
+        _timed_function(4)
+        report = stage_timer.get_report()
+        self.assertEqual(list(report), [ValidationStages.STRING_CHECKS])
+        self.assertEqual(report[ValidationStages.STRING_CHECKS]['count'], 2)
+        self.assertAlmostEqual(report[ValidationStages.STRING_CHECKS]['mean_seconds'] * 2,
+                               report[ValidationStages.STRING_CHECKS]['total_seconds'])
+        stage_timer.reset()
+        self.assertEqual(stage_timer.get_report(), {})
+
+    def test_activate_nested(self):
+        outer_timer = StageTimer()
+        inner_timer = StageTimer()
+        with outer_timer.activate():
+            hed_string_util.split_hed_string("Event, Item")
+            with inner_timer.activate():
+                hed_string_util.split_hed_string("Event")
+            hed_string_util.split_hed_string("Item")
+        self.assertEqual(outer_timer.stage_counts[ValidationStages.TOKENIZE], 2)
+        self.assertEqual(inner_timer.stage_counts[ValidationStages.TOKENIZE], 1)
+
+    def test_activate_other_thread(self):
+        stage_timer = StageTimer()
+        with stage_timer.activate():
+            thread = threading.Thread(target=_timed_function, args=(1,))
+            thread.start()
+            thread.join()
+        self.assertEqual(stage_timer.get_report(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import shutil
+import tempfile
+
+from hed.util import validation_cache
+from hed.util.validation_cache import ValidationCache
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.cache_folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_folder)
+
+    def test_get_and_put(self):
+        cache = ValidationCache(self.cache_folder)
+        key = cache.make_key("fingerprint", True, "string", "Event/Label/Test")
+        self.assertNotEqual(key, cache.make_key("fingerprint", False, "string", "Event/Label/Test"))
+        self.assertNotEqual(cache.make_key("a", "bc"), cache.make_key("ab", "c"))
+        self.assertIsNone(cache.get(key))
+
+        issues = [{'code': 'invalidTag', 'message': 'ERROR: Invalid tag - "Test"', 'severity': 1}]
+        cache.put(key, issues)
+        empty_key = cache.make_key("empty")
+        cache.put(empty_key, [])
+        cache.close()
+
+        cache = ValidationCache(self.cache_folder)
+        self.assertEqual(cache.get(key), issues)
+        self.assertEqual(cache.get(empty_key), [])
+        self.assertEqual(cache.get_stats()['size'], 2)
+        cache.close()
+
+    def test_prune(self):
+        cache = ValidationCache(self.cache_folder, max_size_bytes=1024 * 1024)
+        issues = [{'code': 'invalidTag', 'message': 'x' * 100, 'severity': 1}]
+        keys = [cache.make_key(i) for i in range(20)]
+        for key in keys:
+            cache.put(key, issues)
+        cache.flush()
+        self.assertEqual(cache.prune(), 0)
+
+        entry_size = cache.get_size_bytes() // len(keys)
+        self.assertEqual(cache.prune(entry_size * 5), 15)
+        self.assertEqual(cache.get_stats()['size'], 5)
+        cache.close()
+
+        validation_cache.main(["clear", self.cache_folder])
+        cache = ValidationCache(self.cache_folder)
+        self.assertEqual(cache.get_stats()['size'], 0)
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
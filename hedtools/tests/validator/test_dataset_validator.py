@@ -0,0 +1,44 @@
+import unittest
+import os
+
+from hed.schema.hed_schema_file import load_schema
+from hed.util.event_file_input import EventFileInput
+from hed.util.error_types import ErrorContext
+from hed.validator.hed_validator import HedValidator
+from hed.validator import dataset_validator
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
+        cls.hed_schema = load_schema(os.path.join(data_dir, 'HED8.0.0-alpha.2.mediawiki'))
+        cls.events_path = os.path.join(data_dir, 'bids_events.tsv')
+        cls.json_path = os.path.join(data_dir, 'bids_events.json')
+        cls.bad_json_path = os.path.join(data_dir, 'bids_events_bad_defs.json')
+
+    def test_iter_validate_events_files(self):
+        events_files = [self.events_path, (self.events_path, self.bad_json_path), self.events_path]
+        results = list(dataset_validator.iter_validate_events_files(events_files, self.hed_schema,
+                                                                    json_def_files=self.json_path,
+                                                                    max_workers=2, chunk_size=2))
+        self.assertEqual([filename for filename, _ in results], [self.events_path] * 3)
+        self.assertEqual(len(results[0][1]), 0)
+        self.assertEqual(len(results[2][1]), 0)
+
+        expected_issues = HedValidator(hed_schema=self.hed_schema).validate_input(
+            EventFileInput(self.events_path, json_def_files=self.bad_json_path))
+        self.assertEqual([issue['message'] for issue in results[1][1]],
+                         [issue['message'] for issue in expected_issues])
+        self.assertEqual(results[1][1][0][ErrorContext.FILE_NAME][0], self.events_path)
+
+    def test_validate_events_files(self):
+        validation_issues = dataset_validator.validate_events_files([self.events_path, self.events_path],
+                                                                    self.hed_schema,
+                                                                    json_def_files=self.bad_json_path,
+                                                                    max_workers=2)
+        self.assertEqual(len(validation_issues), 84)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -76,6 +76,42 @@ class HedTagLists(TestHedStrings):
                                        '/Attribute/Location/Screen/Top/70 px',
                                        '/Attribute/Location/Screen/Left/23 px'])
 
+    def test_all_tags_and_groups(self):
+        hed_string_obj = HedString('Tag1,(Tag2,(Tag3,(Tag4)),Tag5),Tag6')
+        self.assertEqual([str(tag) for tag in hed_string_obj.get_all_tags()],
+                         ['Tag1', 'Tag2', 'Tag3', 'Tag4', 'Tag5', 'Tag6'])
+        self.assertEqual([str(group) for group in hed_string_obj.get_all_groups()],
+                         ['Tag1,(Tag2,(Tag3,(Tag4)),Tag5),Tag6', '(Tag2,(Tag3,(Tag4)),Tag5)', '(Tag3,(Tag4))', '(Tag4)'])
+        self.assertEqual(list(hed_string_obj.iter_all_tags()), hed_string_obj.get_all_tags())
+        self.assertEqual(list(hed_string_obj.iter_all_groups()), hed_string_obj.get_all_groups())
+
+        groups = hed_string_obj.get_all_groups()
+        tag3 = hed_string_obj.get_all_tags()[2]
+        hed_string_obj.replace_tag(groups[2], tag3, [HedString('Tag7,Tag8').get_all_tags()[0]])
+        self.assertEqual([str(tag) for tag in hed_string_obj.get_all_tags()],
+                         ['Tag1', 'Tag2', 'Tag7', 'Tag4', 'Tag5', 'Tag6'])
+        self.assertEqual(len(hed_string_obj.get_all_groups()), 5)
+
+        hed_string_obj.remove_groups([groups[1]])
+        self.assertEqual([str(tag) for tag in hed_string_obj.get_all_tags()], ['Tag1', 'Tag6'])
+        self.assertEqual(str(hed_string_obj), 'Tag1,Tag6')
+
+    def test_cached_lists_are_per_string(self):
+        hed_string_obj = HedString('Tag1,(Tag2,Tag3)')
+        other_string_obj = HedString('Tag4,(Tag5)')
+        other_tags = other_string_obj.get_all_tags()
+        other_flattened = other_string_obj._flattened
+
+        group = hed_string_obj.get_all_groups()[1]
+        hed_string_obj.replace_tag(group, hed_string_obj.get_all_tags()[1], HedString('Tag6').get_all_tags()[0])
+        self.assertEqual([str(tag) for tag in hed_string_obj.get_all_tags()], ['Tag1', 'Tag6', 'Tag3'])
+        hed_string_obj.remove_groups([group])
+        self.assertEqual([str(tag) for tag in hed_string_obj.get_all_tags()], ['Tag1'])
+
+        # Changing one string doesn't throw away the lists cached by another.
+        self.assertEqual(other_string_obj.get_all_tags(), other_tags)
+        self.assertIs(other_string_obj._flattened, other_flattened)
+
     # Update test - verify how double quote should be handled
     # def test_double_quotes(self):
     #     double_quote_string = 'Event/Category/Experimental stimulus,"Item/Object/Vehicle/Train",' \
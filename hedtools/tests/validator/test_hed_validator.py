@@ -1,14 +1,24 @@
+import json
 import random
 import unittest
+from collections import Counter
 import os
+import shutil
+import tempfile
 
 from hed.util.hed_string import HedString
 from hed.util.hed_file_input import HedFileInput
-from hed.util.error_types import ErrorContext
+from hed.util.error_types import ErrorContext, IssueLimitErrors
 from hed.util.event_file_input import EventFileInput
 from hed.schema.hed_schema_file import load_schema
 from hed.validator.hed_validator import HedValidator
 from hed.util.column_def_group import ColumnDefGroup
+from hed.util.def_mapper import DefinitionMapper
+from hed.util.error_reporter import get_printable_issue_string
+from hed.util.issue_budget import IssueBudget
+from hed.util.issue_summary import IssueSummary
+from hed.util.stage_timer import StageTimer, ValidationStages
+from hed.util.validation_cache import ValidationCache
 from hed.util import util_constants
 
 class Test(unittest.TestCase):
@@ -111,6 +121,17 @@ class Test(unittest.TestCase):
         self.assertIsInstance(validation_issues, list)
         self.assertTrue(validation_issues)
 
+    def test_validate_batch(self):
+        hed_strings = ['Event/Label/Test,Event/Description/Test', 'this/is/not/a/valid/tag1', 'Event/Label/Test,,',
+                       'Event/Label/Test,Event/Description/Test', 'this/is/not/a/valid/tag1', '']
+        batch_issues = self.generic_hed_input_reader.validate_batch(hed_strings)
+        self.assertEqual(len(batch_issues), len(hed_strings))
+        for hed_string, issues in zip(hed_strings, batch_issues):
+            single_issues = self.generic_hed_input_reader.validate_input(hed_string)
+            self.assertEqual([issue['message'] for issue in issues], [issue['message'] for issue in single_issues])
+        self.assertTrue(batch_issues[1])
+        self.assertIsNot(batch_issues[1][0], batch_issues[4][0])
+
     def test_complex_file_validation(self):
         schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
         events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
@@ -149,6 +170,60 @@ class Test(unittest.TestCase):
         validation_issues = validator.validate_input(input_file)
         self.assertEqual(len(validation_issues), 42)
 
+    def test_cache_cells(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events_bad_defs.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+
+        validator = HedValidator(hed_schema=hed_schema, check_for_warnings=True)
+        validation_issues = validator.validate_input(
+            EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict))
+        cached_cell_issues = validator.validate_input(
+            EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict), cache_cells=True)
+        self.assertEqual(len(validation_issues), 42)
+        self.assertEqual(get_printable_issue_string(cached_cell_issues, skip_filename=False),
+                         get_printable_issue_string(validation_issues, skip_filename=False))
+
+        input_file = EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict)
+        column_strings = {}
+        for _, column_to_hed_tags in input_file.iter_dataframe(cache_cells=True):
+            for column_number, column_hed_string in column_to_hed_tags.items():
+                column_strings.setdefault((column_number, str(column_hed_string)), column_hed_string)
+                self.assertIs(column_strings[(column_number, str(column_hed_string))], column_hed_string)
+
+    def test_validation_cache(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events_bad_defs.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+        hed_strings = ['Event/Label/Test,Event/Description/Test', 'this/is/not/a/valid/tag1', 'Event/Label/Test,,']
+
+        expected_file_issues = HedValidator(hed_schema=hed_schema).validate_input(
+            EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict))
+        expected_string_issues = HedValidator(hed_schema=hed_schema).validate_input(hed_strings)
+        cache_folder = tempfile.mkdtemp()
+        try:
+            for _ in range(2):
+                validation_cache = ValidationCache(cache_folder)
+                validator = HedValidator(hed_schema=hed_schema, validation_cache=validation_cache)
+                file_issues = validator.validate_input(
+                    EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict))
+                string_issues = validator.validate_input(hed_strings)
+                self.assertEqual(get_printable_issue_string(file_issues, skip_filename=False),
+                                 get_printable_issue_string(expected_file_issues, skip_filename=False))
+                self.assertEqual([get_printable_issue_string(issues) for issues in string_issues],
+                                 [get_printable_issue_string(issues) for issues in expected_string_issues])
+                validation_cache.close()
+            self.assertEqual(validation_cache.misses, 0)
+            self.assertTrue(validation_cache.hits)
+        finally:
+            shutil.rmtree(cache_folder)
+
     def test_file_bad_defs_in_spreadsheet(self):
         schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                                    '../data/legacy_xml/HED8.0.0-alpha.1.xml')
@@ -163,6 +238,147 @@ class Test(unittest.TestCase):
         validator = HedValidator(hed_schema=hed_schema)
         validation_issues = validator.validate_input(loaded_file)
         self.assertEqual(len(validation_issues), 2)
-            
+
+    def test_defer_definitions(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   '../data/legacy_xml/HED8.0.0-alpha.1.xml')
+        hed_schema = load_schema(schema_path)
+        # The first row uses definitions from later rows, and one that is never defined.
+        events_string = "\n".join(["Event\tHED",
+                                   "Def/Later\tDef/Placeholder/5,Def/Missing",
+                                   "(Definition/Later,(Item))\tEvent",
+                                   "(Definition/Placeholder/#,(Item/#))\t(Definition/Later,(Item))",
+                                   "Def/Later\tDef/Placeholder"])
+
+        validator = HedValidator(hed_schema=hed_schema)
+        expected_issues = validator.validate_input(HedFileInput("events.tsv", tag_columns=[1, 2],
+                                                                csv_string=events_string,
+                                                                definition_mapper=DefinitionMapper()))
+        loaded_file = HedFileInput("events.tsv", tag_columns=[1, 2], csv_string=events_string,
+                                   definition_mapper=DefinitionMapper(), defer_definitions=True)
+        self.assertEqual(len(loaded_file.file_def_dict), 0)
+        validation_issues = validator.validate_input(loaded_file)
+        self.assertEqual(len(loaded_file.file_def_dict), 2)
+        self.assertEqual(len(validation_issues), 3)
+        self.assertEqual(get_printable_issue_string(validation_issues, skip_filename=False),
+                         get_printable_issue_string(expected_issues, skip_filename=False))
+
+    def test_iter_validation_issues(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events_bad_defs.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+
+        validator = HedValidator(hed_schema=hed_schema)
+        expected_issues = validator.validate_input(EventFileInput(events_path, json_def_files=column_group,
+                                                                  def_dicts=def_dict))
+        self.assertTrue(expected_issues)
+        issue_iter = validator.iter_validation_issues(EventFileInput(events_path, json_def_files=column_group,
+                                                                     def_dicts=def_dict))
+        self.assertEqual(next(issue_iter), expected_issues[0])
+        self.assertEqual(validator._error_handler.error_context[0][1], events_path)
+        self.assertEqual(get_printable_issue_string([expected_issues[0]] + list(issue_iter), skip_filename=False),
+                         get_printable_issue_string(expected_issues, skip_filename=False))
+        self.assertEqual(validator._error_handler.error_context, [])
+
+    def test_validate_input_summary(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events_bad_defs.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+
+        validator = HedValidator(hed_schema=hed_schema)
+        validation_issues = validator.validate_input(EventFileInput(events_path, json_def_files=column_group,
+                                                                    def_dicts=def_dict))
+        issue_summary = IssueSummary()
+        self.assertIs(validator.validate_input(EventFileInput(events_path, json_def_files=column_group,
+                                                              def_dicts=def_dict), issue_summary=issue_summary),
+                      issue_summary)
+        self.assertEqual(issue_summary.issue_count, len(validation_issues))
+        self.assertEqual(issue_summary.code_counts, Counter(issue['code'] for issue in validation_issues))
+        self.assertEqual(issue_summary.file_counts[events_path], len(validation_issues))
+        self.assertEqual(len(issue_summary.examples), min(len(validation_issues), IssueSummary.DEFAULT_MAX_EXAMPLES))
+
+    def test_validate_input_json(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events_bad_defs.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+
+        validator = HedValidator(hed_schema=hed_schema)
+        validation_issues = validator.validate_input(EventFileInput(events_path, json_def_files=column_group,
+                                                                    def_dicts=def_dict))
+        self.assertTrue(validation_issues)
+        self.assertTrue(all(isinstance(issue, dict) for issue in validation_issues))
+        json_issues = json.loads(json.dumps(validation_issues))
+        self.assertEqual([issue['message'] for issue in json_issues],
+                         [issue['message'] for issue in validation_issues])
+        self.assertEqual(json_issues[0][ErrorContext.FILE_NAME][0], events_path)
+
+    def test_validate_input_budget(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events_bad_defs.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+
+        validator = HedValidator(hed_schema=hed_schema)
+        events_input = EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict)
+        validation_issues = validator.validate_input(events_input)
+        def_issue_count = len(events_input.file_def_dict_issues)
+        issue_budget = IssueBudget(max_issues=3)
+        budget_issues = validator.validate_input(EventFileInput(events_path, json_def_files=column_group,
+                                                                def_dicts=def_dict), issue_budget=issue_budget)
+        self.assertTrue(issue_budget.exhausted)
+        self.assertEqual(budget_issues[:-1], validation_issues[:def_issue_count + 3])
+        self.assertEqual(budget_issues[-1]['code'], IssueLimitErrors.ISSUE_LIMIT_REACHED)
+
+        issue_budget = IssueBudget(max_issues=3)
+        iter_issues = list(validator.iter_validation_issues(EventFileInput(events_path, json_def_files=column_group,
+                                                                           def_dicts=def_dict),
+                                                            issue_budget=issue_budget))
+        self.assertEqual(iter_issues, budget_issues)
+
+        string_issues = validator.validate_input(["Invalidtag1, Invalidtag2", "Invalidtag3", "Event"],
+                                                 issue_budget=IssueBudget(max_issues=2))
+        self.assertEqual([len(issues) for issues in string_issues], [3, 0, 0])
+
+    def test_validate_input_stage_timer(self):
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.2.mediawiki')
+        events_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/bids_events.tsv')
+        json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../data/bids_events.json")
+        hed_schema = load_schema(schema_path)
+        column_group = ColumnDefGroup(json_path)
+        def_dict, _ = column_group.extract_defs()
+
+        validator = HedValidator(hed_schema=hed_schema)
+        events_input = EventFileInput(events_path, json_def_files=column_group, def_dicts=def_dict)
+        validator.validate_input(events_input)
+        stage_timer = StageTimer()
+        validator.stage_timer = stage_timer
+        validator.validate_input(events_input)
+        report = stage_timer.get_report()
+        row_count = report[ValidationStages.ROW_EXPANSION]['count']
+        self.assertGreater(row_count, 0)
+        for stage in (ValidationStages.TOKENIZE, ValidationStages.STRING_CHECKS,
+                      ValidationStages.CANONICAL_CONVERSION, ValidationStages.INDIVIDUAL_TAG_CHECKS,
+                      ValidationStages.TAG_LEVEL_CHECKS, ValidationStages.DEFINITION_EXPANSION):
+            self.assertGreaterEqual(report[stage]['count'], row_count)
+
+        stage_timer.reset()
+        list(validator.iter_validation_issues(events_input))
+        self.assertEqual(stage_timer.get_report()[ValidationStages.ROW_EXPANSION]['count'], row_count)
+        validator.stage_timer = None
+        validator.validate_input(events_input)
+        self.assertEqual(stage_timer.get_report()[ValidationStages.ROW_EXPANSION]['count'], row_count)
+
+
 if __name__ == '__main__':
     unittest.main()
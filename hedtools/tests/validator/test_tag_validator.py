@@ -1,12 +1,16 @@
+import copy
+import gc
 import unittest
 import os
+import weakref
 
 from hed.util.hed_string import HedString
 from hed.validator.hed_validator import HedValidator
 from hed.util import error_reporter
 from hed.validator.tag_validator import TagValidator
 from hed import schema
-from hed.util.error_types import ValidationErrors, ValidationWarnings, SchemaErrors
+from hed.util.error_types import ValidationErrors, ValidationWarnings, SchemaErrors, ErrorContext
+from hed.util.lru_cache import LRUCache
 
 
 class TestHed3(unittest.TestCase):
@@ -274,6 +278,55 @@ class IndividualHedTagsShort(TestHed3):
         self.validator_semantic(test_strings, expected_results, expected_issues, False)
 
 
+class IndividualTagCache(TestHed3):
+    def test_cached_issues_use_current_context(self):
+        error_handler = error_reporter.ErrorHandler()
+        tag_validator = TagValidator(self.hed_schema, run_semantic_validation=True, error_handler=error_handler)
+        hed_string = HedString('Event/Nonsense,Event/Nonsense')
+        hed_string.calculate_canonical_forms(self.hed_schema)
+        first_tag, second_tag = hed_string.get_all_tags()
+
+        error_handler.push_error_context(ErrorContext.ROW, 1)
+        first_issues = tag_validator.run_individual_tag_validators(first_tag)
+        error_handler.pop_error_context()
+        error_handler.push_error_context(ErrorContext.ROW, 2)
+        second_issues = tag_validator.run_individual_tag_validators(second_tag)
+        error_handler.pop_error_context()
+
+        self.assertEqual(len(first_issues), 1)
+        self.assertEqual(first_issues[0]['message'], second_issues[0]['message'])
+        self.assertEqual(first_issues[0][ErrorContext.ROW][0], 1)
+        self.assertEqual(second_issues[0][ErrorContext.ROW][0], 2)
+        self.assertEqual(tag_validator.get_tag_cache_stats()['hits'], 1)
+        self.assertEqual(tag_validator.get_tag_cache_stats()['misses'], 1)
+
+    def test_cache_size_is_bounded(self):
+        tag_validator = TagValidator(self.hed_schema, tag_cache=LRUCache(2))
+        hed_string = HedString('Event/Nonsense1,Event/Nonsense2,Event/Nonsense3')
+        hed_string.calculate_canonical_forms(self.hed_schema)
+        for tag in hed_string.get_all_tags():
+            tag_validator.run_individual_tag_validators(tag)
+        self.assertEqual(tag_validator.get_tag_cache_stats()['size'], 2)
+
+    def test_shared_cache_is_per_schema(self):
+        tag_cache = LRUCache(16)
+        hed_string = HedString('Event/Nonsense')
+        hed_string.calculate_canonical_forms(self.hed_schema)
+        tag = hed_string.get_all_tags()[0]
+        TagValidator(self.hed_schema, tag_cache=tag_cache).run_individual_tag_validators(tag)
+        TagValidator(self.hed_schema, tag_cache=tag_cache).run_individual_tag_validators(tag)
+        self.assertEqual(tag_cache.get_stats()['hits'], 1)
+
+        other_schema = copy.copy(self.hed_schema)
+        schema_ref = weakref.ref(other_schema)
+        TagValidator(other_schema, tag_cache=tag_cache).run_individual_tag_validators(tag)
+        self.assertEqual(tag_cache.get_stats()['hits'], 1)
+        # The cache keeps the schema alive, so its id can't be given to a different schema.
+        del other_schema
+        gc.collect()
+        self.assertIsNotNone(schema_ref())
+
+
 class TestTagLevels3(TestHed3):
     def validator_syntactic(self, test_strings, expected_results, expected_issues, check_for_warnings):
         if check_for_warnings is True:
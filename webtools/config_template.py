@@ -27,7 +27,15 @@ class Config(object):
     STATIC_URL_PATH_ATTRIBUTE_NAME = 'STATIC_URL_PATH'
     UPLOAD_FOLDER = os.path.join(tempfile.gettempdir(), 'hedtools_uploads')
     URL_PREFIX = None
+    # Maximum number of loaded schemas to keep in memory for reuse between requests.
+    SCHEMA_REGISTRY_SIZE = 8
     HED_CACHE_FOLDER = os.path.join(BASE_DIRECTORY, 'schema_cache')
+    # Default limits on the validation issues reported, which requests can override.  None means no limit.
+    VALIDATION_MAX_ISSUES = None
+    VALIDATION_MAX_ISSUES_PER_CODE = None
+    VALIDATION_MAX_ERROR_ROWS = None
+    # If True, every service response reports the time spent in each validation stage.
+    VALIDATION_STAGE_TIMING = False
 
 
 class DevelopmentConfig(Config):
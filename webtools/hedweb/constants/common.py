@@ -44,6 +44,14 @@ JSON_PATH = 'json_path'
 JSON_STRING = 'json_string'
 JSON_STRINGS = 'json_strings'
 
+# Limits on the number of validation issues to report, named as in hed.util.issue_budget.IssueBudget
+MAX_ERROR_ROWS = 'max_error_rows'
+MAX_ISSUES = 'max_issues'
+MAX_ISSUES_PER_CODE = 'max_issues_per_code'
+
+# If true, the time spent in each validation stage is returned with a service response
+STAGE_TIMING = 'stage_timing'
+
 OUTPUT_DISPLAY_NAME = 'output_display_name'
 
 # Schema-specific constants
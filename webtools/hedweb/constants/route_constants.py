@@ -14,6 +14,7 @@ EVENTS_SUBMIT_ROUTE = '/events_submit'
 HED_TOOLS_HELP_ROUTE = '/hed-tools-help'
 HED_TOOLS_HOME_ROUTE = '/'
 
+SCHEMA_REGISTRY_STATS_ROUTE = '/schema_registry_stats'
 SCHEMA_ROUTE = '/schema'
 SCHEMA_SUBMIT_ROUTE = '/schema_submit'
 SCHEMA_VERSION_ROUTE = '/schema_version'
@@ -2,7 +2,6 @@ from flask import current_app
 from werkzeug import Response
 import pandas as pd
 
-from hed.util.error_reporter import get_printable_issue_string
 from hed.util.event_file_input import EventFileInput
 from hed.util.exceptions import HedFileError
 from hed.validator.hed_validator import HedValidator
@@ -10,7 +9,8 @@ from hedweb.constants import common, file_constants
 from hedweb.dictionary import dictionary_validate
 from hedweb.web_utils import form_has_option, generate_response_download_file_from_text,\
     generate_filename, generate_text_response, get_events, get_hed_schema, get_json_dictionary, \
-    get_hed_path_from_pull_down, get_uploaded_file_path_from_form
+    get_hed_path_from_pull_down, get_issue_budget, get_issue_limits_from_form, get_uploaded_file_path_from_form, \
+    get_validation_issues_text
 app_config = current_app.config
 
 
@@ -50,6 +50,7 @@ def generate_input_from_events_form(request):
         arguments[common.COMMAND] = ''
     arguments[common.DEFS_EXPAND] = form_has_option(request, common.DEFS_EXPAND, 'on')
     arguments[common.CHECK_FOR_WARNINGS] = form_has_option(request, common.CHECK_FOR_WARNINGS, 'on')
+    arguments.update(get_issue_limits_from_form(request))
     return arguments
 
 
@@ -69,7 +70,7 @@ def events_process(arguments):
     if common.COMMAND not in arguments:
         raise HedFileError('MissingCommand', 'Command is missing', '')
     elif arguments['command'] == common.COMMAND_VALIDATE:
-        results = events_validate(arguments)
+        results = events_validate(arguments, stream_issues=True)
     elif arguments['command'] == common.COMMAND_ASSEMBLE:
         results = events_assemble(arguments)
     else:
@@ -154,7 +155,7 @@ def events_convert(arguments, short_to_long=True, hed_schema=None):
             'msg': 'This convert command has not yet been implemented for spreadsheets'}
 
 
-def events_validate(arguments, hed_schema=None, events=None):
+def events_validate(arguments, hed_schema=None, events=None, stream_issues=False):
     """Reports the spreadsheet validation status.
 
     Parameters
@@ -165,6 +166,8 @@ def events_validate(arguments, hed_schema=None, events=None):
         Version number or path or HedSchema object to be used
     events: EventFileInput
         Event file object passed in from elsewhere
+    stream_issues: bool
+        If True, the data is an iterator of issue text chunks, produced while the rest of the file is validated.
 
     Returns
     -------
@@ -184,11 +187,11 @@ def events_validate(arguments, hed_schema=None, events=None):
         events = get_events(arguments, json_dictionary=json_dictionary)
     schema_version = hed_schema.header_attributes.get('version', 'Unknown version')
     validator = HedValidator(check_for_warnings=arguments[common.CHECK_FOR_WARNINGS], hed_schema=hed_schema)
-    issues = validator.validate_input(events)
-    if issues:
-        display_name = arguments.get(common.EVENTS_FILE, None)
-        issue_str = get_printable_issue_string(issues, f"{display_name} HED validation errors")
-
+    display_name = arguments.get(common.EVENTS_FILE, None)
+    issue_budget = get_issue_budget(arguments)
+    issue_str = get_validation_issues_text(validator, events, f"{display_name} HED validation errors", stream_issues,
+                                           issue_budget)
+    if issue_str:
         file_name = generate_filename(display_name, suffix='_validation_errors', extension='.txt')
         return {'command': arguments.get('command', ''), 'data': issue_str, "output_display_name": file_name,
                 'schema_version': schema_version, "msg_category": "warning",
@@ -10,6 +10,7 @@ from hedweb.web_utils import delete_file_no_exceptions, \
 from hedweb import dictionary, events, schema, spreadsheet, services
 from hedweb.strings import generate_input_from_string_form, string_process
 from hedweb.spreadsheet_utils import generate_input_columns_info, get_columns_info
+from hedweb.schema_registry import get_schema_registry
 
 app_config = current_app.config
 route_blueprint = Blueprint(route_constants.ROUTE_BLUEPRINT, __name__)
@@ -122,6 +123,23 @@ def schema_versions_results():
         return handle_error(ex)
 
 
+@route_blueprint.route(route_constants.SCHEMA_REGISTRY_STATS_ROUTE, methods=['GET'])
+def schema_registry_stats_results():
+    """Gets the hit, miss and eviction counts of the loaded schema registry and returns as a serialized JSON string
+
+    Returns
+    -------
+    string
+        A serialized JSON string containing the schema registry counters.
+
+    """
+
+    try:
+        return json.dumps(get_schema_registry().get_stats())
+    except Exception as ex:
+        return handle_error(ex)
+
+
 @route_blueprint.route(route_constants.SERVICES_SUBMIT_ROUTE, strict_slashes=False, methods=['POST'])
 def services_results():
     """Perform the requested web service and return the results in JSON.
@@ -0,0 +1,137 @@
+"""
+This module contains a process wide registry of loaded HED schemas, so repeated requests don't reload them.
+
+Schemas in the registry are shared between requests, and must not be modified once loaded.
+"""
+import hashlib
+import os
+import threading
+
+from flask import current_app
+
+from hed.util.lru_cache import LRUCache
+
+DEFAULT_SCHEMA_REGISTRY_SIZE = 8
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+class SchemaRegistry:
+    """A thread safe least recently used cache of loaded schemas."""
+
+    def __init__(self, max_size=DEFAULT_SCHEMA_REGISTRY_SIZE):
+        """Constructor for the SchemaRegistry class.
+
+        Parameters
+        ----------
+        max_size: int
+            The maximum number of schemas to keep loaded.
+        """
+        self._schemas = LRUCache(max_size)
+        self._lock = threading.Lock()
+
+    def get_schema(self, key, load_function):
+        """Returns the schema registered under key, loading and registering it first if needed.
+
+        Parameters
+        ----------
+        key: tuple
+            Identifies the schema.  See get_version_key, get_file_key and get_string_key.
+        load_function: func
+            Called with no arguments to load the schema if it isn't registered.
+        Returns
+        -------
+        hed_schema: HedSchema
+            The loaded schema.
+        """
+        with self._lock:
+            hed_schema = self._schemas.get(key)
+        if hed_schema is None:
+            hed_schema = load_function()
+            with self._lock:
+                self._schemas.put(key, hed_schema)
+        return hed_schema
+
+    def get_stats(self):
+        """Returns the hit, miss and eviction counters for the registry.
+
+        Returns
+        -------
+        stats: {}
+            Contains the keys hits, misses, evictions, size and max_size.
+        """
+        with self._lock:
+            return self._schemas.get_stats()
+
+    def clear(self):
+        """Removes all registered schemas and resets the counters."""
+        with self._lock:
+            self._schemas.clear()
+
+    @staticmethod
+    def get_path_key(hed_file_path):
+        """Returns a key for a schema file that is only replaced, never rewritten in place, eg the hed cache.
+
+        Parameters
+        ----------
+        hed_file_path: str
+            The path to the schema file.
+        Returns
+        -------
+        key: tuple
+            The key based on the path and modification time of the file.
+        """
+        return 'path', os.path.abspath(hed_file_path), os.path.getmtime(hed_file_path)
+
+    @staticmethod
+    def get_file_key(hed_file_path):
+        """Returns a key for a schema file based on its contents, eg for uploaded or downloaded temporary files.
+
+        Parameters
+        ----------
+        hed_file_path: str
+            The path to the schema file.
+        Returns
+        -------
+        key: tuple
+            The key based on the extension and contents of the file.
+        """
+        file_hash = hashlib.sha1()
+        with open(hed_file_path, 'rb') as f:
+            for block in iter(lambda: f.read(65536), b''):
+                file_hash.update(block)
+        _, extension = os.path.splitext(hed_file_path)
+        return 'content', extension.lower(), file_hash.hexdigest()
+
+    @staticmethod
+    def get_string_key(schema_string, schema_format):
+        """Returns a key for a schema passed in as a string.
+
+        Parameters
+        ----------
+        schema_string: str
+            The contents of the schema.
+        schema_format: str
+            The format of the schema string, eg .xml
+        Returns
+        -------
+        key: tuple
+            The key based on the format and contents of the string.
+        """
+        return 'content', schema_format.lower(), hashlib.sha1(schema_string.encode('utf-8')).hexdigest()
+
+
+def get_schema_registry():
+    """Returns the registry for this process, creating it with the SCHEMA_REGISTRY_SIZE app setting if needed.
+
+    Returns
+    -------
+    registry: SchemaRegistry
+        The process wide schema registry.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SchemaRegistry(current_app.config.get('SCHEMA_REGISTRY_SIZE', DEFAULT_SCHEMA_REGISTRY_SIZE))
+        return _registry
@@ -6,7 +6,7 @@ from hedweb.constants import common
 from hedweb.dictionary import dictionary_convert, dictionary_validate
 from hedweb.events import events_assemble, events_validate
 from hedweb.strings import string_convert, string_validate
-from hedweb.web_utils import handle_error
+from hedweb.web_utils import get_stage_timer, handle_error
 
 app_config = current_app.config
 
@@ -53,6 +53,8 @@ def services_process(arguments):
     arguments dict
         a dictionary of arguments
         Keys include "hed_strings", "check_for_warnings", and "schema_file"
+        If "stage_timing" is true, or the VALIDATION_STAGE_TIMING setting is, the time spent in each validation stage
+        is returned under "stage_timing"
 
     Returns
     -------
@@ -63,44 +65,69 @@ def services_process(arguments):
 
     service = arguments.get('service', '')
     response = {'service': service, 'results': '', 'error_type': '', 'error_msg': ''}
+    stage_timer = None
     try:
-        if not service:
-            response["error_type"] = 'HEDServiceMissing'
-            response["error_msg"] = "Must specify a valid service"
-        elif service == 'get_services':
-            response["results"] = services_list()
-        elif service == "dictionary_to_long":
-            arguments['command'] = common.COMMAND_TO_LONG
-            response["results"] = dictionary_convert(arguments)
-        elif service == "dictionary_to_short":
-            arguments['command'] = common.COMMAND_TO_SHORT
-            response["results"] = dictionary_convert(arguments)
-        elif service == "dictionary_validate":
-            arguments['command'] = common.COMMAND_VALIDATE
-            response["results"] = dictionary_validate(arguments)
-        elif service == "events_assemble":
-            arguments['command'] = common.COMMAND_ASSEMBLE
-            response["results"] = events_assemble(arguments)
-        elif service == "events_validate":
-            arguments['command'] = common.COMMAND_VALIDATE
-            response["results"] = events_validate(arguments)
-        elif service == "spreadsheet_validate":
-            response["error_type"] = 'HEDServiceNotYetImplemented'
-            response["error_msg"] = f"{service} not yet implemented"
-        elif service == "string_to_long":
-            arguments['command'] = common.COMMAND_TO_LONG
-            response["results"] = string_convert(arguments)
-        elif service == "string_to_short":
-            arguments['command'] = common.COMMAND_TO_SHORT
-            response["results"] = string_convert(arguments)
-        elif service == "string_validate":
-            arguments['command'] = common.COMMAND_VALIDATE
-            response["results"] = string_validate(arguments)
+        stage_timer = get_stage_timer(arguments)
+        if stage_timer is None:
+            _run_service(service, arguments, response)
         else:
-            response["error_type"] = 'HEDServiceNotSupported'
-            response["error_msg"] = f"{service} not supported"
+            with stage_timer.activate():
+                _run_service(service, arguments, response)
     except Exception as ex:
         errors = handle_error(ex)
         response['error_type'] = errors['error_type']
         response['error_msg'] = errors['error_msg']
+    if stage_timer is not None:
+        response['stage_timing'] = stage_timer.get_report()
     return response
+
+
+def _run_service(service, arguments, response):
+    """
+    Runs the requested service, putting its results or an error in the response
+
+    Parameters
+    ----------
+    service: str
+        The name of the service
+    arguments: dict
+        a dictionary of arguments for the service
+    response: dict
+        The response returned by services_process
+    """
+
+    if not service:
+        response["error_type"] = 'HEDServiceMissing'
+        response["error_msg"] = "Must specify a valid service"
+    elif service == 'get_services':
+        response["results"] = services_list()
+    elif service == "dictionary_to_long":
+        arguments['command'] = common.COMMAND_TO_LONG
+        response["results"] = dictionary_convert(arguments)
+    elif service == "dictionary_to_short":
+        arguments['command'] = common.COMMAND_TO_SHORT
+        response["results"] = dictionary_convert(arguments)
+    elif service == "dictionary_validate":
+        arguments['command'] = common.COMMAND_VALIDATE
+        response["results"] = dictionary_validate(arguments)
+    elif service == "events_assemble":
+        arguments['command'] = common.COMMAND_ASSEMBLE
+        response["results"] = events_assemble(arguments)
+    elif service == "events_validate":
+        arguments['command'] = common.COMMAND_VALIDATE
+        response["results"] = events_validate(arguments)
+    elif service == "spreadsheet_validate":
+        response["error_type"] = 'HEDServiceNotYetImplemented'
+        response["error_msg"] = f"{service} not yet implemented"
+    elif service == "string_to_long":
+        arguments['command'] = common.COMMAND_TO_LONG
+        response["results"] = string_convert(arguments)
+    elif service == "string_to_short":
+        arguments['command'] = common.COMMAND_TO_SHORT
+        response["results"] = string_convert(arguments)
+    elif service == "string_validate":
+        arguments['command'] = common.COMMAND_VALIDATE
+        response["results"] = string_validate(arguments)
+    else:
+        response["error_type"] = 'HEDServiceNotSupported'
+        response["error_msg"] = f"{service} not supported"
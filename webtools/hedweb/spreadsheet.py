@@ -1,13 +1,13 @@
 from flask import current_app
 
-from hed.util.error_reporter import get_printable_issue_string
 from hed.util.exceptions import HedFileError
 from hed.util.hed_file_input import HedFileInput
 from hed.validator.hed_validator import HedValidator
 from hedweb.constants import common, file_constants
 from hedweb.web_utils import convert_number_str_to_list, form_has_option,\
     generate_filename, generate_response_download_file_from_text, generate_text_response, get_hed_schema, \
-    get_hed_path_from_pull_down, get_spreadsheet, get_uploaded_file_path_from_form, get_optional_form_field
+    get_hed_path_from_pull_down, get_issue_budget, get_issue_limits_from_form, get_spreadsheet, \
+    get_uploaded_file_path_from_form, get_optional_form_field, get_validation_issues_text
 from hedweb.spreadsheet_utils import get_specific_tag_columns_from_form
 
 app_config = current_app.config
@@ -48,6 +48,7 @@ def generate_input_from_spreadsheet_form(request):
         arguments[common.COMMAND_TO_LONG] = True
     arguments[common.DEFS_EXPAND] = form_has_option(request, common.DEFS_EXPAND, 'on')
     arguments[common.CHECK_FOR_WARNINGS] = form_has_option(request, common.CHECK_FOR_WARNINGS, 'on')
+    arguments.update(get_issue_limits_from_form(request))
     return arguments
 
 
@@ -68,7 +69,7 @@ def spreadsheet_process(arguments):
     if not arguments[common.SPREADSHEET_PATH]:
         raise HedFileError('EmptySpreadsheetFile', "Please upload a spreadsheet to process", "")
     if arguments.get(common.COMMAND_VALIDATE, None):
-        results = spreadsheet_validate(arguments)
+        results = spreadsheet_validate(arguments, stream_issues=True)
     elif arguments.get(common.COMMAND_TO_SHORT, None):
         results = spreadsheet_convert(arguments, short_to_long=False)
     elif arguments.get(common.COMMAND_TO_LONG, None):
@@ -111,7 +112,7 @@ def spreadsheet_convert(arguments, short_to_long=True, hed_schema=None):
             'msg': 'This convert command has not yet been implemented for spreadsheets'}
 
 
-def spreadsheet_validate(arguments, hed_schema=None, spreadsheet=None):
+def spreadsheet_validate(arguments, hed_schema=None, spreadsheet=None, stream_issues=False):
     """ Validates the spreadsheet.
 
     Parameters
@@ -122,6 +123,8 @@ def spreadsheet_validate(arguments, hed_schema=None, spreadsheet=None):
         Version number or path or HedSchema object to be used
     spreadsheet: HedFileInput
         Spreadsheet object
+    stream_issues: bool
+        If True, the data is an iterator of issue text chunks, produced while the rest of the file is validated.
     Returns
     -------
     HedValidator object
@@ -133,11 +136,11 @@ def spreadsheet_validate(arguments, hed_schema=None, spreadsheet=None):
     if not spreadsheet:
         spreadsheet = get_spreadsheet(arguments)
     validator = HedValidator(check_for_warnings=arguments[common.CHECK_FOR_WARNINGS], hed_schema=hed_schema)
-    issues = validator.validate_input(spreadsheet)
-    if issues:
-        display_name = arguments.get(common.SPREADSHEET_FILE, None)
-        issue_str = get_printable_issue_string(issues, f"{display_name} HED validation errors")
-
+    display_name = arguments.get(common.SPREADSHEET_FILE, None)
+    issue_budget = get_issue_budget(arguments)
+    issue_str = get_validation_issues_text(validator, spreadsheet, f"{display_name} HED validation errors",
+                                           stream_issues, issue_budget)
+    if issue_str:
         file_name = generate_filename(display_name, suffix='_validation_errors', extension='.txt')
         return {'command': arguments.get('command', ''), 'data': issue_str, "output_display_name": file_name,
                 'schema_version': schema_version, "msg_category": "warning",
@@ -5,7 +5,8 @@ from hed.util.hed_string import HedString
 from hed.util.exceptions import HedFileError
 from hed.validator.hed_validator import HedValidator
 from hedweb.constants import common
-from hedweb.web_utils import form_has_option, get_hed_path_from_pull_down, get_hed_schema
+from hedweb.web_utils import form_has_option, get_hed_path_from_pull_down, get_hed_schema, get_issue_budget, \
+    get_issue_limits_from_form
 
 app_config = current_app.config
 
@@ -40,6 +41,7 @@ def generate_input_from_string_form(request):
     elif form_has_option(request, common.COMMAND_OPTION, common.COMMAND_TO_LONG):
         arguments[common.COMMAND] = common.COMMAND_TO_LONG
     arguments[common.CHECK_FOR_WARNINGS] = form_has_option(request, common.CHECK_FOR_WARNINGS, 'on')
+    arguments.update(get_issue_limits_from_form(request))
     return arguments
 
 
@@ -136,12 +138,19 @@ def string_validate(arguments, hed_schema=None):
     else:
         raise HedFileError('NoStringList', 'No list of HED strings was entered', '')
     hed_validator = HedValidator(check_for_warnings=arguments[common.CHECK_FOR_WARNINGS], hed_schema=hed_schema)
+    issue_budget = get_issue_budget(arguments)
 
     validation_errors = []
     for pos, string in enumerate(hed_strings, start=1):
-        issues = hed_validator.validate_input(string)
+        issues = hed_validator.validate_input(string, issue_budget=issue_budget)
         if issues:
             validation_errors.append(get_printable_issue_string(issues, f"Errors for HED string {pos}:"))
+        if issue_budget is not None and issue_budget.exhausted:
+            skipped_count = len(hed_strings) - pos
+            if skipped_count:
+                validation_errors.append(f"Validation stopped early.  The last {skipped_count} of "
+                                         f"{len(hed_strings)} HED strings were not validated.")
+            break
     schema_version = hed_schema.header_attributes.get('version', 'Unknown version')
     if validation_errors:
         return {'command': arguments.get('command', ''), 'data': validation_errors,
@@ -1,4 +1,5 @@
 import os
+import itertools
 import json
 import pathlib
 import tempfile
@@ -8,15 +9,27 @@ from flask import current_app, Response
 
 from hed.schema.hed_schema_file import load_schema, from_string
 from hed.util import hed_cache, file_util
+from hed.util.error_reporter import get_printable_issue_string, TextIssueWriter
 from hed.util.event_file_input import EventFileInput
 from hed.util.hed_file_input import HedFileInput
 from hed.util.column_def_group import ColumnDefGroup
 from hed.util.exceptions import HedFileError
+from hed.util.issue_budget import IssueBudget
+from hed.util.stage_timer import StageTimer
 from hed.util.file_util import get_file_extension, delete_file_if_it_exists
 from hedweb.constants import common
+from hedweb.schema_registry import SchemaRegistry, get_schema_registry
 
 app_config = current_app.config
 
+# The arguments that limit the issues reported, with the app settings that give their defaults.
+ISSUE_LIMIT_SETTINGS = {common.MAX_ISSUES: 'VALIDATION_MAX_ISSUES',
+                        common.MAX_ISSUES_PER_CODE: 'VALIDATION_MAX_ISSUES_PER_CODE',
+                        common.MAX_ERROR_ROWS: 'VALIDATION_MAX_ERROR_ROWS'}
+
+# The strings accepted for boolean arguments, which may come from JSON as either booleans or strings.
+BOOLEAN_STRINGS = {'true': True, 'on': True, '1': True, 'false': False, 'off': False, '0': False}
+
 
 def convert_number_str_to_list(number_str):
     """Converts a string of integers to a list of integers, which is useful for hedweb forms.
@@ -161,8 +174,8 @@ def generate_response_download_file_from_text(download_text, display_name=None,
 
     Parameters
     ----------
-    download_text: str
-        Text with newlines for iterating.
+    download_text: str or iterator
+        Text with newlines for iterating, or an iterator of text chunks, which are streamed as they are produced.
     display_name: str
         Name to be assigned to the file in the response
     header: str
@@ -184,10 +197,13 @@ def generate_response_download_file_from_text(download_text, display_name=None,
     if not download_text:
         raise HedFileError('EmptyDownloadText', f"No download text given", "")
 
+    if isinstance(download_text, str):
+        download_text = download_text.splitlines(True)
+
     def generate():
         if header:
             yield header
-        for issue in download_text.splitlines(True):
+        for issue in download_text:
             yield issue
 
     return Response(generate(), mimetype='text/plain charset=utf-8',
@@ -339,22 +355,119 @@ def get_hed_path_from_pull_down(request):
 
 
 def get_hed_schema(arguments):
+    """Returns the schema described by the arguments, reusing an already loaded one from the schema registry.
+
+    Parameters
+    ----------
+    arguments: dict
+        Contains one of common.SCHEMA_STRING, common.SCHEMA_PATH, common.SCHEMA_URL, or common.SCHEMA_VERSION.
+    Returns
+    -------
+    hed_schema: HedSchema
+        The loaded schema.  This is shared between requests and must not be modified.
+    """
+    schema_registry = get_schema_registry()
     if common.SCHEMA_STRING in arguments:
         schema_format = arguments.get(common.SCHEMA_FORMAT, ".xml")
-        hed_schema = from_string(arguments[common.SCHEMA_STRING], file_type=schema_format)
+        schema_string = arguments[common.SCHEMA_STRING]
+        hed_schema = schema_registry.get_schema(SchemaRegistry.get_string_key(schema_string, schema_format),
+                                                lambda: from_string(schema_string, file_type=schema_format))
     elif common.SCHEMA_PATH in arguments:
-        hed_schema = load_schema(arguments[common.SCHEMA_PATH])
+        hed_file_path = arguments[common.SCHEMA_PATH]
+        hed_schema = schema_registry.get_schema(SchemaRegistry.get_file_key(hed_file_path),
+                                                lambda: load_schema(hed_file_path))
     elif common.SCHEMA_URL in arguments:
         hed_file_path = file_util.url_to_file(arguments[common.SCHEMA_URL])
-        hed_schema = load_schema(hed_file_path)
+        hed_schema = schema_registry.get_schema(SchemaRegistry.get_file_key(hed_file_path),
+                                                lambda: load_schema(hed_file_path))
     elif common.SCHEMA_VERSION in arguments:
         hed_file_path = hed_cache.get_path_from_hed_version(arguments[common.SCHEMA_VERSION])
-        hed_schema = load_schema(hed_file_path)
+        hed_schema = schema_registry.get_schema(SchemaRegistry.get_path_key(hed_file_path),
+                                                lambda: load_schema(hed_file_path))
     else:
         raise HedFileError('NoHEDSchema', 'No valid HED schema was provided', '')
     return hed_schema
 
 
+def get_issue_budget(arguments):
+    """Returns an IssueBudget with the issue limits in the arguments, using the app settings for any left out.
+
+    Parameters
+    ----------
+    arguments: dict
+        May contain common.MAX_ISSUES, common.MAX_ISSUES_PER_CODE, and common.MAX_ERROR_ROWS as positive integers.
+    Returns
+    -------
+    IssueBudget or None
+        The budget to validate with, or None if there are no limits.
+    """
+    limits = {}
+    for limit_name, setting_name in ISSUE_LIMIT_SETTINGS.items():
+        limit = arguments.get(limit_name, None)
+        if limit is None or limit == '':
+            limit = app_config.get(setting_name, None)
+        if limit is None:
+            continue
+        if not str(limit).isdigit() or int(limit) < 1:
+            raise HedFileError('BadIssueLimit', f"{limit_name} must be a positive integer", '')
+        limits[limit_name] = int(limit)
+    if not limits:
+        return None
+    return IssueBudget(**limits)
+
+
+def get_issue_limits_from_form(request):
+    """Gets the issue limits entered in a form.
+
+    Parameters
+    ----------
+    request: Request object
+        A Request object containing user data from a form.
+
+    Returns
+    -------
+    dict
+        The non-empty issue limit fields, for adding to the arguments passed to get_issue_budget.
+    """
+    return {limit_name: request.form[limit_name] for limit_name in ISSUE_LIMIT_SETTINGS
+            if request.form.get(limit_name, '')}
+
+
+def get_validation_issues_text(validator, hed_input, title, stream_issues=False, issue_budget=None):
+    """Validates hed_input and returns its issues in printable form.
+
+    Parameters
+    ----------
+    validator: HedValidator
+        The validator to use.
+    hed_input: HedFileInput
+        The spreadsheet or events file to validate.
+    title: str
+        The title to put before the issues.
+    stream_issues: bool
+        If True, the text is returned as an iterator of chunks, which validates the rest of the file as it is read.
+        This is meant for passing to generate_response_download_file_from_text.
+    issue_budget: IssueBudget or None
+        If present, validation stops once the budget is used up.
+
+    Returns
+    -------
+    str or iterator
+        The printable issues, or '' if there were none.
+    """
+    if not stream_issues:
+        issues = validator.validate_input(hed_input, issue_budget=issue_budget)
+        if not issues:
+            return ''
+        return get_printable_issue_string(issues, title)
+
+    issues = validator.iter_validation_issues(hed_input, issue_budget=issue_budget)
+    first_issue = next(issues, None)
+    if first_issue is None:
+        return ''
+    return TextIssueWriter(title=title).iter_text(itertools.chain([first_issue], issues))
+
+
 def get_json_dictionary(arguments, json_optional=False):
     if common.JSON_STRING in arguments:
         json_dictionary = ColumnDefGroup(json_string=arguments[common.JSON_STRING])
@@ -410,6 +523,30 @@ def get_spreadsheet(arguments):
     return spreadsheet
 
 
+def get_stage_timer(arguments):
+    """Returns a StageTimer if stage timing is turned on in the arguments, or by the app setting if it is left out.
+
+    Parameters
+    ----------
+    arguments: dict
+        May contain common.STAGE_TIMING as a boolean or one of the strings in BOOLEAN_STRINGS.
+    Returns
+    -------
+    StageTimer or None
+        The timer to validate with, or None if stage timing is off.
+    """
+    stage_timing = arguments.get(common.STAGE_TIMING, None)
+    if stage_timing is None or stage_timing == '':
+        stage_timing = app_config.get('VALIDATION_STAGE_TIMING', False)
+    if isinstance(stage_timing, str):
+        if stage_timing.lower() not in BOOLEAN_STRINGS:
+            raise HedFileError('BadStageTiming', f"{common.STAGE_TIMING} must be true or false", '')
+        stage_timing = BOOLEAN_STRINGS[stage_timing.lower()]
+    if not stage_timing:
+        return None
+    return StageTimer()
+
+
 def get_uploaded_file_path_from_form(request, file_key, valid_extensions=None):
     """Gets the other paths of the uploaded files in the form.
 
@@ -66,6 +66,23 @@ class Test(unittest.TestCase):
             self.assertEqual('warning', results['msg_category'], "dictionary_validation did not valid with 7.2.0")
             self.assertEqual('7.2.0', results['schema_version'], 'Version 7.2.0 was used')
 
+    def test_services_process_stage_timing(self):
+        from hedweb.services import services_process
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/HED8.0.0-alpha.1.xml')
+        arguments = {'service': 'string_validate', 'schema_path': schema_path, 'check_for_warnings': False,
+                     'string_list': ['Event, Invalidtag', '(Item']}
+        with self.app.app_context():
+            response = services_process(dict(arguments))
+            self.assertNotIn('stage_timing', response, 'services_process only reports stage timing when asked')
+            response = services_process(dict(arguments, stage_timing='false'))
+            self.assertNotIn('stage_timing', response, 'services_process treats the string false as false')
+            response = services_process(dict(arguments, stage_timing=True))
+            self.assertFalse(response['error_type'])
+            stage_timing = response['stage_timing']
+            self.assertEqual(stage_timing['string_checks']['count'], 2)
+            self.assertIn('tokenize', stage_timing)
+            self.assertGreaterEqual(stage_timing['tokenize']['total_seconds'], 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -82,6 +82,20 @@ class Test(unittest.TestCase):
             response = string_validate(arguments)
             self.assertEqual('success', response['msg_category'], "string_validate should return success if converted")
 
+    def test_string_validate_issue_limit(self):
+        from hedweb.strings import string_validate
+        from hedweb.constants import common
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data/HED8.0.0-alpha.1.xml')
+        arguments = {common.COMMAND: common.COMMAND_VALIDATE,
+                     common.CHECK_FOR_WARNINGS: False, common.MAX_ISSUES: 1,
+                     common.SCHEMA_PATH: schema_path, common.SCHEMA_DISPLAY_NAME: 'HED8.0.0-alpha.1.xml',
+                     'string_list': ['Invalidtag1', 'Invalidtag2', 'Invalidtag3', 'Invalidtag4']}
+        with self.app.app_context():
+            response = string_validate(arguments)
+            self.assertEqual(len(response['data']), 2, "string_validate stops after reaching the issue limit")
+            self.assertIn("Errors for HED string 1:", response['data'][0])
+            self.assertIn("The last 3 of 4 HED strings were not validated.", response['data'][1])
+
 
 if __name__ == '__main__':
     unittest.main()
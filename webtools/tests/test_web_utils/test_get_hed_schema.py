@@ -97,6 +97,33 @@ class Test(unittest.TestCase):
             self.assertEqual('8.0.0-alpha.1', schema_version,
                              'get_hed_schema HedSchema object should have correct version')
 
+    def test_get_hed_schema_registry(self):
+        from hedweb.constants import common
+        from hedweb.web_utils import get_hed_schema
+        from hedweb.schema_registry import get_schema_registry
+
+        schema_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data/HED8.0.0-alpha.1.xml')
+        with open(schema_path, "r") as myfile:
+            schema_string = myfile.read()
+        with self.app.app_context():
+            registry = get_schema_registry()
+            registry.clear()
+            hed_schema = get_hed_schema({common.SCHEMA_PATH: schema_path})
+            self.assertIs(get_hed_schema({common.SCHEMA_PATH: schema_path}), hed_schema,
+                          'get_hed_schema should reuse a schema with the same contents')
+            self.assertIs(get_hed_schema({common.SCHEMA_STRING: schema_string}), hed_schema,
+                          'get_hed_schema should reuse a schema string with the same contents as a file')
+            other_schema = get_hed_schema({common.SCHEMA_STRING: schema_string + "\n"})
+            self.assertIsNot(other_schema, hed_schema)
+            stats = registry.get_stats()
+            self.assertEqual(stats['hits'], 2)
+            self.assertEqual(stats['misses'], 2)
+            self.assertEqual(stats['size'], 2)
+
+            response = self.app.test.get('/schema_registry_stats')
+            self.assertEqual(200, response.status_code)
+            self.assertIn(b'evictions', response.data)
+
     def test_get_hed_schema_url_tests(self):
         from hed.schema.hed_schema import HedSchema
         from hedweb.constants import common
@@ -160,9 +160,43 @@ class Test(unittest.TestCase):
         mock_form.values = {}
 
 
+    def test_get_issue_budget(self):
+        from hed.util.exceptions import HedFileError
+        from hedweb.constants import common
+        from hedweb import web_utils
+        from hedweb.web_utils import get_issue_budget
+        self.assertIsNone(get_issue_budget({}), "get_issue_budget should return None when there are no limits")
+        issue_budget = get_issue_budget({common.MAX_ISSUES: '5', common.MAX_ERROR_ROWS: 2})
+        self.assertEqual(issue_budget.max_issues, 5)
+        self.assertEqual(issue_budget.max_error_rows, 2)
+        self.assertIsNone(issue_budget.max_issues_per_code)
+        with mock.patch.dict(web_utils.app_config, {'VALIDATION_MAX_ISSUES_PER_CODE': 3}):
+            self.assertEqual(get_issue_budget({}).max_issues_per_code, 3,
+                             "get_issue_budget should use the app setting when a limit is left out")
+        with self.assertRaises(HedFileError):
+            get_issue_budget({common.MAX_ISSUES: 'ten'})
+        with self.assertRaises(HedFileError):
+            get_issue_budget({common.MAX_ISSUES: 0})
+
     def test_get_optional_form_field(self):
         self.assertTrue(1, "Testing get_optional_form_field")
 
+    def test_get_stage_timer(self):
+        from hed.util.exceptions import HedFileError
+        from hedweb.constants import common
+        from hedweb import web_utils
+        from hedweb.web_utils import get_stage_timer
+        self.assertIsNone(get_stage_timer({}), "get_stage_timer should return None when stage timing is off")
+        self.assertIsNotNone(get_stage_timer({common.STAGE_TIMING: True}))
+        self.assertIsNotNone(get_stage_timer({common.STAGE_TIMING: 'True'}))
+        self.assertIsNone(get_stage_timer({common.STAGE_TIMING: 'false'}), "The string false should turn timing off")
+        self.assertIsNone(get_stage_timer({common.STAGE_TIMING: False}))
+        with mock.patch.dict(web_utils.app_config, {'VALIDATION_STAGE_TIMING': True}):
+            self.assertIsNotNone(get_stage_timer({}), "get_stage_timer should use the app setting when left out")
+            self.assertIsNone(get_stage_timer({common.STAGE_TIMING: 'off'}))
+        with self.assertRaises(HedFileError):
+            get_stage_timer({common.STAGE_TIMING: 'maybe'})
+
     def test_get_uploaded_file_path_from_form(self):
         from hedweb.web_utils import get_uploaded_file_path_from_form
         # with self.app.test as client:
@@ -183,6 +217,31 @@ class Test(unittest.TestCase):
             # the_path = save_text_to_upload_folder(text, filename)
             # self.assertEqual(1, os.path.isfile(the_path), f"{the_path} should exist after saving")
 
+    def test_get_validation_issues_text(self):
+        from hed.schema.hed_schema_file import load_schema
+        from hed.util.column_def_group import ColumnDefGroup
+        from hed.util.event_file_input import EventFileInput
+        from hed.validator.hed_validator import HedValidator
+        from hedweb.web_utils import get_validation_issues_text
+        data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../data')
+        events_path = os.path.join(data_path, 'bids_events.tsv')
+        json_dictionary = ColumnDefGroup(os.path.join(data_path, 'good_events.json'))
+        validator = HedValidator(hed_schema=load_schema(os.path.join(data_path, 'HED7.1.2.xml')))
+        issue_text = get_validation_issues_text(validator, EventFileInput(events_path, json_def_files=json_dictionary),
+                                                "Title")
+        self.assertTrue(issue_text.startswith("Title"), "get_validation_issues_text should start with the title")
+        issue_chunks = get_validation_issues_text(validator,
+                                                  EventFileInput(events_path, json_def_files=json_dictionary),
+                                                  "Title", stream_issues=True)
+        self.assertEqual(issue_text, "".join(issue_chunks),
+                         "get_validation_issues_text should stream the same text when stream_issues is True")
+
+        validator = HedValidator(hed_schema=load_schema(os.path.join(data_path, 'HED8.0.0-alpha.1.xml')))
+        self.assertEqual('', get_validation_issues_text(validator, EventFileInput(events_path,
+                                                                                  json_def_files=json_dictionary),
+                                                        "Title", stream_issues=True),
+                         "get_validation_issues_text should return an empty string when there are no issues")
+
     # def test_handle_http_error(self):
     #     error_code = "CODE"
     #     error_message = "Test"